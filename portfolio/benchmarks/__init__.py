@@ -0,0 +1 @@
+# Benchmark scripts for the portfolio backend; run with ``python -m benchmarks.<name>``.
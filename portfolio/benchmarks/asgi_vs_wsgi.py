@@ -0,0 +1,150 @@
+"""Requests per second and tail latency of the project API under WSGI and ASGI.
+
+Seeds a throwaway SQLite database, then for each row starts a server with
+the same number of worker processes and drives it with ``loadgen``:
+
+* ``wsgi/sync``: gunicorn serving ``/api/projects/`` (the DRF viewset)
+* ``asgi/sync``: uvicorn serving the same viewset, run in a thread per request
+* ``asgi/async``: uvicorn serving ``/api/async/projects/``
+
+The response cache is off unless ``--cache`` is given, so every request
+reaches the database. Rows whose server is not installed are skipped.
+
+    python -m benchmarks.asgi_vs_wsgi --workers 2 --concurrency 32 --seconds 10
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import io
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .common import print_table, setup_django
+from .loadgen import run_load, wait_until_ready
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def servers(workers, port):
+    bind = f"127.0.0.1:{port}"
+    return {
+        "wsgi": (
+            "gunicorn",
+            ["-m", "gunicorn", "portfolio.wsgi:application", "--workers", str(workers),
+             "--bind", bind, "--log-level", "warning"],
+        ),
+        "asgi": (
+            "uvicorn",
+            ["-m", "uvicorn", "portfolio.asgi:application", "--workers", str(workers),
+             "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+             "--no-access-log"],
+        ),
+    }
+
+
+def scenarios(prefix, projects):
+    """Weighted read mix: mostly first pages, some filters and details."""
+    paths = {
+        f"{prefix}/": 4,
+        f"{prefix}/?page=2": 2,
+        f"{prefix}/?status=completed": 2,
+        f"{prefix}/?technologies=tech-0": 1,
+    }
+    for i in random.Random(0).sample(range(projects), min(projects, 5)):
+        paths[f"{prefix}/project-{i}/"] = 1
+    return paths
+
+
+def prepare_database(path, projects):
+    os.environ["SQLITE_PATH"] = path
+    setup_django()
+    from django.core.management import call_command
+
+    from project.projections import rebuild_cards
+
+    from .technology_filter import seed
+
+    call_command("migrate", verbosity=0)
+    seed(projects, technologies=30, per_project=3, rng=random.Random(0))
+    rebuild_cards()
+    call_command("rebuild_search_index", stdout=io.StringIO())
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def bench(server, prefix, args, env):
+    port = free_port()
+    module, argv = servers(args.workers, port)[server]
+    process = subprocess.Popen([sys.executable, *argv], cwd=PROJECT_DIR, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_until_ready(base_url, f"{prefix}/"))
+        stats = asyncio.run(
+            run_load(
+                base_url,
+                scenarios(prefix, args.projects),
+                concurrency=args.concurrency,
+                seconds=args.seconds,
+                seed=0,
+            )
+        )
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    return {"server": module, "workers": args.workers, **stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache on.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    rows = [("wsgi", "/api/projects"), ("asgi", "/api/projects"), ("asgi", "/api/async/projects")]
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.sqlite3")
+        prepare_database(path, args.projects)
+        env = {
+            **os.environ,
+            "SQLITE_PATH": path,
+            "DEBUG": "False",
+            "ALLOWED_HOSTS": "127.0.0.1",
+            "DB_REPLICAS": "",
+        }
+        if not args.cache:
+            env["PROJECT_API_CACHE_TIMEOUT"] = "0"
+        for server, prefix in rows:
+            module = servers(args.workers, 0)[server][0]
+            mode = "async" if "/async/" in prefix else "sync"
+            if importlib.util.find_spec(module) is None:
+                print(f"skipping {server}/{mode}: {module} is not installed", file=sys.stderr)
+                continue
+            results.append({"row": f"{server}/{mode}", **bench(server, prefix, args, env)})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(
+            results,
+            ["row", "server", "workers", "requests", "errors", "rps", "p50_ms", "p99_ms", "statuses"],
+        )
+
+
+if __name__ == "__main__":
+    main()
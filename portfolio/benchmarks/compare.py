@@ -0,0 +1,83 @@
+"""Compare two ``benchmarks.suite`` result files and flag regressions.
+
+A case regresses when its median is more than ``--threshold`` percent
+slower in the candidate run *and* more than ``--min-ms`` slower in absolute
+terms. The second check keeps sub-millisecond cases, which are mostly
+noise, from failing the comparison. Exits 1 if any case regressed.
+
+    python -m benchmarks.compare before.json after.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+
+from .common import print_table
+
+
+def load(path):
+    with open(path) as fh:
+        data = json.load(fh)
+    return data["meta"], {(r["name"], r["scale"]): r for r in data["results"]}
+
+
+def compare(baseline, candidate, threshold, min_ms):
+    """Rows for cases in both runs, slowest change first, plus the regressed count."""
+    rows, regressions = [], 0
+    for key in baseline.keys() & candidate.keys():
+        before, after = baseline[key]["median_ms"], candidate[key]["median_ms"]
+        change = (after - before) / before * 100 if before else 0.0
+        if change > threshold and after - before > min_ms:
+            verdict, regressions = "REGRESSION", regressions + 1
+        elif change < -threshold and before - after > min_ms:
+            verdict = "faster"
+        else:
+            verdict = ""
+        rows.append({
+            "name": key[0],
+            "scale": key[1],
+            "before_ms": before,
+            "after_ms": after,
+            "change": f"{change:+.1f}%",
+            "verdict": verdict,
+            "_change": change,
+        })
+    rows.sort(key=lambda row: row["_change"], reverse=True)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent; default 10.")
+    parser.add_argument("--min-ms", type=float, default=0.5, help="Absolute noise floor; default 0.5.")
+    parser.add_argument("--all", action="store_true", help="List unchanged cases too.")
+    args = parser.parse_args(argv)
+
+    base_meta, baseline = load(args.baseline)
+    cand_meta, candidate = load(args.candidate)
+    if base_meta.get("args") != cand_meta.get("args"):
+        print("warning: the runs used different arguments:", file=sys.stderr)
+        print(f"  baseline  {base_meta.get('args')}", file=sys.stderr)
+        print(f"  candidate {cand_meta.get('args')}", file=sys.stderr)
+
+    rows, regressions = compare(baseline, candidate, args.threshold, args.min_ms)
+    shown = rows if args.all else [row for row in rows if row["verdict"]]
+    if shown:
+        print_table(shown, ["name", "scale", "before_ms", "after_ms", "change", "verdict"])
+    for label, keys in (
+        ("only in baseline", baseline.keys() - candidate.keys()),
+        ("only in candidate", candidate.keys() - baseline.keys()),
+    ):
+        for name, scale in sorted(keys):
+            print(f"{label}: {name} @ {scale}", file=sys.stderr)
+    print(
+        f"{len(rows)} cases compared ({base_meta.get('revision')} -> {cand_meta.get('revision')}), "
+        f"{regressions} regressed beyond {args.threshold:g}% / {args.min_ms:g} ms."
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Deterministic project-domain data for benchmarks.
+
+``generate(projects, technologies, images)`` fills an empty database with
+the same rows every time for the same arguments and seed:
+
+* technologies spread over every category;
+* projects with realistic text and JSON fields (features, challenges, a
+  staged architecture, enhancements) that pass the model validators;
+* ``images`` ``ProjectImage`` rows per project with a derivative manifest,
+  without files on disk;
+* a skewed technology mix: a few technologies appear on most projects;
+* ``ProjectCard`` rows and the search index, as in production.
+
+Rows are bulk-inserted, so signals and validators do not run; the
+benchmarks that time those call them directly.
+
+    python -m benchmarks.datagen --projects 1000 --sample 1
+"""
+
+import argparse
+import io
+import json
+import random
+from datetime import timedelta
+
+from .common import benchmark_database, setup_django
+
+WORDS = (
+    "realtime dashboard api cache search analytics payments queue worker upload "
+    "gallery auth oauth webhook export import report chart mobile responsive "
+    "offline sync notification inventory booking calendar chat stream pipeline"
+).split()
+CREATED_DAYS = 60
+FRAMEWORKS = {
+    "frontend": ["React", "Next.js", "Vue", "Svelte", "Tailwind CSS", "TypeScript"],
+    "backend": ["Django", "Django REST Framework", "FastAPI", "Node.js", "Celery", "Go"],
+    "database": ["PostgreSQL", "SQLite", "Redis", "MongoDB", "Elasticsearch"],
+    "tool": ["Docker", "GitHub Actions", "Terraform", "Sentry", "Nginx"],
+    "other": ["Stripe", "OpenAPI", "WebSockets", "S3"],
+}
+
+
+def sentence(rng, words=12):
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + "."
+
+
+def paragraph(rng, sentences=4):
+    return " ".join(sentence(rng, rng.randint(8, 16)) for _ in range(sentences))
+
+
+def technology_rows(count):
+    """``count`` (name, slug, category) triples cycling through every category."""
+    rows, categories = [], list(FRAMEWORKS)
+    for i in range(count):
+        category = categories[i % len(categories)]
+        names = FRAMEWORKS[category]
+        round_ = i // len(categories)
+        base = names[round_ % len(names)]
+        name = base if round_ < len(names) else f"{base} {i}"
+        rows.append((name, f"tech-{i}", category))
+    return rows
+
+
+def project_fields(rng, i):
+    """Model field values for project ``i``; valid for ``Project.validate_json_fields``."""
+    from project.constants import ProjectStatus
+
+    statuses = [value for value, _ in ProjectStatus.CHOICES]
+    return {
+        "title": f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} platform {i}",
+        "slug": f"project-{i}",
+        "description": paragraph(rng, rng.randint(3, 8)),
+        "problem_statement": paragraph(rng, 3),
+        "key_features": [sentence(rng, rng.randint(3, 7)) for _ in range(rng.randint(3, 8))],
+        "my_role": sentence(rng, 10),
+        "technical_challenges_solutions": [
+            {"challenge": sentence(rng, 8), "solution": paragraph(rng, 2)}
+            for _ in range(rng.randint(1, 4))
+        ],
+        "architectural_overview": {
+            "overview": paragraph(rng, 2),
+            "frontend": f"{rng.choice(FRAMEWORKS['frontend'])} with {rng.choice(WORDS)}",
+            "backend": f"{rng.choice(FRAMEWORKS['backend'])} API",
+            "database": f"{rng.choice(FRAMEWORKS['database'])} with JSON columns",
+            "deployment": f"{rng.choice(FRAMEWORKS['tool'])} on a VPS",
+            "stages": [
+                {"name": f"Stage {n}", "description": sentence(rng, 6)}
+                for n in range(1, rng.randint(2, 5))
+            ],
+        },
+        "future_enhancements": [sentence(rng, 5) for _ in range(rng.randint(0, 4))],
+        "live_demo_url": f"https://demo{i}.example.com" if i % 3 else "",
+        "source_code_url": f"https://github.com/example/project-{i}",
+        "status": statuses[i % len(statuses)],
+        "display_order": i % 50,
+    }
+
+
+def image_derivatives(name):
+    stem = name.rsplit(".", 1)[0]
+    return {
+        "source": name,
+        "sizes": {
+            size: {
+                "width": width,
+                "height": width * 9 // 16,
+                "webp": f"{stem}.{size}.0123456789ab.webp",
+                "jpeg": f"{stem}.{size}.0123456789ab.jpg",
+            }
+            for size, width in (("thumbnail", 320), ("card", 768), ("full", 1600))
+        },
+    }
+
+
+def generate(projects, technologies=30, images=2, per_project=4, seed=0):
+    """Create the dataset; returns the project count."""
+    from django.core.management import call_command
+    from django.utils import timezone
+
+    from project.models import Project, ProjectImage, Technology
+    from project.projections import rebuild_cards
+
+    rng = random.Random(seed)
+    techs = Technology.objects.bulk_create(
+        Technology(name=name, slug=slug, category=category)
+        for name, slug, category in technology_rows(technologies)
+    )
+    Project.objects.bulk_create(
+        (Project(**project_fields(rng, i)) for i in range(projects)), batch_size=500
+    )
+    pks = list(Project.objects.order_by("pk").values_list("pk", flat=True))
+    # bulk_create stamps every row with the same created_at; spread them over
+    # CREATED_DAYS days so the newest/oldest orderings have something to sort.
+    now = timezone.now()
+    for day in range(CREATED_DAYS):
+        Project.objects.filter(pk__in=pks[day::CREATED_DAYS]).update(
+            created_at=now - timedelta(days=day)
+        )
+
+    through = Project.technologies.through
+    weights = [1 / (rank + 1) for rank in range(len(techs))]
+    links = []
+    for pk in pks:
+        chosen = {t.pk for t in rng.choices(techs, weights=weights, k=per_project)}
+        links.extend(through(project_id=pk, technology_id=t) for t in sorted(chosen))
+    through.objects.bulk_create(links, batch_size=5000)
+
+    rows = []
+    for pk in pks:
+        for order in range(images):
+            name = f"projects/bench/{pk}-{order}.png"
+            rows.append(
+                ProjectImage(
+                    project_id=pk,
+                    image=name,
+                    caption=sentence(rng, 4),
+                    order=order,
+                    derivatives=image_derivatives(name),
+                )
+            )
+    ProjectImage.objects.bulk_create(rows, batch_size=2000)
+
+    rebuild_cards()
+    call_command("rebuild_search_index", stdout=io.StringIO())
+    return len(pks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--technologies", type=int, default=30)
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample", type=int, default=0, help="Print this many generated projects.")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        count = generate(args.projects, args.technologies, args.images, seed=args.seed)
+        from project.models import Project, ProjectImage
+
+        print(f"Generated {count} projects, {ProjectImage.objects.count()} images.")
+        for project in Project.objects.order_by("pk").values()[: args.sample]:
+            print(json.dumps(project, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
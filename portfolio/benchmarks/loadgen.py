@@ -0,0 +1,214 @@
+"""Minimal asyncio HTTP/1.1 load generator.
+
+Each of ``concurrency`` clients holds one keep-alive connection and sends
+requests back to back until the deadline, so the measured throughput is
+the server's, not a client thread pool's. Only what the benchmarks need is
+supported: plain HTTP, JSON request bodies, ``Content-Length`` or chunked
+response bodies.
+
+``run_load`` drives a weighted set of GET paths; ``run_scenarios`` drives
+named ``Scenario``s that may build a different request each time and
+reports latency per scenario as well as overall.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter, namedtuple
+from urllib.parse import urlsplit
+
+# ``build(rng)`` returns ``(method, path, json_body_or_None)``.
+Scenario = namedtuple("Scenario", "name weight build")
+
+
+class HTTPError(Exception):
+    pass
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not samples:
+        return None
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+class Connection:
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def get(self, path, headers=None):
+        """Send one GET and return ``(status, body)``; reconnects once if the server closed."""
+        return await self.request("GET", path, headers)
+
+    async def request(self, method, path, headers=None, json_body=None):
+        """Send one request and return ``(status, body)``; reconnects once if the server closed."""
+        headers = dict(headers or {})
+        payload = b""
+        if json_body is not None:
+            payload = json.dumps(json_body).encode()
+            headers["Content-Type"] = "application/json"
+        if payload or method not in ("GET", "HEAD"):
+            headers["Content-Length"] = str(len(payload))
+        for attempt in range(2):
+            if self.writer is None:
+                await self.open()
+            try:
+                return await self._send(method, path, headers, payload)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if attempt:
+                    raise
+
+    async def _send(self, method, path, headers, payload):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise HTTPError(f"Bad status line: {status_line!r}")
+        response_headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked()
+        else:
+            body = await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+        if response_headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, body
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readuntil(b"\r\n")
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+async def wait_until_ready(base_url, path="/", timeout=30.0):
+    """Poll ``path`` until the server answers; raises ``TimeoutError`` otherwise."""
+    url = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while True:
+        connection = Connection(url.hostname, url.port or 80)
+        try:
+            await connection.get(path)
+            return
+        except (OSError, asyncio.IncompleteReadError, HTTPError):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{base_url} did not come up within {timeout:.0f}s")
+            await asyncio.sleep(0.2)
+        finally:
+            connection.close()
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses = Counter()
+        self.errors = 0
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        ms = lambda value: None if value is None else round(value * 1000, 2)  # noqa: E731
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": ms(percentile(latencies, 0.50)),
+            "p95_ms": ms(percentile(latencies, 0.95)),
+            "p99_ms": ms(percentile(latencies, 0.99)),
+            "max_ms": ms(latencies[-1] if latencies else None),
+            "statuses": dict(self.statuses),
+        }
+
+
+async def _client(connection, pick, rng, deadline, stats):
+    while time.perf_counter() < deadline:
+        scenario = pick()
+        method, path, body = scenario.build(rng)
+        start = time.perf_counter()
+        try:
+            status, _ = await connection.request(method, path, json_body=body)
+        except (OSError, asyncio.IncompleteReadError, HTTPError):
+            if stats is not None:
+                stats[scenario.name].errors += 1
+            connection.close()
+            continue
+        if stats is not None:
+            stats[scenario.name].latencies.append(time.perf_counter() - start)
+            stats[scenario.name].statuses[status] += 1
+    connection.close()
+
+
+async def run_scenarios(base_url, scenarios, concurrency=16, seconds=10.0, warmup=1.0, seed=None):
+    """Drive weighted ``scenarios``; returns ``{"total": stats, "scenarios": {name: stats}}``.
+
+    Requests made during the first ``warmup`` seconds are discarded.
+    """
+    url = urlsplit(base_url)
+    weights = [scenario.weight for scenario in scenarios]
+    rng = random.Random(seed)
+
+    def pick():
+        return rng.choices(scenarios, weights)[0]
+
+    connections = [Connection(url.hostname, url.port or 80) for _ in range(concurrency)]
+    if warmup:
+        await asyncio.gather(
+            *(_client(c, pick, rng, time.perf_counter() + warmup, None) for c in connections)
+        )
+
+    stats = {scenario.name: Stats() for scenario in scenarios}
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(_client(c, pick, rng, deadline, stats) for c in connections))
+    elapsed = time.perf_counter() - start
+
+    total = Stats()
+    for entry in stats.values():
+        total.latencies += entry.latencies
+        total.statuses.update(entry.statuses)
+        total.errors += entry.errors
+    return {
+        "total": total.summary(elapsed),
+        "scenarios": {name: entry.summary(elapsed) for name, entry in stats.items()},
+    }
+
+
+async def run_load(base_url, paths, concurrency=16, seconds=10.0, warmup=1.0, seed=None):
+    """Drive ``paths`` (a list, or a ``{path: weight}`` dict) and return throughput and latency stats.
+
+    Requests made during the first ``warmup`` seconds are discarded.
+    """
+    if not isinstance(paths, dict):
+        paths = dict.fromkeys(paths, 1)
+    scenarios = [
+        Scenario(path, weight, lambda rng, path=path: ("GET", path, None))
+        for path, weight in paths.items()
+    ]
+    result = await run_scenarios(base_url, scenarios, concurrency, seconds, warmup, seed)
+    return result["total"]
@@ -0,0 +1,248 @@
+"""End-to-end load test of the API with latency budgets.
+
+Replays the frontend's traffic mix against a locally started server
+(``portfolio.wsgi`` under gunicorn, ``portfolio.asgi`` under uvicorn) seeded
+with ``datagen`` data, or against ``--target`` if given:
+
+* ``list``: the first projects page
+* ``list-filtered``: status, technology, search and ordering combinations
+* ``list-page``: later pages
+* ``detail``: a project by slug
+* ``contact``: an occasional contact form POST
+
+Prints throughput and p50/p95/p99 per scenario and exits 1 if a scenario
+exceeds its budget (``BUDGETS``, overridden with ``--budget``) or more than
+``--max-error-rate`` of its requests failed. Contact throttles are lifted
+on servers this script starts so the POSTs measure the endpoint, not a 429.
+
+    python -m benchmarks.loadtest --servers wsgi,asgi-async --concurrency 16
+    python -m benchmarks.loadtest --budget detail.p95=100 --budget total.p99=400
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from .asgi_vs_wsgi import PROJECT_DIR, free_port, servers
+from .common import print_table, setup_django
+from .loadgen import Scenario, run_scenarios, wait_until_ready
+
+# Server rows: (entry point, URL prefix).
+ROWS = {
+    "wsgi": ("wsgi", "/api"),
+    "asgi": ("asgi", "/api"),
+    "asgi-async": ("asgi", "/api/async"),
+}
+# Milliseconds, per scenario; "total" covers every request.
+BUDGETS = {
+    "list": {"p95": 250, "p99": 500},
+    "list-filtered": {"p95": 400, "p99": 800},
+    "list-page": {"p95": 300, "p99": 600},
+    "detail": {"p95": 200, "p99": 400},
+    "contact": {"p95": 400, "p99": 800},
+    "total": {"p99": 800},
+}
+PAGE_SIZE = 12
+STATUSES = ["completed", "in_progress", "planned"]
+ORDERINGS = ["display", "newest", "oldest"]
+
+
+def scenarios(prefix, projects, technologies):
+    """The weighted request mix the frontend produces."""
+    from .datagen import WORDS
+
+    pages = max(2, -(-projects // PAGE_SIZE))
+    popular = [f"tech-{i}" for i in range(min(technologies, 6))]
+    submissions = itertools.count()
+
+    def list_filtered(rng):
+        params = [f"status={s}" for s in rng.sample(STATUSES, rng.randint(0, 2))]
+        if rng.random() < 0.6:
+            params.append("technologies=" + ",".join(rng.sample(popular, rng.randint(1, 2))))
+            if rng.random() < 0.3:
+                params.append("technologies_mode=all")
+        if rng.random() < 0.4:
+            params.append(f"q={rng.choice(WORDS)}")
+        params.append(f"ordering={rng.choice(ORDERINGS)}")
+        return "GET", f"{prefix}/projects/?{'&'.join(params)}", None
+
+    def contact(rng):
+        n = next(submissions)
+        body = {
+            "name": f"Load test {n}",
+            "email": f"load{n}@example.com",
+            "subject": "Project enquiry",
+            "message": f"Message {n}: {' '.join(rng.choices(WORDS, k=20))}",
+        }
+        return "POST", f"{prefix}/contacts/", body
+
+    return [
+        Scenario("list", 35, lambda rng: ("GET", f"{prefix}/projects/", None)),
+        Scenario("list-filtered", 25, list_filtered),
+        Scenario(
+            "list-page", 10,
+            lambda rng: ("GET", f"{prefix}/projects/?page={rng.randint(2, pages)}", None),
+        ),
+        Scenario(
+            "detail", 28,
+            lambda rng: ("GET", f"{prefix}/projects/project-{rng.randrange(projects)}/", None),
+        ),
+        Scenario("contact", 2, contact),
+    ]
+
+
+def parse_budget(value):
+    """``name.pNN=ms`` -> ``(name, "pNN", ms)``."""
+    try:
+        target, ms = value.split("=")
+        name, metric = target.split(".")
+        if metric not in ("p50", "p95", "p99"):
+            raise ValueError
+        return name, metric, float(ms)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME.p50|p95|p99=MS, got {value!r}")
+
+
+def violations(row, stats, budgets, max_error_rate):
+    """Human-readable budget breaches for one server row."""
+    found = []
+    for name, entry in [*stats["scenarios"].items(), ("total", stats["total"])]:
+        for metric, limit in budgets.get(name, {}).items():
+            value = entry[f"{metric}_ms"]
+            if value is not None and value > limit:
+                found.append(f"{row} {name}: {metric} {value} ms > {limit:g} ms")
+        failed = entry["errors"] + sum(
+            count for status, count in entry["statuses"].items() if status >= 400
+        )
+        attempts = entry["requests"] + entry["errors"]
+        if attempts and failed / attempts > max_error_rate:
+            found.append(f"{row} {name}: {failed}/{attempts} requests failed")
+    return found
+
+
+def prepare_database(path, args):
+    os.environ["SQLITE_PATH"] = path
+    setup_django()
+    from django.core.management import call_command
+
+    from .datagen import generate
+
+    call_command("migrate", verbosity=0)
+    generate(args.projects, technologies=args.technologies, seed=args.seed)
+
+
+def load(base_url, prefix, args):
+    asyncio.run(wait_until_ready(base_url, f"{prefix}/projects/"))
+    return asyncio.run(
+        run_scenarios(
+            base_url,
+            scenarios(prefix, args.projects, args.technologies),
+            concurrency=args.concurrency,
+            seconds=args.seconds,
+            warmup=args.warmup,
+            seed=args.seed,
+        )
+    )
+
+
+def serve(server, prefix, args, env):
+    port = free_port()
+    module, argv = servers(args.workers, port)[server]
+    process = subprocess.Popen([sys.executable, *argv], cwd=PROJECT_DIR, env=env)
+    try:
+        return load(f"http://127.0.0.1:{port}", prefix, args)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def run_local(args):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "loadtest.sqlite3")
+        prepare_database(path, args)
+        env = {
+            **os.environ,
+            "SQLITE_PATH": path,
+            "DEBUG": "False",
+            "ALLOWED_HOSTS": "127.0.0.1",
+            "DB_REPLICAS": "",
+            "CONTACT_THROTTLE_IP_RATE": "1000000/minute",
+            "CONTACT_THROTTLE_GLOBAL_RATE": "1000000/minute",
+        }
+        if args.no_cache:
+            env["PROJECT_API_CACHE_TIMEOUT"] = "0"
+        for row in args.servers:
+            server, prefix = ROWS[row]
+            module = servers(args.workers, 0)[server][0]
+            if importlib.util.find_spec(module) is None:
+                print(f"skipping {row}: {module} is not installed", file=sys.stderr)
+                continue
+            results[row] = serve(server, prefix, args, env)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--servers",
+        type=lambda value: value.split(","),
+        default=["wsgi", "asgi"],
+        help=f"Comma-separated rows: {', '.join(ROWS)}.",
+    )
+    parser.add_argument("--target", help="Load an already running server at this URL instead.")
+    parser.add_argument("--prefix", default="/api", help="API prefix for --target.")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--projects", type=int, default=300)
+    parser.add_argument("--technologies", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-cache", action="store_true", help="Turn the response cache off.")
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[])
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.servers) - set(ROWS)
+    if unknown:
+        parser.error(f"unknown server row(s): {', '.join(sorted(unknown))}")
+    budgets = {name: dict(limits) for name, limits in BUDGETS.items()}
+    for name, metric, ms in args.budget:
+        budgets.setdefault(name, {})[metric] = ms
+
+    if args.target:
+        results = {args.target: load(args.target.rstrip("/"), args.prefix, args)}
+    else:
+        results = run_local(args)
+
+    breaches = []
+    for row, stats in results.items():
+        breaches += violations(row, stats, budgets, args.max_error_rate)
+
+    if args.json:
+        print(json.dumps({"results": results, "budgets": budgets, "violations": breaches}, indent=2))
+    else:
+        table = [
+            {"row": row, "scenario": name, **entry}
+            for row, stats in results.items()
+            for name, entry in [*stats["scenarios"].items(), ("total", stats["total"])]
+        ]
+        print_table(
+            table,
+            ["row", "scenario", "requests", "errors", "rps", "p50_ms", "p95_ms", "p99_ms", "max_ms", "statuses"],
+        )
+        for breach in breaches:
+            print(f"BUDGET EXCEEDED: {breach}", file=sys.stderr)
+    return 1 if breaches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Serialize and render N projects through each Project API path.
+
+``drf`` is the serializer classes plus DRF's ``JSONRenderer``; ``rows`` is
+``project/rows.py`` rendered with each available ``renderers`` backend.
+Times include the queries, as in a response.
+
+    python -m benchmarks.serialization --projects 1000
+"""
+
+import argparse
+import json
+import random
+
+from .common import benchmark_database, measure, print_table, setup_django
+
+
+def paths(request):
+    from django.test import override_settings
+    from rest_framework.renderers import JSONRenderer
+
+    from project import renderers, rows
+    from project.models import Project
+    from project.serializers import ProjectDetailSerializer, ProjectListSerializer
+    from project.services import ProjectFilterService
+
+    context = {"request": request}
+
+    def drf_list():
+        queryset = ProjectFilterService.get_queryset()
+        return JSONRenderer().render(ProjectListSerializer(queryset, many=True, context=context).data)
+
+    def drf_detail():
+        queryset = Project.objects.for_detail()
+        return JSONRenderer().render(ProjectDetailSerializer(queryset, many=True, context=context).data)
+
+    def rows_list(backend):
+        def run():
+            with override_settings(PROJECT_API_JSON_BACKEND=backend):
+                queryset = rows.list_values(ProjectFilterService.get_queryset())
+                return renderers.dumps(rows.list_data(list(queryset), request))
+        return run
+
+    def rows_detail(backend):
+        def run():
+            with override_settings(PROJECT_API_JSON_BACKEND=backend):
+                return renderers.dumps(rows.detail_data(Project.objects.all(), request))
+        return run
+
+    backends = ["json"] + (["orjson"] if renderers.orjson is not None else [])
+    cases = {("list", "drf"): drf_list, ("detail", "drf"): drf_detail}
+    for backend in backends:
+        cases["list", f"rows+{backend}"] = rows_list(backend)
+        cases["detail", f"rows+{backend}"] = rows_detail(backend)
+    return cases
+
+
+def run(args):
+    from rest_framework.test import APIRequestFactory
+
+    from project.projections import rebuild_cards
+
+    from .technology_filter import seed
+
+    seed(args.projects, technologies=50, per_project=4, rng=random.Random(args.seed))
+    rebuild_cards()
+    request = APIRequestFactory().get("/api/projects/")
+    cases = paths(request)
+    sizes = {key: len(fn()) for key, fn in cases.items()}
+    results = []
+    for (endpoint, path), fn in sorted(cases.items()):
+        timing = measure(fn, repeat=args.repeat)
+        results.append({"endpoint": endpoint, "path": path, "bytes": sizes[endpoint, path], **timing})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results, ["endpoint", "path", "bytes", "min_ms", "median_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Concurrent reads plus contact-form writes under each ``SQLITE_PROFILES`` entry.
+
+Each run uses a fresh database file. Reader threads repeat a project-list
+style query while one writer inserts contact rows, one transaction each.
+``reconnect`` opens a new connection per operation, as with
+``CONN_MAX_AGE=0``; otherwise each thread keeps its connection.
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --seconds 5
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from .common import print_table, setup_django
+
+# Python's sqlite3 default, which Django also used before the profile existed.
+CONNECT_TIMEOUT = 5.0
+
+
+def create_database(path, rows):
+    db = sqlite3.connect(path)
+    db.executescript(
+        """
+        CREATE TABLE project (id INTEGER PRIMARY KEY, title TEXT, status TEXT, display_order INT);
+        CREATE INDEX project_order ON project (display_order, id);
+        CREATE TABLE contact (id INTEGER PRIMARY KEY, email TEXT, message TEXT, created_at REAL);
+        """
+    )
+    db.executemany(
+        "INSERT INTO project (title, status, display_order) VALUES (?, ?, ?)",
+        [(f"Project {i}", "completed", i % 50) for i in range(rows)],
+    )
+    db.commit()
+    db.close()
+
+
+def connect(path, statements):
+    db = sqlite3.connect(path, timeout=CONNECT_TIMEOUT, isolation_level=None)
+    for statement in statements:
+        db.execute(statement)
+    return db
+
+
+def worker(path, statements, reconnect, deadline, operation, stats):
+    db = None if reconnect else connect(path, statements)
+    while time.perf_counter() < deadline:
+        conn = connect(path, statements) if reconnect else db
+        start = time.perf_counter()
+        try:
+            operation(conn)
+        except sqlite3.OperationalError:
+            stats["errors"] += 1
+        else:
+            stats["ops"] += 1
+            stats["latencies"].append(time.perf_counter() - start)
+        finally:
+            if reconnect:
+                conn.close()
+    if db is not None:
+        db.close()
+
+
+def read(conn):
+    conn.execute(
+        "SELECT id, title, status FROM project ORDER BY display_order, id LIMIT 12 OFFSET 120"
+    ).fetchall()
+    conn.execute("SELECT COUNT(*) FROM project WHERE status = 'completed'").fetchone()
+
+
+def write(conn):
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute(
+        "INSERT INTO contact (email, message, created_at) VALUES (?, ?, ?)",
+        ("bench@example.com", "Hello " * 50, time.time()),
+    )
+    conn.execute("COMMIT")
+
+
+def run(profile, pragmas, readers, seconds, rows, reconnect):
+    from core.db import pragma_statements
+
+    statements = pragma_statements(pragmas)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.sqlite3")
+        create_database(path, rows)
+        deadline = time.perf_counter() + seconds
+        read_stats = [{"ops": 0, "errors": 0, "latencies": []} for _ in range(readers)]
+        write_stats = {"ops": 0, "errors": 0, "latencies": []}
+        threads = [
+            threading.Thread(target=worker, args=(path, statements, reconnect, deadline, read, s))
+            for s in read_stats
+        ]
+        threads.append(
+            threading.Thread(
+                target=worker, args=(path, statements, reconnect, deadline, write, write_stats)
+            )
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    read_latencies = sorted(l for s in read_stats for l in s["latencies"])
+    write_latencies = sorted(write_stats["latencies"])
+
+    def p95(values):
+        return round(values[int(len(values) * 0.95) - 1] * 1000, 3) if values else None
+
+    return {
+        "profile": profile,
+        "connections": "per-op" if reconnect else "persistent",
+        "reads_per_s": round(sum(s["ops"] for s in read_stats) / seconds),
+        "writes_per_s": round(write_stats["ops"] / seconds),
+        "errors": sum(s["errors"] for s in read_stats) + write_stats["errors"],
+        "read_p95_ms": p95(read_latencies),
+        "write_p95_ms": p95(write_latencies),
+        "write_median_ms": (
+            round(statistics.median(write_latencies) * 1000, 3) if write_latencies else None
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    results = [
+        run(profile, pragmas, args.readers, args.seconds, args.rows, reconnect)
+        for profile, pragmas in settings.SQLITE_PROFILES.items()
+        for reconnect in (True, False)
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(
+            results,
+            [
+                "profile",
+                "connections",
+                "reads_per_s",
+                "writes_per_s",
+                "errors",
+                "read_p95_ms",
+                "write_p95_ms",
+                "write_median_ms",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
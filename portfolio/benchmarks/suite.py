@@ -0,0 +1,275 @@
+"""Project-domain benchmark suite.
+
+Times, at each scale (project count) on data from ``datagen``:
+
+* ``filter``: ``ProjectFilterService.get_queryset`` for every combination
+  of status, technologies (mode), search and ordering. Each case counts
+  the rows and fetches the first page.
+* ``serialize``: ``ProjectListSerializer``/``ProjectDetailSerializer``
+  and the ``rows.py`` path, for a page and for every project.
+* ``save``: ``Project.save`` for an update and a create, each in a
+  rolled-back transaction so every repeat sees the same database.
+* ``validate``: ``validate_json_fields`` and ``full_clean`` for one
+  project, and the JSON validators and ``PROJECT_JSON_SCHEMA.validate_many``
+  over every project.
+
+Results go to stdout and, with ``--output``, to a JSON file that
+``python -m benchmarks.compare`` can diff against another run.
+
+    python -m benchmarks.suite --scales 100,1000 --output before.json
+"""
+
+import argparse
+import copy
+import datetime
+import itertools
+import json
+import platform
+import subprocess
+import sys
+
+from .common import benchmark_database, measure, print_table, setup_django
+
+PAGE = 12
+STATUS_CASES = {"any": [], "completed": ["completed"], "two": ["completed", "in_progress"]}
+TECHNOLOGY_CASES = {
+    "none": ([], "any"),
+    "popular": (["tech-0"], "any"),
+    "three-any": (["tech-0", "tech-1", "tech-2"], "any"),
+    "three-all": (["tech-0", "tech-1", "tech-2"], "all"),
+}
+SEARCH_CASES = {"none": "", "two-words": "realtime dashboard"}
+ORDERINGS = ["display", "newest", "oldest", "relevance"]
+
+
+class Rollback(Exception):
+    pass
+
+
+def rolled_back(fn):
+    """``fn``, and the on-commit work it schedules, run in a transaction that is always rolled back."""
+    from django.db import transaction
+    from django.test import TestCase
+
+    def run():
+        try:
+            with transaction.atomic():
+                with TestCase.captureOnCommitCallbacks(execute=True):
+                    fn()
+                raise Rollback
+        except Rollback:
+            pass
+
+    return run
+
+
+def filter_cases():
+    from project.services import ProjectFilterService
+
+    for (status, statuses), (tech, (slugs, mode)), (search, q), ordering in itertools.product(
+        STATUS_CASES.items(), TECHNOLOGY_CASES.items(), SEARCH_CASES.items(), ORDERINGS
+    ):
+        if ordering == "relevance" and not q:
+            continue  # normalizes to display
+
+        def run(statuses=statuses, slugs=slugs, mode=mode, q=q, ordering=ordering):
+            qs = ProjectFilterService.get_queryset(
+                status=statuses,
+                technology_slugs=slugs,
+                technologies_mode=mode,
+                q=q,
+                ordering=ordering,
+            )
+            qs.count()
+            list(qs[:PAGE])
+
+        yield f"filter[status={status},tech={tech},q={search},order={ordering}]", run
+
+
+def serialize_cases(request):
+    from project import rows
+    from project.models import Project
+    from project.serializers import ProjectDetailSerializer, ProjectListSerializer
+    from project.services import ProjectFilterService
+
+    context = {"request": request}
+
+    def list_page():
+        ProjectListSerializer(
+            ProjectFilterService.get_queryset()[:PAGE], many=True, context=context
+        ).data
+
+    def list_all():
+        ProjectListSerializer(ProjectFilterService.get_queryset(), many=True, context=context).data
+
+    def detail_one():
+        ProjectDetailSerializer(Project.objects.for_detail().get(slug="project-0"), context=context).data
+
+    def detail_page():
+        ProjectDetailSerializer(
+            Project.objects.for_detail().order_by("pk")[:PAGE], many=True, context=context
+        ).data
+
+    def rows_list_all():
+        rows.list_data(list(rows.list_values(ProjectFilterService.get_queryset())), request)
+
+    def rows_detail_page():
+        rows.detail_data(Project.objects.order_by("pk")[:PAGE], request)
+
+    yield "serialize.list.page", list_page
+    yield "serialize.list.all", list_all
+    yield "serialize.detail.one", detail_one
+    yield "serialize.detail.page", detail_page
+    yield "serialize.rows.list.all", rows_list_all
+    yield "serialize.rows.detail.page", rows_detail_page
+
+
+def save_cases():
+    import random
+
+    from project.models import Project
+
+    from .datagen import project_fields
+
+    existing = Project.objects.get(slug="project-0")
+    fields = project_fields(random.Random(0), 0)
+    fields["slug"] = ""
+
+    def update():
+        existing.title = "Updated title"
+        existing.save()
+
+    def create():
+        Project(**copy.deepcopy(fields)).save()
+
+    yield "save.update", rolled_back(update)
+    yield "save.create", rolled_back(create)
+
+
+def validate_cases():
+    from project.models import Project
+    from project.schema import PROJECT_JSON_SCHEMA
+    from project.validators import (
+        validate_architecture_structure,
+        validate_challenges_solutions,
+        validate_string_list,
+    )
+
+    project = Project.objects.get(slug="project-0")
+    documents = list(
+        Project.objects.values_list(
+            "key_features",
+            "future_enhancements",
+            "technical_challenges_solutions",
+            "architectural_overview",
+        )
+    )
+
+    def all_projects():
+        for features, enhancements, challenges, architecture in documents:
+            validate_string_list(features, "key_features")
+            validate_string_list(enhancements, "future_enhancements")
+            validate_challenges_solutions(challenges)
+            validate_architecture_structure(architecture)
+
+    yield "validate.json_fields.one", project.validate_json_fields
+    yield "validate.full_clean.one", lambda: project.full_clean(exclude=["slug"])
+    payloads = [dict(zip(PROJECT_JSON_SCHEMA.fields, (c, f, e, a))) for f, e, c, a in documents]
+
+    yield "validate.json.all", all_projects
+    yield "validate.schema.all", lambda: PROJECT_JSON_SCHEMA.validate_many(payloads)
+
+
+def run_scale(scale, args):
+    from django.test.utils import override_settings
+    from rest_framework.test import APIRequestFactory
+
+    from .datagen import generate
+
+    generate(scale, technologies=args.technologies, images=args.images, seed=args.seed)
+    request = APIRequestFactory().get("/api/projects/")
+    groups = {
+        "filter": filter_cases,
+        "serialize": lambda: serialize_cases(request),
+        "save": save_cases,
+        "validate": validate_cases,
+    }
+    results = []
+    # Serializers build absolute media URLs from the factory's "testserver" host.
+    with override_settings(ALLOWED_HOSTS=["testserver"]):
+        for group, cases in groups.items():
+            if args.only and group not in args.only:
+                continue
+            for name, fn in cases():
+                timing = measure(fn, repeat=args.repeat)
+                results.append({"name": name, "scale": scale, **timing})
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(args):
+    import django
+    from django.db import connection
+
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "platform": platform.platform(),
+        "args": {
+            "scales": args.scales,
+            "repeat": args.repeat,
+            "technologies": args.technologies,
+            "images": args.images,
+            "seed": args.seed,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[100, 1000],
+        help="Comma-separated project counts.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--technologies", type=int, default=30)
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--only",
+        type=lambda value: value.split(","),
+        help="Comma-separated groups: filter, serialize, save, validate.",
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    args = parser.parse_args(argv)
+
+    setup_django()
+    results = []
+    for scale in args.scales:
+        print(f"scale {scale}...", file=sys.stderr)
+        with benchmark_database():
+            results.extend(run_scale(scale, args))
+            meta = metadata(args)
+
+    print_table(results, ["name", "scale", "min_ms", "median_ms", "max_ms"])
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({"meta": meta, "results": results}, fh, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare technology filter strategies.
+
+``legacy`` is the former ``filter(technologies__slug__in=...).distinct()``;
+``any``/``all`` are ``ProjectQuerySet.by_technologies`` modes.
+
+    python -m benchmarks.technology_filter --projects 10000 --technologies 200
+"""
+
+import argparse
+import json
+import random
+
+from .common import benchmark_database, measure, print_table, setup_django
+
+
+def seed(projects, technologies, per_project, rng):
+    from django.utils import timezone
+
+    from project.constants import ProjectStatus
+    from project.models import Project, Technology
+
+    statuses = sorted(ProjectStatus.VALUES)
+    techs = Technology.objects.bulk_create(
+        Technology(name=f"Tech {i}", slug=f"tech-{i}") for i in range(technologies)
+    )
+    now = timezone.now()
+    Project.objects.bulk_create(
+        (
+            Project(
+                title=f"Project {i}",
+                slug=f"project-{i}",
+                description="Lorem ipsum dolor sit amet " * 20,
+                key_features=[f"Feature {n}" for n in range(5)],
+                architectural_overview={"frontend": "Next.js", "backend": "Django"},
+                status=statuses[i % len(statuses)],
+                display_order=i % 50,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(projects)
+        ),
+        batch_size=1000,
+    )
+    through = Project.technologies.through
+    # Skewed popularity, like a real catalog: a few technologies on most projects.
+    weights = [1 / (rank + 1) for rank in range(len(techs))]
+    links = []
+    for project_id in Project.objects.values_list("pk", flat=True):
+        chosen = {t.pk for t in rng.choices(techs, weights=weights, k=per_project)}
+        links.extend(through(project_id=project_id, technology_id=t) for t in chosen)
+    through.objects.bulk_create(links, batch_size=5000)
+
+
+def strategies(slugs):
+    from project.constants import TechnologyMatch
+    from project.models import Project
+
+    base = Project.objects.all().ordered_by_display()
+    return {
+        "legacy": base.filter(technologies__slug__in=slugs).distinct(),
+        "any": base.by_technologies(slugs, mode=TechnologyMatch.ANY),
+        "all": base.by_technologies(slugs, mode=TechnologyMatch.ALL),
+    }
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    seed(args.projects, args.technologies, args.per_project, rng)
+    cases = {
+        "1 popular": ["tech-0"],
+        "3 popular": ["tech-0", "tech-1", "tech-2"],
+        "3 rare": [f"tech-{args.technologies - n}" for n in (1, 2, 3)],
+        "10 mixed": [f"tech-{n}" for n in range(0, args.technologies, max(args.technologies // 10, 1))][:10],
+    }
+    results = []
+    for case, slugs in cases.items():
+        for name, qs in strategies(slugs).items():
+            count = qs.count()
+            results.append({
+                "case": case,
+                "strategy": name,
+                "rows": count,
+                "count_ms": measure(qs.count, args.repeat)["median_ms"],
+                "page_ms": measure(lambda: list(qs[:12]), args.repeat)["median_ms"],
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--technologies", type=int, default=200)
+    parser.add_argument("--per-project", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Also write results to this file.")
+    args = parser.parse_args(argv)
+
+    setup_django()
+    with benchmark_database():
+        results = run(args)
+    print_table(results, ["case", "strategy", "rows", "count_ms", "page_ms"])
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,16 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from . import tasks  # noqa: F401
+        from .db import apply_sqlite_pragmas
+        from .instrumentation import install_query_recorder
+
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid='core.apply_sqlite_pragmas')
+        connection_created.connect(
+            install_query_recorder, dispatch_uid='core.install_query_recorder'
+        )
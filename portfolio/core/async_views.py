@@ -0,0 +1,61 @@
+"""Async (ASGI) contact submission, served at ``/api/async/contacts/``.
+
+Same throttles, spam shedding, validation and responses as
+``ContactViewSet.create``, using the async cache API and ``acreate``.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import Throttled
+
+from .models import Contact
+from .serializers import ContactSerializer
+from .tasks import queue_contact_notification
+from .throttling import ContactGlobalThrottle, ContactIPThrottle, aremember, arecord, ais_spam
+from .views import CONTACT_THANKS
+
+
+def json_response(data, status=200, **kwargs):
+    return JsonResponse(
+        data, status=status, json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')}, **kwargs
+    )
+
+
+def parse_body(request):
+    if request.content_type == 'application/json':
+        data = json.loads(request.body or b'{}')
+        if not isinstance(data, dict):
+            raise ValueError('Expected a JSON object.')
+        return data
+    return request.POST.dict()
+
+
+@csrf_exempt
+async def contact_create(request):
+    if request.method != 'POST':
+        return json_response({'detail': f'Method "{request.method}" not allowed.'}, status=405)
+    for throttle in (ContactIPThrottle(), ContactGlobalThrottle()):
+        if not await throttle.aallow_request(request):
+            exc = Throttled(throttle.wait())
+            return json_response({'detail': str(exc.detail)}, status=429, headers={'Retry-After': str(exc.wait)})
+    try:
+        data = parse_body(request)
+    except ValueError as exc:
+        return json_response({'detail': f'JSON parse error - {exc}'}, status=400)
+
+    rejected = await ais_spam(data)
+    if rejected:
+        await arecord(rejected)
+        return json_response({'message': CONTACT_THANKS}, status=201)
+    serializer = ContactSerializer(data=data)
+    if not serializer.is_valid():
+        return json_response(serializer.errors, status=400)
+    contact = await Contact.objects.acreate(**serializer.validated_data)
+    # enqueue runs the insert immediately in autocommit mode, which is sync ORM work.
+    await sync_to_async(queue_contact_notification)(contact)
+    await aremember(data)
+    await arecord('accepted')
+    return json_response({'message': CONTACT_THANKS}, status=201)
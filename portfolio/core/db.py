@@ -0,0 +1,29 @@
+"""Per-connection SQLite tuning driven by ``settings.SQLITE_PRAGMAS``."""
+
+import re
+
+from django.conf import settings
+
+_SAFE_VALUE = re.compile(r"^-?\w+$")
+
+
+def pragma_statements(pragmas):
+    """``{"journal_mode": "WAL"}`` -> ``["PRAGMA journal_mode = WAL"]``."""
+    statements = []
+    for name, value in pragmas.items():
+        if not (name.isidentifier() and _SAFE_VALUE.match(str(value))):
+            raise ValueError(f"Invalid SQLite pragma {name}={value!r}.")
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """``connection_created`` receiver; a no-op for other backends."""
+    if connection.vendor != "sqlite":
+        return
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", None)
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(pragmas):
+            cursor.execute(statement)
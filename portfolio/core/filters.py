@@ -0,0 +1,44 @@
+"""Query-string filters for the contact inbox."""
+
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def parse_bound(value, end=False):
+    """Parse an ISO date or datetime; a bare date covers that whole day."""
+    day = parse_date(value)
+    if day is not None:
+        moment = datetime.combine(day, time.max if end else time.min)
+    else:
+        moment = parse_datetime(value)
+        if moment is None:
+            raise ValueError(value)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def filter_contacts(queryset, params):
+    """Apply ``email``, ``created_after`` and ``created_before`` (both inclusive)."""
+    email = params.get('email', '').strip()
+    if email:
+        # Exact match so the (email, created_at) index is usable.
+        queryset = queryset.filter(email=email)
+    errors = {}
+    for param, lookup, end in (
+        ('created_after', 'created_at__gte', False),
+        ('created_before', 'created_at__lte', True),
+    ):
+        value = params.get(param, '').strip()
+        if not value:
+            continue
+        try:
+            queryset = queryset.filter(**{lookup: parse_bound(value, end=end)})
+        except ValueError:
+            errors[param] = ['Enter an ISO 8601 date or datetime.']
+    if errors:
+        raise ValidationError(errors)
+    return queryset
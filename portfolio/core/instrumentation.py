@@ -0,0 +1,217 @@
+"""Per-request SQL counts, timing phases and the slow-request log.
+
+``RequestMetricsMiddleware`` measures a sample of requests
+(``REQUEST_METRICS_SAMPLE_RATE``). For each one it records:
+
+* every query, through an ``execute_wrapper`` installed on each database
+  connection as it opens;
+* named phases such as ``serialize`` or ``render``, timed by views with
+  ``phase()``. Time spent in queries inside a phase counts as ``db``, not
+  as the phase.
+
+It reports these in a ``Server-Timing`` header (``REQUEST_METRICS_HEADER``).
+Requests slower than ``SLOW_REQUEST_MS``, or with a query slower than
+``SLOW_QUERY_MS``, go to the ``core.instrumentation`` logger as one JSON
+line. The line groups queries by a normalized fingerprint, so an N+1
+shows up as a single fingerprint with a high count.
+
+Unsampled requests and work outside requests only pay for one contextvar
+lookup per query.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_metrics = ContextVar('request_metrics', default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w"])-?\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?')
+_IN_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_REPEATED_LIST = re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+')
+_SPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql):
+    """``sql`` with literals and placeholders replaced by ``?`` and ``IN`` lists collapsed."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _IN_LIST.sub('(...)', sql)
+    sql = _REPEATED_LIST.sub('(...)', sql)
+    return _SPACE.sub(' ', sql).strip()
+
+
+def fingerprint_id(normalized):
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        # Raw SQL (params are separate, so equal statements group)
+        # -> [count, seconds, slowest, alias].
+        self.statements = {}
+        self.phases = {}
+
+    def record_query(self, sql, alias, duration):
+        self.queries += 1
+        self.db_time += duration
+        entry = self.statements.get(sql)
+        if entry is None:
+            self.statements[sql] = [1, duration, duration, alias]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+
+    def add_phase(self, name, duration):
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def server_timing(self, total):
+        entries = [f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"']
+        entries += [f'{name};dur={seconds * 1000:.1f}' for name, seconds in self.phases.items()]
+        entries.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(entries)
+
+    def query_groups(self):
+        """Statements grouped by fingerprint, most total time first."""
+        groups = {}
+        for sql, (count, seconds, slowest, alias) in self.statements.items():
+            normalized = fingerprint(sql)
+            group = groups.setdefault(normalized, {
+                'fingerprint': fingerprint_id(normalized),
+                'sql': normalized,
+                'alias': alias,
+                'count': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+            })
+            group['count'] += count
+            group['total_ms'] += seconds * 1000
+            group['max_ms'] = max(group['max_ms'], slowest * 1000)
+        ordered = sorted(groups.values(), key=lambda g: g['total_ms'], reverse=True)
+        for group in ordered:
+            group['total_ms'] = round(group['total_ms'], 2)
+            group['max_ms'] = round(group['max_ms'], 2)
+        return ordered
+
+
+def record_query(execute, sql, params, many, context):
+    """``execute_wrapper`` that feeds the current request's metrics, if it is sampled."""
+    metrics = _metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, context['connection'].alias, time.perf_counter() - start)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """``connection_created`` receiver; wrappers survive reconnects, so add it once."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def phase(name):
+    """Time a block as phase ``name`` of the current request, excluding its queries."""
+    metrics = _metrics.get()
+    if metrics is None:
+        yield
+        return
+    start, db_before = time.perf_counter(), metrics.db_time
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start - (metrics.db_time - db_before)
+        metrics.add_phase(name, max(duration, 0.0))
+
+
+class RequestMetricsMiddleware:
+    """Measures sampled requests; see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self.start()
+        if token is None:
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+            self.finish(request, response)
+        finally:
+            _metrics.reset(token)
+        return response
+
+    async def __acall__(self, request):
+        token = self.start()
+        if token is None:
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+            self.finish(request, response)
+        finally:
+            _metrics.reset(token)
+        return response
+
+    def start(self):
+        rate = settings.REQUEST_METRICS_SAMPLE_RATE
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return None
+        return _metrics.set(RequestMetrics())
+
+    def finish(self, request, response):
+        metrics = _metrics.get()
+        total = metrics.elapsed
+        if settings.REQUEST_METRICS_HEADER:
+            response['Server-Timing'] = metrics.server_timing(total)
+        slowest = max((entry[2] for entry in metrics.statements.values()), default=0.0)
+        if (
+            total * 1000 >= settings.SLOW_REQUEST_MS
+            or slowest * 1000 >= settings.SLOW_QUERY_MS
+        ):
+            self.log(request, response, metrics, total)
+
+    def log(self, request, response, metrics, total):
+        match = getattr(request, 'resolver_match', None)
+        record = {
+            'event': 'slow_request',
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 2),
+            'db_ms': round(metrics.db_time * 1000, 2),
+            'queries': metrics.queries,
+            'phases': {name: round(s * 1000, 2) for name, s in metrics.phases.items()},
+            'query_groups': metrics.query_groups(),
+        }
+        logger.warning(json.dumps(record, sort_keys=True))
@@ -0,0 +1,216 @@
+"""A small database-backed job queue.
+
+Tasks are plain functions registered with ``@task("name")`` and called with
+the job's JSON payload as keyword arguments::
+
+    @task("core.notify_contact")
+    def notify_contact(contact_id):
+        ...
+
+    enqueue("core.notify_contact", {"contact_id": contact.pk},
+            idempotency_key=f"contact:{contact.pk}:notify")
+
+An idempotency key is held only while its job is queued or running; once
+the job succeeds or fails for good, the same key queues a new job.
+
+``enqueue`` inserts the ``Job`` row from ``transaction.on_commit``, so a job
+never refers to data that was rolled back and the request that enqueued it
+returns as soon as its own transaction commits. ``Worker`` (driven by
+``manage.py run_worker``) claims due jobs with a compare-and-swap
+``UPDATE`` (``SELECT ... FOR UPDATE SKIP LOCKED`` where the backend has it),
+runs them on up to ``concurrency`` threads, and retries failures with
+exponential backoff until ``max_attempts`` is reached.
+"""
+
+import logging
+import os
+import random
+import socket
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+BACKOFF_BASE = 10  # seconds before the first retry; doubles on each attempt
+BACKOFF_MAX = 60 * 60
+# A job still RUNNING this long after it was claimed is assumed to have lost
+# its worker and becomes claimable again.
+LOCK_TIMEOUT = timedelta(minutes=15)
+ERROR_LENGTH = 4000
+
+_registry = {}
+
+
+def task(name, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """Register the decorated function as the handler for ``name``."""
+
+    def register(func):
+        if name in _registry and _registry[name][0] is not func:
+            raise ValueError(f"Task {name!r} is already registered.")
+        _registry[name] = (func, max_attempts)
+        return func
+
+    return register
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise LookupError(f"Unknown task {name!r}.") from None
+
+
+def backoff(attempt):
+    """Seconds to wait before retrying after failed ``attempt`` (1-based), with 10% jitter."""
+    delay = min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX)
+    return delay + random.uniform(0, delay / 10)
+
+
+def create_job(name, payload=None, idempotency_key=None, run_at=None, max_attempts=None):
+    """Insert a job now; returns the unfinished job already holding ``idempotency_key``, if any."""
+    _, default_attempts = get_task(name)
+    job = Job(
+        task=name,
+        payload=payload or {},
+        idempotency_key=idempotency_key,
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts or default_attempts,
+    )
+    if idempotency_key is None:
+        job.save()
+        return job
+    try:
+        with transaction.atomic():
+            job.save()
+    except IntegrityError:
+        pending = Job.objects.filter(idempotency_key=idempotency_key, status__in=Job.PENDING).first()
+        if pending is None:
+            # It finished in the meantime, releasing the key.
+            return create_job(name, payload, idempotency_key, run_at, max_attempts)
+        return pending
+    return job
+
+
+def enqueue(name, payload=None, idempotency_key=None, run_at=None, max_attempts=None):
+    """Queue ``name`` once the current transaction commits (immediately outside one)."""
+    get_task(name)
+    transaction.on_commit(
+        lambda: create_job(name, payload, idempotency_key, run_at, max_attempts)
+    )
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim(worker_id, limit=1):
+    """Mark up to ``limit`` due jobs as RUNNING for ``worker_id`` and return them."""
+    now = timezone.now()
+    due = Q(status=Job.QUEUED, run_at__lte=now) | Q(
+        status=Job.RUNNING, locked_at__lt=now - LOCK_TIMEOUT
+    )
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(due)
+                .order_by("run_at", "id")
+                .values_list("pk", flat=True)[:limit]
+            )
+            Job.objects.filter(pk__in=ids).update(
+                status=Job.RUNNING, locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1
+            )
+    else:
+        ids = []
+        candidates = Job.objects.filter(due).order_by("run_at", "id")
+        for job in candidates.values("pk", "status", "locked_at")[: limit * 2]:
+            # Only wins if nobody claimed the row since it was read.
+            won = Job.objects.filter(
+                pk=job["pk"], status=job["status"], locked_at=job["locked_at"]
+            ).update(
+                status=Job.RUNNING, locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1
+            )
+            if won:
+                ids.append(job["pk"])
+                if len(ids) == limit:
+                    break
+    return list(Job.objects.filter(pk__in=ids).order_by("run_at", "id"))
+
+
+def run_job(job):
+    """Execute a claimed job and record the outcome; returns the job's new status."""
+    try:
+        func, _ = get_task(job.task)
+        func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()[-ERROR_LENGTH:]
+        if job.attempts < job.max_attempts:
+            status = Job.QUEUED
+            fields = {"run_at": timezone.now() + timedelta(seconds=backoff(job.attempts))}
+            logger.warning("Job %s failed (attempt %s), retrying", job, job.attempts)
+        else:
+            status = Job.FAILED
+            fields = {"finished_at": timezone.now()}
+            logger.error("Job %s failed permanently", job)
+        fields["last_error"] = error
+    else:
+        status = Job.SUCCEEDED
+        fields = {"finished_at": timezone.now(), "last_error": ""}
+    # Guard on locked_by/locked_at so a job reclaimed after LOCK_TIMEOUT is not overwritten.
+    Job.objects.filter(pk=job.pk, locked_by=job.locked_by, locked_at=job.locked_at).update(
+        status=status, locked_by="", locked_at=None, **fields
+    )
+    job.status = status
+    return status
+
+
+class Worker:
+    """Polls for due jobs and runs at most ``concurrency`` of them at a time."""
+
+    def __init__(self, concurrency=1, poll_interval=1.0, worker_id=None):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or default_worker_id()
+        self.stopped = False
+
+    def run(self, burst=False):
+        """Process jobs until stopped; with ``burst``, until none are due. Returns the count run."""
+        processed = 0
+        pool = ThreadPoolExecutor(self.concurrency) if self.concurrency > 1 else None
+        try:
+            while not self.stopped:
+                jobs = claim(self.worker_id, self.concurrency)
+                if jobs:
+                    if pool:
+                        list(pool.map(self._run_in_thread, jobs))
+                    else:
+                        for job in jobs:
+                            run_job(job)
+                    processed += len(jobs)
+                    continue
+                if burst:
+                    break
+                close_old_connections()
+                time.sleep(self.poll_interval)
+        finally:
+            if pool:
+                pool.shutdown()
+        return processed
+
+    def stop(self):
+        self.stopped = True
+
+    def _run_in_thread(self, job):
+        try:
+            return run_job(job)
+        finally:
+            connection.close()
@@ -0,0 +1,39 @@
+"""Run background jobs from the database queue."""
+
+import signal
+
+from django.core.management.base import BaseCommand
+
+from core.jobs import Worker
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs (see core/jobs.py)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Maximum number of jobs run at the same time (default: 1).",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no jobs are due instead of polling forever.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the queue is empty (default: 1).",
+        )
+
+    def handle(self, *args, concurrency=1, burst=False, poll_interval=1.0, **options):
+        worker = Worker(concurrency=concurrency, poll_interval=poll_interval)
+        if not burst:
+            # Finish the jobs in hand, then exit.
+            signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+            signal.signal(signal.SIGINT, lambda *_: worker.stop())
+        processed = worker.run(burst=burst)
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} job(s)."))
@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ContactCursorPagination(CursorPagination):
+    """Newest-first pages that seek on the (created_at, id) index instead of counting."""
+
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,137 @@
+"""Primary/replica database routing.
+
+Reads of the project domain and of contact messages go to a random alias in
+``settings.DATABASE_REPLICAS``. Everything else, and every write, goes to
+the primary (``default``). Reads stay on the primary:
+
+* once the current request, command or job has written anything, since a
+  replica may not have the row yet and signal handlers read right after
+  writing;
+* inside a transaction on the primary;
+* for ``REPLICA_PIN_SECONDS`` after a write by the same client.
+  ``ReplicaPinningMiddleware`` records this in a cookie, so the next page
+  load sees the client's own write.
+
+With no replicas configured every query goes to ``default``.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY = DEFAULT_DB_ALIAS
+# Models whose reads may be served by a replica.
+REPLICA_APPS = {'project'}
+REPLICA_MODELS = {'core.contact'}
+PIN_COOKIE = 'db_primary_until'
+
+_pinned = ContextVar('db_pinned_to_primary', default=False)
+_wrote = ContextVar('db_wrote', default=False)
+
+
+def replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+@contextmanager
+def use_primary():
+    """Send every read inside the block to the primary."""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        aliases = replicas()
+        meta = model._meta
+        if (
+            not aliases
+            or _pinned.get()
+            or not (meta.app_label in REPLICA_APPS or meta.label_lower in REPLICA_MODELS)
+            or connections[PRIMARY].in_atomic_block
+        ):
+            return PRIMARY
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db in aliases:
+            # Follow relations on the replica the instance came from.
+            return instance._state.db
+        return random.choice(aliases)
+
+    def db_for_write(self, model, **hints):
+        _pinned.set(True)
+        _wrote.set(True)
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {PRIMARY, *replicas()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema from the primary.
+        if db in replicas():
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """Scopes pinning to the request and keeps a client on the primary right after it writes."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self.start(request)
+        try:
+            response = self.get_response(request)
+            self.finish(response)
+        finally:
+            self.reset(tokens)
+        return response
+
+    async def __acall__(self, request):
+        tokens = self.start(request)
+        try:
+            response = await self.get_response(request)
+            self.finish(response)
+        finally:
+            self.reset(tokens)
+        return response
+
+    def start(self, request):
+        try:
+            pinned = float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            pinned = False
+        return _pinned.set(pinned), _wrote.set(False)
+
+    def finish(self, response):
+        if _wrote.get() and replicas():
+            seconds = settings.REPLICA_PIN_SECONDS
+            response.set_cookie(
+                PIN_COOKIE,
+                str(int(time.time()) + seconds),
+                max_age=seconds,
+                httponly=True,
+                samesite='Lax',
+            )
+
+    def reset(self, tokens):
+        _pinned.reset(tokens[0])
+        _wrote.reset(tokens[1])
@@ -0,0 +1,31 @@
+"""Background tasks for the core app."""
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+from .jobs import enqueue, task
+from .models import Contact
+
+
+@task("core.notify_contact")
+def notify_contact(contact_id):
+    """Email the site owner about a new contact message."""
+    if not settings.CONTACT_NOTIFICATION_EMAIL:
+        return
+    contact = Contact.objects.filter(pk=contact_id).first()
+    if contact is None:
+        return
+    send_mail(
+        subject=f"[Portfolio contact] {contact.subject}",
+        message=f"From: {contact.name} <{contact.email}>\n\n{contact.message}",
+        from_email=None,
+        recipient_list=[settings.CONTACT_NOTIFICATION_EMAIL],
+    )
+
+
+def queue_contact_notification(contact):
+    enqueue(
+        "core.notify_contact",
+        {"contact_id": contact.pk},
+        idempotency_key=f"contact:{contact.pk}:notify",
+    )
@@ -1,3 +1,536 @@
-from django.test import TestCase
+import contextvars
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .db import pragma_statements
+from .instrumentation import RequestMetricsMiddleware, fingerprint
+from .jobs import LOCK_TIMEOUT, Worker, backoff, claim, create_job, enqueue, task
+from .models import Contact, Job
+from .routing import PIN_COOKIE, PrimaryReplicaRouter, ReplicaPinningMiddleware, use_primary
+from .throttling import TokenBucket, get_contact_stats
+
+calls = []
+
+
+@task("tests.record", max_attempts=3)
+def record(value):
+    calls.append(value)
+
+
+@task("tests.fail", max_attempts=2)
+def fail():
+    raise RuntimeError("boom")
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_waits_for_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue("tests.record", {"value": 1})
+            self.assertFalse(Job.objects.exists())
+        self.assertEqual(Job.objects.get().status, Job.QUEUED)
+
+    def test_enqueue_discarded_on_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                enqueue("tests.record", {"value": 1})
+                transaction.set_rollback(True)
+        self.assertFalse(Job.objects.exists())
+
+    def test_enqueue_rejects_unknown_task(self):
+        with self.assertRaises(LookupError):
+            enqueue("tests.missing")
+
+    def test_idempotency_key_creates_one_job(self):
+        first = create_job("tests.record", {"value": 1}, idempotency_key="once")
+        second = create_job("tests.record", {"value": 2}, idempotency_key="once")
+        self.assertEqual(first.pk, second.pk)
+        Worker().run(burst=True)
+        self.assertEqual(calls, [1])
+
+    def test_idempotency_key_is_released_when_the_job_finishes(self):
+        failed = create_job("tests.fail", idempotency_key="retry-me", max_attempts=1)
+        Worker().run(burst=True)
+        failed.refresh_from_db()
+        self.assertEqual(failed.status, Job.FAILED)
+        again = create_job("tests.record", {"value": 1}, idempotency_key="retry-me")
+        self.assertNotEqual(again.pk, failed.pk)
+        self.assertEqual(create_job("tests.record", {"value": 2}, idempotency_key="retry-me").pk, again.pk)
+        Worker().run(burst=True)
+        self.assertEqual(calls, [1])
+        self.assertEqual(Job.objects.filter(idempotency_key="retry-me").count(), 2)
+
+    def test_worker_runs_due_jobs_in_order(self):
+        create_job("tests.record", {"value": "later"}, run_at=timezone.now() + timedelta(hours=1))
+        create_job("tests.record", {"value": "b"}, run_at=timezone.now() - timedelta(seconds=1))
+        create_job("tests.record", {"value": "a"}, run_at=timezone.now() - timedelta(seconds=2))
+        self.assertEqual(Worker().run(burst=True), 2)
+        self.assertEqual(calls, ["a", "b"])
+        self.assertEqual(Job.objects.filter(status=Job.SUCCEEDED).count(), 2)
+
+    def test_failure_retries_with_backoff_then_fails(self):
+        job = create_job("tests.fail")
+        before = timezone.now()
+        Worker().run(burst=True)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.QUEUED, 1))
+        self.assertIn("RuntimeError: boom", job.last_error)
+        self.assertGreaterEqual(job.run_at, before + timedelta(seconds=backoff(1) * 0.9))
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        Worker().run(burst=True)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 2))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_backoff_grows_and_is_capped(self):
+        self.assertLess(backoff(1), backoff(3))
+        self.assertLessEqual(backoff(50), 60 * 60 * 1.1)
+
+    def test_claim_is_exclusive_and_recovers_stale_locks(self):
+        create_job("tests.record", {"value": 1})
+        self.assertEqual(len(claim("w1")), 1)
+        self.assertEqual(claim("w2"), [])
+        Job.objects.update(locked_at=timezone.now() - LOCK_TIMEOUT - timedelta(seconds=1))
+        [job] = claim("w2")
+        self.assertEqual((job.locked_by, job.attempts), ("w2", 2))
+
+    def test_run_worker_command_burst(self):
+        create_job("tests.record", {"value": 1})
+        out = StringIO()
+        call_command("run_worker", burst=True, concurrency=1, stdout=out)
+        self.assertIn("Processed 1 job(s)", out.getvalue())
+
+
+class ConcurrentWorkerTests(TransactionTestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_concurrency_runs_every_job_once(self):
+        for value in range(6):
+            create_job("tests.record", {"value": value})
+        self.assertEqual(Worker(concurrency=3).run(burst=True), 6)
+        self.assertEqual(sorted(calls), list(range(6)))
+
+
+@override_settings(CONTACT_NOTIFICATION_EMAIL="owner@example.com")
+class ContactNotificationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_create_returns_before_notification_is_sent(self):
+        client = APIClient()
+        payload = {"name": "Ada", "email": "ada@example.com", "subject": "Hi", "message": "Hello"}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post("/api/contacts/", payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+        job = Job.objects.get()
+        self.assertEqual(job.idempotency_key, f"contact:{Contact.objects.get().pk}:notify")
+
+        Worker().run(burst=True)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["owner@example.com"])
+        self.assertIn("Hello", mail.outbox[0].body)
+
+
+def submission(n=0, **extra):
+    return {"name": "Ada", "email": "ada@example.com", "subject": "Hi", "message": f"Hello {n}", **extra}
+
+
+@override_settings(CONTACT_THROTTLE_RATES={"ip": "3/hour", "global": "5/minute"})
+class ContactThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def post(self, data, ip="10.0.0.1"):
+        return self.client.post("/api/contacts/", data, format="json", REMOTE_ADDR=ip)
+
+    def test_token_bucket_refills_over_time(self):
+        bucket = TokenBucket("test", "2/minute")
+        self.assertEqual(bucket.consume(now=0), 0)
+        self.assertEqual(bucket.consume(now=0), 0)
+        self.assertAlmostEqual(bucket.consume(now=0), 30)
+        self.assertAlmostEqual(bucket.consume(now=15), 15)
+        self.assertEqual(bucket.consume(now=30), 0)
+
+    def test_per_ip_limit_returns_429_with_retry_after(self):
+        for n in range(3):
+            self.assertEqual(self.post(submission(n)).status_code, 201)
+        response = self.post(submission(3))
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        self.assertEqual(self.post(submission(4), ip="10.0.0.2").status_code, 201)
+        self.assertEqual(Contact.objects.count(), 4)
+
+    def test_global_limit_applies_across_ips(self):
+        for n in range(5):
+            self.assertEqual(self.post(submission(n), ip=f"10.0.1.{n}").status_code, 201)
+        self.assertEqual(self.post(submission(9), ip="10.0.2.1").status_code, 429)
+        self.assertEqual(get_contact_stats()["throttled_global"], 1)
+
+    def test_throttled_ip_does_not_drain_the_global_bucket(self):
+        for n in range(8):
+            self.post(submission(n), ip="10.0.3.1")
+        self.assertEqual(self.post(submission(9), ip="10.0.3.2").status_code, 201)
+        stats = get_contact_stats()
+        self.assertEqual((stats["throttled_ip"], stats["throttled_global"]), (5, 0))
+
+    def test_honeypot_and_duplicates_are_dropped_silently(self):
+        self.assertEqual(self.post(submission(website="http://spam")).status_code, 201)
+        self.assertEqual(self.post(submission()).status_code, 201)
+        self.assertEqual(self.post(submission()).status_code, 201)
+        self.assertEqual(Contact.objects.count(), 1)
+        stats = get_contact_stats()
+        self.assertEqual((stats["accepted"], stats["honeypot"], stats["duplicate"]), (1, 1, 1))
+
+    def test_non_object_body_is_a_validation_error(self):
+        for body in ([1, 2], "text"):
+            response = self.post(body)
+            self.assertEqual(response.status_code, 400, body)
+        self.assertEqual(Contact.objects.count(), 0)
+
+    async def test_async_endpoint_shares_throttles_and_shedding(self):
+        url = "/api/async/contacts/"
+        for n in range(2):
+            response = await self.async_client.post(url, submission(n), content_type="application/json")
+            self.assertEqual(response.status_code, 201)
+        duplicate = await self.async_client.post(url, submission(1), content_type="application/json")
+        self.assertEqual(duplicate.status_code, 201)
+        throttled = await self.async_client.post(url, submission(5), content_type="application/json")
+        self.assertEqual(throttled.status_code, 429)
+        self.assertIn("Retry-After", throttled)
+        self.assertEqual(await Contact.objects.acount(), 2)
+        stats = get_contact_stats()
+        self.assertEqual((stats["accepted"], stats["duplicate"], stats["throttled_ip"]), (2, 1, 1))
+
+    async def test_async_endpoint_validates(self):
+        response = await self.async_client.post(
+            "/api/async/contacts/", submission(email="nope"), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email", response.json())
+        not_an_object = await self.async_client.post(
+            "/api/async/contacts/", "[1]", content_type="application/json"
+        )
+        self.assertEqual(not_an_object.status_code, 400)
+
+    def test_read_actions_are_not_throttled(self):
+        admin = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_authenticate(admin)
+        for _ in range(5):
+            self.assertEqual(self.client.get("/api/contacts/").status_code, 200)
+
+
+class ContactInboxTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        admin = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.contacts = []
+        for n, (email, day) in enumerate(
+            [("a@example.com", 1), ("b@example.com", 2), ("a@example.com", 3)]
+        ):
+            contact = Contact.objects.create(name="N", email=email, subject="S", message=f"m{n}")
+            created = timezone.make_aware(timezone.datetime(2026, 3, day, 12))
+            Contact.objects.filter(pk=contact.pk).update(created_at=created)
+            self.contacts.append(contact)
+        self.admin = admin
+
+    def test_read_side_requires_admin(self):
+        contact = self.contacts[0]
+        self.assertEqual(self.client.get("/api/contacts/").status_code, 403)
+        self.assertEqual(self.client.get(f"/api/contacts/{contact.pk}/").status_code, 403)
+        self.assertEqual(self.client.get("/api/contacts/export/").status_code, 403)
+        self.assertEqual(self.client.delete(f"/api/contacts/{contact.pk}/").status_code, 403)
+
+    def test_cursor_pages_newest_first(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get("/api/contacts/", {"page_size": 2})
+        self.assertNotIn("count", response.data)
+        self.assertEqual([c["message"] for c in response.data["results"]], ["m2", "m1"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([c["message"] for c in response.data["results"]], ["m0"])
+        self.assertIsNone(response.data["next"])
+
+    def test_email_and_date_filters(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get("/api/contacts/", {"email": "a@example.com"})
+        self.assertEqual([c["message"] for c in response.data["results"]], ["m2", "m0"])
+        response = self.client.get(
+            "/api/contacts/", {"created_after": "2026-03-02", "created_before": "2026-03-02"}
+        )
+        self.assertEqual([c["message"] for c in response.data["results"]], ["m1"])
+        response = self.client.get("/api/contacts/", {"created_after": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("created_after", response.data)
+
+    def test_csv_export_streams_filtered_rows(self):
+        Contact.objects.filter(pk=self.contacts[2].pk).update(subject="=HYPERLINK(1)")
+        self.client.force_authenticate(self.admin)
+        response = self.client.get("/api/contacts/export/", {"email": "a@example.com"})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "id,created_at,name,email,subject,message")
+        self.assertEqual(len(lines), 3)
+        self.assertIn("'=HYPERLINK(1)", lines[1])
+
+
+class SQLitePragmaTests(TestCase):
+    def test_statements_reject_unsafe_values(self):
+        self.assertEqual(pragma_statements({"cache_size": -2000}), ["PRAGMA cache_size = -2000"])
+        with self.assertRaises(ValueError):
+            pragma_statements({"journal_mode": "WAL; DROP TABLE core_contact"})
+
+    @override_settings(SQLITE_PRAGMAS={"synchronous": "NORMAL", "busy_timeout": 1234})
+    def test_pragmas_applied_to_new_connections(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite only")
+        fresh = connections.create_connection("default")
+        try:
+            with fresh.cursor() as cursor:
+                cursor.execute("PRAGMA synchronous")
+                self.assertEqual(cursor.fetchone()[0], 1)
+                cursor.execute("PRAGMA busy_timeout")
+                self.assertEqual(cursor.fetchone()[0], 1234)
+        finally:
+            fresh.close()
+
+
+def in_fresh_context(fn, *args, **kwargs):
+    """Run ``fn`` as a new request would: no pins left over from earlier writes."""
+    return contextvars.Context().run(fn, *args, **kwargs)
+
+
+@override_settings(DATABASE_REPLICAS=["replica1", "replica2"], REPLICA_PIN_SECONDS=5)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def read(self, model):
+        return in_fresh_context(self.router.db_for_read, model)
+
+    def test_reads_of_routed_models_use_replicas(self):
+        from project.models import Project
+
+        self.assertIn(self.read(Project), {"replica1", "replica2"})
+        self.assertIn(self.read(Contact), {"replica1", "replica2"})
+        self.assertEqual(self.read(Job), "default")
+        self.assertEqual(self.read(get_user_model()), "default")
+
+    def test_writes_go_to_primary_and_pin_later_reads(self):
+        from project.models import Project
+
+        def write_then_read():
+            self.assertEqual(self.router.db_for_write(Project), "default")
+            return self.router.db_for_read(Project)
+
+        self.assertEqual(in_fresh_context(write_then_read), "default")
+
+    def test_use_primary_and_transactions_pin_reads(self):
+        from project.models import Project
+
+        def pinned_read():
+            with use_primary():
+                return self.router.db_for_read(Project)
+
+        self.assertEqual(in_fresh_context(pinned_read), "default")
+        connection.in_atomic_block = True
+        try:
+            self.assertEqual(self.read(Project), "default")
+        finally:
+            connection.in_atomic_block = False
+
+    def test_replicas_never_migrate(self):
+        self.assertFalse(self.router.allow_migrate("replica1", "project"))
+        self.assertIsNone(self.router.allow_migrate("default", "project"))
+
+    def test_middleware_sets_pin_cookie_after_write(self):
+        from project.models import Project
+
+        def writing_view(request):
+            PrimaryReplicaRouter().db_for_write(Project)
+            return HttpResponse()
+
+        def reading_view(request):
+            return HttpResponse(PrimaryReplicaRouter().db_for_read(Project))
+
+        factory = RequestFactory()
+        response = in_fresh_context(ReplicaPinningMiddleware(writing_view), factory.post("/"))
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 5)
+
+        middleware = ReplicaPinningMiddleware(reading_view)
+        request = factory.get("/")
+        request.COOKIES[PIN_COOKIE] = response.cookies[PIN_COOKIE].value
+        self.assertEqual(in_fresh_context(middleware, request).content, b"default")
+        request.COOKIES[PIN_COOKIE] = str(int(time.time()) - 1)
+        self.assertIn(in_fresh_context(middleware, request).content, {b"replica1", b"replica2"})
+        self.assertNotIn(PIN_COOKIE, in_fresh_context(middleware, factory.get("/")).cookies)
+
+
+class SQLiteReplicaStandInTests(TransactionTestCase):
+    """Two SQLite files act as replicas; "replication" is an explicit backup copy."""
+
+    aliases = ["replica1", "replica2"]
+
+    @classmethod
+    def setUpClass(cls):
+        if connection.vendor != "sqlite":
+            raise unittest.SkipTest("SQLite stand-ins only")
+        cls.directory = tempfile.mkdtemp()
+        for alias in cls.aliases:
+            connections.settings[alias] = {
+                **connections.settings["default"],
+                "NAME": os.path.join(cls.directory, f"{alias}.sqlite3"),
+                "TEST": {"MIRROR": None, "NAME": None},
+            }
+        # Set here, not on the class: the runner checks class-level aliases exist.
+        cls.databases = {"default", *cls.aliases}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        for alias in cls.aliases:
+            connections[alias].close()
+            del connections[alias]
+            del connections.settings[alias]
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    def replicate(self, alias):
+        connection.ensure_connection()
+        target = connections[alias]
+        target.close()
+        target.ensure_connection()
+        connection.connection.backup(target.connection)
+
+    def test_reads_hit_the_replica_until_pinned(self):
+        from project.models import Project
+
+        project = in_fresh_context(
+            Project.objects.create, title="Replicated", description="d", status="completed"
+        )
+        for alias in self.aliases:
+            self.replicate(alias)
+        Project.objects.filter(pk=project.pk).update(title="Changed on primary")
+
+        def title():
+            return Project.objects.get(pk=project.pk).title
+
+        with self.settings(DATABASE_REPLICAS=self.aliases):
+            self.assertEqual(in_fresh_context(title), "Replicated")
+
+            def pinned_title():
+                with use_primary():
+                    return title()
+
+            self.assertEqual(in_fresh_context(pinned_title), "Changed on primary")
+
+            def write_then_read():
+                Contact.objects.create(name="N", email="n@example.com", subject="S", message="M")
+                return title()
+
+            self.assertEqual(in_fresh_context(write_then_read), "Changed on primary")
+
+
+@override_settings(REQUEST_METRICS_SAMPLE_RATE=1.0, REQUEST_METRICS_HEADER=True)
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        from project.models import Project
+
+        for i in range(3):
+            Project.objects.create(title=f"P{i}", description="d", status="completed")
+
+    def timings(self, response):
+        entries = re.findall(r'(\w+);dur=([\d.]+)(?:;desc="([^"]*)")?', response["Server-Timing"])
+        return {name: (float(duration), desc) for name, duration, desc in entries}
+
+    def test_fingerprint_normalizes_literals_and_lists(self):
+        self.assertEqual(
+            fingerprint(
+                'SELECT "t"."id" FROM "t" WHERE "t"."id" IN (%s, %s)  AND "t"."name" = \'it\'\'s\' LIMIT 21'
+            ),
+            'SELECT "t"."id" FROM "t" WHERE "t"."id" IN (...) AND "t"."name" = ? LIMIT ?',
+        )
+        self.assertEqual(
+            fingerprint('INSERT INTO "t" ("a", "b") VALUES (%s, %s), (%s, %s)'),
+            'INSERT INTO "t" ("a", "b") VALUES (...)',
+        )
+        self.assertEqual(
+            fingerprint('SELECT "U0"."id" FROM t U0 WHERE x > -1.5'),
+            'SELECT "U0"."id" FROM t U0 WHERE x > ?',
+        )
+
+    def test_server_timing_reports_queries_and_phases(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/projects/")
+        timings = self.timings(response)
+        self.assertEqual(set(timings), {"db", "cache", "serialize", "render", "total"})
+        self.assertEqual(timings["db"][1], f"{len(ctx.captured_queries)} queries")
+        self.assertGreaterEqual(timings["total"][0], timings["render"][0])
+
+    def test_sampling_and_header_settings(self):
+        with self.settings(REQUEST_METRICS_SAMPLE_RATE=0):
+            self.assertNotIn("Server-Timing", self.client.get("/api/projects/"))
+        with self.settings(REQUEST_METRICS_HEADER=False, SLOW_REQUEST_MS=0):
+            with self.assertLogs("core.instrumentation", "WARNING"):
+                response = self.client.get("/api/projects/")
+            self.assertNotIn("Server-Timing", response)
+
+    def test_slow_requests_are_logged_with_query_groups(self):
+        with self.settings(SLOW_REQUEST_MS=10_000, SLOW_QUERY_MS=10_000):
+            with self.assertNoLogs("core.instrumentation", "WARNING"):
+                self.client.get("/api/projects/")
+        with self.settings(SLOW_REQUEST_MS=0), self.assertLogs("core.instrumentation", "WARNING") as logs:
+            response = self.client.get("/api/projects/?status=completed")
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["event"], "slow_request")
+        self.assertEqual(record["view"], "project-list")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(sum(group["count"] for group in record["query_groups"]), record["queries"])
+        self.assertEqual(self.timings(response)["db"][1], f"{record['queries']} queries")
+        group = record["query_groups"][0]
+        self.assertRegex(group["fingerprint"], r"^[0-9a-f]{12}$")
+        self.assertNotIn("%s", group["sql"])
+
+    def test_repeated_statements_group_under_one_fingerprint(self):
+        from project.models import Project
+
+        def n_plus_one(request):
+            for project in Project.objects.all():
+                Project.objects.get(pk=project.pk)
+            return HttpResponse("ok")
+
+        with self.settings(SLOW_REQUEST_MS=0), self.assertLogs("core.instrumentation", "WARNING") as logs:
+            RequestMetricsMiddleware(n_plus_one)(RequestFactory().get("/n-plus-one/"))
+        groups = json.loads(logs.records[0].getMessage())["query_groups"]
+        self.assertEqual(sorted(group["count"] for group in groups), [1, 3])
+
+    async def test_async_views_are_measured(self):
+        response = await self.async_client.get("/api/async/projects/")
+        timings = self.timings(response)
+        self.assertGreater(int(timings["db"][1].split()[0]), 0)
+        self.assertIn("serialize", timings)
@@ -0,0 +1,183 @@
+"""Spam shedding for the anonymous contact endpoint.
+
+Everything here runs before the submission is deserialized or written:
+
+* ``ContactIPThrottle`` / ``ContactGlobalThrottle`` are token buckets kept in
+  the cache. Each allows a burst of ``N`` submissions and refills at
+  ``N`` per period, from rates written like DRF's (``"5/hour"``). A denied
+  request gets DRF's ``429`` with ``Retry-After``.
+* ``is_spam`` catches honeypot fills and repeats of a message already
+  accepted within ``CONTACT_DUPLICATE_WINDOW`` seconds.
+
+Buckets are read and written without a lock, so concurrent requests can
+slightly over-admit. That is fine for shedding load, but it is not a quota.
+Outcome counters are kept for monitoring (``get_contact_stats``).
+"""
+
+import hashlib
+import time
+from collections.abc import Mapping
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+STATS_PREFIX = "contact:stats:"
+OUTCOMES = ["accepted", "throttled_ip", "throttled_global", "honeypot", "duplicate"]
+HONEYPOT_FIELD = "website"
+
+
+def parse_rate(rate):
+    """``"5/hour"`` -> ``(capacity, tokens per second)``."""
+    num, period = rate.split("/")
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period.strip()[0]]
+
+
+class TokenBucket:
+    def __init__(self, key, rate):
+        self.key = f"contact:bucket:{key}"
+        self.capacity, self.refill = parse_rate(rate)
+
+    def _take(self, state, now):
+        """Return the new state and ``0`` when a token was free, else the wait in seconds."""
+        tokens, updated = state or (self.capacity, now)
+        tokens = min(self.capacity, tokens + (now - updated) * self.refill)
+        if tokens < 1:
+            return (tokens, now), (1 - tokens) / self.refill
+        return (tokens - 1, now), 0
+
+    @property
+    def timeout(self):
+        # Keep the state until the bucket would be full again anyway.
+        return int(self.capacity / self.refill) + 1
+
+    def consume(self, now=None):
+        """Take one token; returns ``0`` when allowed, else the seconds until one is free."""
+        now = time.time() if now is None else now
+        state, wait = self._take(cache.get(self.key), now)
+        cache.set(self.key, state, self.timeout)
+        return wait
+
+    async def aconsume(self, now=None):
+        now = time.time() if now is None else now
+        state, wait = self._take(await cache.aget(self.key), now)
+        await cache.aset(self.key, state, self.timeout)
+        return wait
+
+
+class ContactThrottle(BaseThrottle):
+    """Token bucket for ``scope``, rated by ``CONTACT_THROTTLE_RATES[scope]``.
+
+    By default every client shares one bucket per scope; override
+    ``get_bucket_key`` to split it, e.g. per IP.
+    """
+
+    scope = None
+    outcome = None
+
+    def get_bucket_key(self, request):
+        return self.scope
+
+    def allow_request(self, request, view):
+        rate = settings.CONTACT_THROTTLE_RATES.get(self.scope)
+        if not rate:
+            return True
+        self.retry_after = TokenBucket(self.get_bucket_key(request), rate).consume()
+        if self.retry_after:
+            record(self.outcome)
+            return False
+        return True
+
+    async def aallow_request(self, request):
+        rate = settings.CONTACT_THROTTLE_RATES.get(self.scope)
+        if not rate:
+            return True
+        self.retry_after = await TokenBucket(self.get_bucket_key(request), rate).aconsume()
+        if self.retry_after:
+            await arecord(self.outcome)
+            return False
+        return True
+
+    def wait(self):
+        return self.retry_after
+
+
+class ContactIPThrottle(ContactThrottle):
+    scope = "ip"
+    outcome = "throttled_ip"
+
+    def get_bucket_key(self, request):
+        return f"ip:{self.get_ident(request)}"
+
+
+class ContactGlobalThrottle(ContactThrottle):
+    scope = "global"
+    outcome = "throttled_global"
+
+
+def message_digest(data):
+    email = str(data.get("email", "")).strip().lower()
+    subject = str(data.get("subject", "")).strip()
+    message = str(data.get("message", "")).strip()
+    return hashlib.sha256(f"{email}\x00{subject}\x00{message}".encode()).hexdigest()
+
+
+def is_spam(data):
+    """Return the rejection outcome for raw submission ``data``, or ``None``.
+
+    Bodies that are not objects are left for the serializer to reject.
+    """
+    if not isinstance(data, Mapping):
+        return None
+    if data.get(HONEYPOT_FIELD):
+        return "honeypot"
+    if cache.get(f"contact:seen:{message_digest(data)}"):
+        return "duplicate"
+    return None
+
+
+async def ais_spam(data):
+    if not isinstance(data, Mapping):
+        return None
+    if data.get(HONEYPOT_FIELD):
+        return "honeypot"
+    if await cache.aget(f"contact:seen:{message_digest(data)}"):
+        return "duplicate"
+    return None
+
+
+def remember(data):
+    """Mark an accepted submission so identical repeats are shed for a while."""
+    cache.set(f"contact:seen:{message_digest(data)}", 1, settings.CONTACT_DUPLICATE_WINDOW)
+
+
+async def aremember(data):
+    await cache.aset(f"contact:seen:{message_digest(data)}", 1, settings.CONTACT_DUPLICATE_WINDOW)
+
+
+def record(outcome):
+    key = STATS_PREFIX + outcome
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+async def arecord(outcome):
+    key = STATS_PREFIX + outcome
+    await cache.aadd(key, 0, timeout=None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        pass
+
+
+def get_contact_stats():
+    return {outcome: cache.get(STATS_PREFIX + outcome, 0) for outcome in OUTCOMES}
+
+
+def reset_contact_stats():
+    cache.delete_many([STATS_PREFIX + outcome for outcome in OUTCOMES])
@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from .async_views import contact_create
 from .views import hello_api, ContactViewSet
 
 router = DefaultRouter()
@@ -7,5 +8,6 @@ router.register(r'contacts', ContactViewSet, basename='contact')
 
 urlpatterns = [
     path("api/hello/", hello_api),
+    path("api/async/contacts/", contact_create),
     path("api/", include(router.urls)),
 ]
\ No newline at end of file
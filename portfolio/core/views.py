@@ -1,9 +1,33 @@
-from django.http import JsonResponse
-from rest_framework import viewsets, status
+import csv
+
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import permissions, viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from .filters import filter_contacts
 from .models import Contact
+from .pagination import ContactCursorPagination
 from .serializers import ContactSerializer
+from .tasks import queue_contact_notification
+from .throttling import ContactGlobalThrottle, ContactIPThrottle, is_spam, record, remember
+
+CONTACT_THANKS = "Thank you for your message! We'll get back to you soon."
+EXPORT_FIELDS = ['id', 'created_at', 'name', 'email', 'subject', 'message']
+EXPORT_CHUNK_SIZE = 500
+
+
+class Echo:
+    """File-like object whose write() hands back the row csv.writer produced."""
+
+    def write(self, value):
+        return value
+
+
+def csv_safe(value):
+    # Keep spreadsheet apps from evaluating submitted text as a formula.
+    text = str(value)
+    return "'" + text if text[:1] in ('=', '+', '-', '@', '\t', '\r') else text
 
 
 def hello_api(request):
@@ -11,14 +35,64 @@ def hello_api(request):
 
 
 class ContactViewSet(viewsets.ModelViewSet):
+    """Anyone may submit a message; reading and managing the inbox is admin-only."""
+
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
-    
+    pagination_class = ContactCursorPagination
+
+    def get_permissions(self):
+        if self.action == 'create':
+            return [permissions.AllowAny()]
+        return [permissions.IsAdminUser()]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('list', 'export'):
+            queryset = filter_contacts(queryset, self.request.query_params)
+        return queryset
+
+    def get_throttles(self):
+        if self.action == 'create':
+            # Per-IP first so one noisy client doesn't drain the global bucket.
+            return [ContactIPThrottle(), ContactGlobalThrottle()]
+        return super().get_throttles()
+
+    def check_throttles(self, request):
+        # Unlike DRF's default, stop at the first denial: a throttled request
+        # must not take tokens from the buckets after it.
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+
     def create(self, request, *args, **kwargs):
+        rejected = is_spam(request.data)
+        if rejected:
+            # Answer like a success so bots get no signal to adapt to.
+            record(rejected)
+            return Response({"message": CONTACT_THANKS}, status=status.HTTP_201_CREATED)
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        return Response(
-            {"message": "Thank you for your message! We'll get back to you soon."},
-            status=status.HTTP_201_CREATED
-        )
+        remember(request.data)
+        record('accepted')
+        return Response({"message": CONTACT_THANKS}, status=status.HTTP_201_CREATED)
+
+    def perform_create(self, serializer):
+        queue_contact_notification(serializer.save())
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream the filtered inbox as CSV without loading it into memory."""
+        rows = self.get_queryset().order_by('-created_at', '-id').values_list(*EXPORT_FIELDS)
+        writer = csv.writer(Echo())
+
+        def stream():
+            yield writer.writerow(EXPORT_FIELDS)
+            for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                yield writer.writerow([csv_safe(value) for value in row])
+
+        filename = f"contacts-{timezone.now():%Y%m%d-%H%M%S}.csv"
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
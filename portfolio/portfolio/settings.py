@@ -1,7 +1,8 @@
 
 
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -36,6 +37,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.instrumentation.RequestMetricsMiddleware',
+    'core.routing.ReplicaPinningMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -69,13 +72,117 @@ WSGI_APPLICATION = 'portfolio.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-DATABASES = {
+# PRAGMAs applied to every new SQLite connection (see core/db.py). "default"
+# keeps SQLite's own settings; set SQLITE_PROFILE=production in deployments.
+# "production" lets readers run alongside the contact-form writer (WAL) and
+# waits on a busy database instead of failing with "database is locked".
+SQLITE_PROFILES = {
+    'default': {},
+    'production': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,  # ms
+        'mmap_size': 134217728,  # 128 MiB
+        'cache_size': -20000,  # negative = KiB, so ~20 MB
+        'temp_store': 'MEMORY',
+    },
+}
+SQLITE_PROFILE = config('SQLITE_PROFILE', default='default')
+SQLITE_PRAGMAS = SQLITE_PROFILES[SQLITE_PROFILE]
+
+# DB_ENGINE selects the backend: "sqlite" (default) or "postgres".
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+# Seconds a connection is reused across requests; 0 closes it after each one.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=0, cast=int)
+
+if DB_ENGINE == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME', default='portfolio'),
+            'USER': config('DB_USER', default='portfolio'),
+            'PASSWORD': config('DB_PASSWORD', default=''),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'sslmode': config('DB_SSLMODE', default='prefer'),
+            },
+        }
+    }
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': config('SQLITE_PATH', default='') or BASE_DIR / 'db.sqlite3',
+            # Health checks drop broken connections when DB_CONN_MAX_AGE reuses them.
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'timeout': 5,
+                # Take the write lock at BEGIN so a read-then-write transaction
+                # waits for busy_timeout instead of failing on lock upgrade.
+                **({'transaction_mode': 'IMMEDIATE'} if SQLITE_PRAGMAS else {}),
+            },
+        }
+    }
+else:
+    raise ImproperlyConfigured(f"DB_ENGINE must be 'sqlite' or 'postgres', not {DB_ENGINE!r}.")
+
+# Per-request query counts and timings (core/instrumentation.py): the fraction
+# of requests measured, whether they get a Server-Timing header (off unless
+# DEBUG: it exposes backend timings to clients), and the thresholds above
+# which a measured request is logged.
+REQUEST_METRICS_SAMPLE_RATE = config('REQUEST_METRICS_SAMPLE_RATE', default=0.1, cast=float)
+REQUEST_METRICS_HEADER = config('REQUEST_METRICS_HEADER', default=DEBUG, cast=bool)
+SLOW_REQUEST_MS = config('SLOW_REQUEST_MS', default=500, cast=int)
+SLOW_QUERY_MS = config('SLOW_QUERY_MS', default=100, cast=int)
+
+# Read replicas for the project/contact read paths (see core/routing.py):
+# comma-separated hosts for postgres, or database files for sqlite stand-ins.
+# Tests point them at the test database (TEST MIRROR).
+DATABASE_REPLICAS = []
+for number, location in enumerate(config('DB_REPLICAS', default='', cast=Csv()), start=1):
+    alias = f'replica{number}'
+    key = 'HOST' if DB_ENGINE == 'postgres' else 'NAME'
+    DATABASES[alias] = {**DATABASES['default'], key: location, 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['core.routing.PrimaryReplicaRouter']
+# Seconds a client's reads stay on the primary after it writes.
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='portfolio'),
     }
 }
 
+# Seconds a cached Project API response is kept; 0 disables the response cache.
+PROJECT_API_CACHE_TIMEOUT = config('PROJECT_API_CACHE_TIMEOUT', default=3600, cast=int)
+# Serialize Project responses from .values() rows instead of DRF serializers (project/rows.py).
+PROJECT_API_FAST_SERIALIZATION = config('PROJECT_API_FAST_SERIALIZATION', default=True, cast=bool)
+# JSON encoder for Project responses: auto (orjson if installed), orjson or json.
+PROJECT_API_JSON_BACKEND = config('PROJECT_API_JSON_BACKEND', default='auto')
+# Directory manage.py build_api_snapshot writes the static API snapshot to.
+API_SNAPSHOT_ROOT = config('API_SNAPSHOT_ROOT', default='') or BASE_DIR / 'snapshot'
+
+# New contact messages are emailed here by the background worker; empty disables it.
+CONTACT_NOTIFICATION_EMAIL = config('CONTACT_NOTIFICATION_EMAIL', default='')
+
+# Token-bucket limits on contact submissions ("<burst>/<period>"); empty disables one.
+CONTACT_THROTTLE_RATES = {
+    'ip': config('CONTACT_THROTTLE_IP_RATE', default='5/hour'),
+    'global': config('CONTACT_THROTTLE_GLOBAL_RATE', default='60/minute'),
+}
+# Seconds an accepted message is remembered to drop identical resubmissions.
+CONTACT_DUPLICATE_WINDOW = config('CONTACT_DUPLICATE_WINDOW', default=600, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -44,8 +44,21 @@ class ProjectAdmin(admin.ModelAdmin):
         ("Meta", {"fields": ("created_at", "updated_at")}),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related("images")
+
+    def save_model(self, request, obj, form, change):
+        # The form's full_clean already ran Project.clean (JSON fields included).
+        obj.save(validated=True)
+
+    def get_search_results(self, request, queryset, search_term):
+        # Same full-text index as the public API's ?q= (see search.py).
+        if not search_term.strip():
+            return queryset, False
+        return queryset.search(search_term, rank=False), False
+
     def thumbnail_preview(self, obj):
-        first = obj.images.first()
+        first = obj.first_image
         if not first or not first.image:
             return "—"
         return format_html('<img src="{}" width="60" height="40" style="object-fit: cover;" />', first.image.url)
@@ -0,0 +1,167 @@
+"""Async (ASGI) versions of the Project list and detail endpoints.
+
+Served under ``/api/async/projects/`` with the same filters, payloads,
+validators and response cache as ``ProjectViewSet``. Under an ASGI server
+they never hold a worker thread while waiting on the database or cache.
+``?fields=``/``?expand=`` work as on the viewset (see ``fieldsets.py``).
+The list supports page-number pagination only; ``?pagination=cursor``
+stays on the sync viewset. Steps that are still sync-only run through
+``sync_to_async``: building a search queryset runs raw FTS SQL, and
+rendering a row whose card is missing needs the fallback.
+"""
+
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.instrumentation import phase
+
+from . import fieldsets
+from .cache import response_cache
+from .conditional import adetail_validators, add_validators, alist_validators, not_modified
+from .models import Project, ProjectCard
+from .projections import card_values
+from .renderers import dumps
+from .serializers import ProjectDetailSerializer, ProjectListSerializer
+from .services import ProjectFilterService
+from .views import ProjectViewSet
+
+NOT_FOUND = "No Project matches the given query."
+INVALID_PAGE = "Invalid page."
+
+
+def json_response(data, status=200, **kwargs):
+    # Same bytes as the sync viewset's ProjectJSONRenderer.
+    with phase("render"):
+        content = dumps(data)
+    return HttpResponse(content, status=status, content_type="application/json", **kwargs)
+
+
+async def cached_json(request, kind, params, render):
+    """``render()`` (async, returns payload data) behind the response cache."""
+    if not response_cache.enabled:
+        with phase("serialize"):
+            data = await render()
+        return json_response(data)
+    with phase("cache"):
+        key = await response_cache.amake_key(kind, params, request)
+        data = await response_cache.aget(key)
+    if data is not None:
+        return json_response(data, headers={"X-Cache": "HIT"})
+    with phase("serialize"):
+        data = await render()
+    with phase("cache"):
+        await response_cache.aset(key, data)
+    return json_response(data, headers={"X-Cache": "MISS"})
+
+
+def _fill_missing_cards(projects):
+    for project in projects:
+        project.card = ProjectCard(**card_values(project))
+
+
+def _has_card(project):
+    try:
+        project.card
+    except ProjectCard.DoesNotExist:
+        return False
+    return True
+
+
+async def render_list(request, queryset, page, selection):
+    page_size = api_settings.PAGE_SIZE
+    count = await queryset.acount()
+    num_pages = max(1, math.ceil(count / page_size))
+    if page == "last":
+        page = num_pages
+    try:
+        page = int(page or 1)
+    except ValueError:
+        raise Http404(INVALID_PAGE)
+    if not 1 <= page <= num_pages:
+        raise Http404(INVALID_PAGE)
+
+    offset = (page - 1) * page_size
+    projects = [p async for p in queryset[offset : offset + page_size].aiterator()]
+    if any(column.startswith("card__") for column in fieldsets.list_columns(selection)):
+        missing = [p for p in projects if not _has_card(p)]
+        if missing:
+            await sync_to_async(_fill_missing_cards)(missing)
+    context = {"request": request, "selection": selection}
+    results = ProjectListSerializer(projects, many=True, context=context).data
+
+    url = request.build_absolute_uri()
+    next_url = replace_query_param(url, "page", page + 1) if page < num_pages else None
+    if page == 1:
+        previous_url = None
+    elif page == 2:
+        previous_url = remove_query_param(url, "page")
+    else:
+        previous_url = replace_query_param(url, "page", page - 1)
+    return {"count": count, "next": next_url, "previous": previous_url, "results": results}
+
+
+async def project_list(request):
+    if request.method != "GET":
+        return json_response({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+    try:
+        selection = fieldsets.list_selection(request.GET)
+    except ValidationError as exc:
+        return json_response(exc.detail, status=400)
+    params = ProjectFilterService.normalize_params(request.GET)
+    queryset = await sync_to_async(ProjectFilterService.get_queryset)(**params)
+    queryset = fieldsets.trim_list_queryset(queryset, selection)
+    validator_params = {
+        **params,
+        **selection.as_params(),
+        "page": {p: request.GET.get(p) for p in ProjectViewSet.page_params},
+    }
+    etag, last_modified = await alist_validators(queryset, validator_params)
+    response = not_modified(request, etag, last_modified)
+    if response is None:
+        page = request.GET.get("page")
+        try:
+            response = await cached_json(
+                request,
+                "async-list",
+                validator_params,
+                lambda: render_list(request, queryset, page, selection),
+            )
+        except Http404 as exc:
+            return json_response({"detail": str(exc)}, status=404)
+    return add_validators(response, etag, last_modified)
+
+
+async def project_detail(request, slug):
+    if request.method != "GET":
+        return json_response({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+    try:
+        selection = fieldsets.detail_selection(request.GET)
+    except ValidationError as exc:
+        return json_response(exc.detail, status=400)
+    etag, last_modified = await adetail_validators(slug, selection.as_params())
+    if etag is None:
+        return json_response({"detail": NOT_FOUND}, status=404)
+
+    async def render():
+        try:
+            project = await fieldsets.trim_detail_queryset(Project.objects.all(), selection).aget(
+                slug=slug
+            )
+        except Project.DoesNotExist:
+            raise Http404(NOT_FOUND)
+        context = {"request": request, "selection": selection}
+        return ProjectDetailSerializer(project, context=context).data
+
+    response = not_modified(request, etag, last_modified)
+    if response is None:
+        try:
+            params = {"slug": slug, **selection.as_params()}
+            response = await cached_json(request, "async-detail", params, render)
+        except Http404 as exc:
+            return json_response({"detail": str(exc)}, status=404)
+    return add_validators(response, etag, last_modified)
@@ -0,0 +1,294 @@
+"""Bulk NDJSON import/export for projects and technologies.
+
+Each line is one JSON object with a ``type`` of ``technology`` or
+``project``. Projects reference technologies by slug; images are not part
+of the format. A record whose slug already exists updates that row, and
+only the fields it carries. The importer validates and writes a batch at a time with
+``bulk_create``/``bulk_update``, so ``Project.save`` and its signals never
+run; derived data (cards, search index, cache versions) is refreshed
+explicitly once per batch.
+"""
+
+import copy
+import json
+import time
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import bump_content_version, bump_technology_version
+from .constants import TechnologyCategory
+from .models import Project, Technology
+from .projections import rebuild_cards
+from .search import index_projects
+from .slugs import allocate_slugs
+
+TECHNOLOGY_FIELDS = ["slug", "name", "category"]
+PROJECT_FIELDS = [
+    "title",
+    "slug",
+    "description",
+    "problem_statement",
+    "key_features",
+    "my_role",
+    "technical_challenges_solutions",
+    "architectural_overview",
+    "future_enhancements",
+    "live_demo_url",
+    "source_code_url",
+    "status",
+    "display_order",
+]
+
+
+def export_records():
+    """Yield NDJSON-ready dicts: every technology, then every project."""
+    for tech in Technology.objects.order_by("pk").iterator(chunk_size=500):
+        yield {"type": "technology", **{f: getattr(tech, f) for f in TECHNOLOGY_FIELDS}}
+    projects = Project.objects.order_by("pk").prefetch_related("technologies")
+    for project in projects.iterator(chunk_size=500):
+        record = {"type": "project", **{f: getattr(project, f) for f in PROJECT_FIELDS}}
+        record["technologies"] = [t.slug for t in project.technologies.all()]
+        yield record
+
+
+def _messages(error):
+    if hasattr(error, "message_dict"):
+        return [f"{field}: {msg}" for field, msgs in error.message_dict.items() for msg in msgs]
+    return list(error.messages)
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = {"technology": 0, "project": 0}
+        self.updated = {"technology": 0, "project": 0}
+        self.errors = []
+        self.records = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def error(self, line, messages):
+        self.errors.append({"line": line, "errors": messages})
+
+    @property
+    def throughput(self):
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+
+class ProjectImporter:
+    """Streams NDJSON lines into the database in validated batches."""
+
+    def __init__(self, batch_size=500, dry_run=False):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+
+    def run(self, lines):
+        report = ImportReport()
+        with transaction.atomic():
+            batch = []
+            for number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                batch.append((number, line))
+                if len(batch) >= self.batch_size:
+                    self._import_batch(batch, report)
+                    batch = []
+            if batch:
+                self._import_batch(batch, report)
+            if self.dry_run:
+                transaction.set_rollback(True)
+        if not self.dry_run:
+            bump_technology_version()
+            bump_content_version()
+        report.errors.sort(key=lambda e: e["line"])
+        report.elapsed = time.perf_counter() - report.started
+        return report
+
+    def _import_batch(self, batch, report):
+        technologies, projects = [], []
+        for number, line in batch:
+            report.records += 1
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                report.error(number, [f"Invalid JSON: {exc}"])
+                continue
+            kind = record.pop("type", None) if isinstance(record, dict) else None
+            if kind == "technology":
+                technologies.append((number, record))
+            elif kind == "project":
+                projects.append((number, record))
+            else:
+                report.error(number, ["Record must be an object with type 'technology' or 'project'."])
+        # Technologies first so projects in the same batch can reference them.
+        self._import_technologies(technologies, report)
+        self._import_projects(projects, report)
+
+    def _import_technologies(self, records, report):
+        valid = []
+        for number, record in records:
+            unknown = set(record) - set(TECHNOLOGY_FIELDS)
+            tech = Technology(
+                name=record.get("name", ""),
+                slug=record.get("slug", ""),
+                category=record.get("category") or TechnologyCategory.OTHER,
+            )
+            try:
+                if unknown:
+                    raise ValidationError(f"Unknown fields: {sorted(unknown)}.")
+                tech.full_clean(exclude=["slug"] if not tech.slug else None, validate_unique=False)
+            except ValidationError as exc:
+                report.error(number, _messages(exc))
+                continue
+            valid.append((number, tech, "category" in record))
+        if not valid:
+            return
+        existing = Technology.objects.filter(
+            Q(slug__in=[t.slug for _, t, _ in valid if t.slug]) | Q(name__in=[t.name for _, t, _ in valid])
+        )
+        by_slug = {t.slug: t for t in existing}
+        by_name = {t.name: t for t in existing}
+        to_create, to_update = [], []
+        names, slugs = set(), set()
+        for number, tech, has_category in valid:
+            named = by_name.get(tech.name)
+            if not tech.slug and named:
+                # Slug-less records update the technology with the same name.
+                tech.slug = named.slug
+            if tech.name in names:
+                report.error(number, [f"name: '{tech.name}' appears twice in this batch."])
+            elif tech.slug and tech.slug in slugs:
+                report.error(number, [f"slug: '{tech.slug}' appears twice in this batch."])
+            elif named and named.slug != tech.slug:
+                report.error(number, [f"name: Technology '{tech.name}' already exists."])
+            elif tech.slug in by_slug:
+                tech.pk = by_slug[tech.slug].pk
+                if not has_category:
+                    tech.category = by_slug[tech.slug].category
+                to_update.append(tech)
+            else:
+                to_create.append(tech)
+            names.add(tech.name)
+            if tech.slug:
+                slugs.add(tech.slug)
+        unslugged = [t for t in to_create if not t.slug]
+        reserved = {t.slug for t in to_create if t.slug}
+        for tech, slug in zip(
+            unslugged, allocate_slugs(Technology, [t.name for t in unslugged], reserved=reserved)
+        ):
+            tech.slug = slug
+        Technology.objects.bulk_create(to_create)
+        Technology.objects.bulk_update(to_update, ["name", "category"])
+        report.created["technology"] += len(to_create)
+        report.updated["technology"] += len(to_update)
+        if to_update:
+            rebuild_cards(
+                Project.technologies.through.objects.filter(
+                    technology_id__in=[t.pk for t in to_update]
+                ).values_list("project_id", flat=True)
+            )
+
+    def _import_projects(self, records, report):
+        parsed = []
+        for number, record in records:
+            unknown = set(record) - set(PROJECT_FIELDS) - {"technologies"}
+            tech_slugs = record.pop("technologies", None)
+            if unknown:
+                report.error(number, [f"Unknown fields: {sorted(unknown)}."])
+            elif tech_slugs is not None and (
+                not isinstance(tech_slugs, list) or not all(isinstance(s, str) for s in tech_slugs)
+            ):
+                report.error(number, ["technologies must be a list of slugs."])
+            else:
+                parsed.append((number, record, tech_slugs))
+        if not parsed:
+            return
+        existing = {
+            p.slug: p
+            for p in Project.objects.filter(
+                slug__in=[r["slug"] for _, r, _ in parsed if isinstance(r.get("slug"), str)]
+            )
+        }
+
+        valid = []
+        slugs = {}
+        for number, record, tech_slugs in parsed:
+            slug = record.get("slug")
+            if isinstance(slug, str) and slug in existing:
+                # Updates only write the fields the record carries; the rest,
+                # and the technology links when omitted, are left as stored.
+                project = copy.copy(existing[slug])
+                fields = tuple(f for f in PROJECT_FIELDS if f in record and f != "slug")
+                for field in fields:
+                    setattr(project, field, record[field])
+            else:
+                project = Project(**record)
+                fields = None
+            try:
+                project.full_clean(validate_unique=False)
+            except (ValidationError, TypeError) as exc:
+                messages = _messages(exc) if isinstance(exc, ValidationError) else [str(exc)]
+                report.error(number, messages)
+                continue
+            if project.slug:
+                if project.slug in slugs:
+                    report.error(number, [f"slug: '{project.slug}' appears twice in this batch."])
+                    continue
+                slugs[project.slug] = number
+            valid.append((number, project, fields, tech_slugs))
+        if not valid:
+            return
+
+        wanted_techs = {slug for _, _, _, tech_slugs in valid for slug in tech_slugs or []}
+        tech_ids = dict(
+            Technology.objects.filter(slug__in=wanted_techs).values_list("slug", "pk")
+        )
+
+        to_create, to_update, links = [], defaultdict(list), {}
+        for number, project, fields, tech_slugs in valid:
+            missing = sorted(set(tech_slugs or []) - set(tech_ids))
+            if missing:
+                report.error(number, [f"technologies: unknown slugs {missing}."])
+                continue
+            if fields is None:
+                to_create.append(project)
+                tech_slugs = tech_slugs or []
+            else:
+                project.updated_at = timezone.now()
+                to_update[fields].append(project)
+            if tech_slugs is not None:
+                links[id(project)] = [tech_ids[s] for s in tech_slugs]
+
+        unslugged = [p for p in to_create if not p.slug]
+        for project, slug in zip(
+            unslugged,
+            allocate_slugs(
+                Project,
+                [p.title for p in unslugged],
+                reserved={p.slug for p in to_create if p.slug},
+            ),
+        ):
+            project.slug = slug
+        Project.objects.bulk_create(to_create)
+        for fields, projects in to_update.items():
+            Project.objects.bulk_update(projects, [*fields, "updated_at"])
+
+        updated = [p for projects in to_update.values() for p in projects]
+        written = to_create + updated
+        through = Project.technologies.through
+        through.objects.filter(project_id__in=[p.pk for p in updated if id(p) in links]).delete()
+        through.objects.bulk_create(
+            [
+                through(project_id=p.pk, technology_id=tech_id)
+                for p in written
+                for tech_id in links.get(id(p), [])
+            ],
+            ignore_conflicts=True,
+        )
+        rebuild_cards([p.pk for p in written])
+        index_projects(written)
+        report.created["project"] += len(to_create)
+        report.updated["project"] += len(updated)
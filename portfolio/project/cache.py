@@ -0,0 +1,153 @@
+"""Versioned response cache for the read-only Project API.
+
+Cached payloads are keyed by a global content version. Any write to the
+project domain bumps the version (see ``signals.py``), so stale entries are
+never read again and simply expire from the backend.
+"""
+
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+VERSION_KEYS = {
+    "content": "project:content-version",
+    "technology": "project:technology-version",
+}
+STATS_KEYS = {"hits": "project:cache-stats:hits", "misses": "project:cache-stats:misses"}
+
+
+def get_cache():
+    return caches[getattr(settings, "PROJECT_API_CACHE_ALIAS", "default")]
+
+
+def get_version(name):
+    cache = get_cache()
+    key = VERSION_KEYS[name]
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted counter never restarts at a value
+        # that older cached entries were written under.
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(name):
+    cache = get_cache()
+    key = VERSION_KEYS[name]
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, int(time.time() * 1000), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(name):
+    try:
+        return get_cache().incr(VERSION_KEYS[name])
+    except ValueError:
+        return get_version(name)
+
+
+def get_content_version():
+    """Version of everything the Project API renders; bumped on every domain write."""
+    return get_version("content")
+
+
+async def aget_content_version():
+    return await aget_version("content")
+
+
+def bump_content_version():
+    return bump_version("content")
+
+
+def get_technology_version():
+    """Version of technology names and project/technology links, which ``updated_at`` misses."""
+    return get_version("technology")
+
+
+async def aget_technology_version():
+    return await aget_version("technology")
+
+
+def bump_technology_version():
+    return bump_version("technology")
+
+
+def _incr(key):
+    cache = get_cache()
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+async def _aincr(key):
+    cache = get_cache()
+    await cache.aadd(key, 0, timeout=None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        pass
+
+
+def get_cache_stats():
+    cache = get_cache()
+    return {name: cache.get(key, 0) for name, key in STATS_KEYS.items()}
+
+
+def reset_cache_stats():
+    get_cache().delete_many(list(STATS_KEYS.values()))
+
+
+class ProjectResponseCache:
+    """Stores serialized response data under ``(kind, params, content version)``."""
+
+    prefix = "project:response"
+
+    @property
+    def timeout(self):
+        return getattr(settings, "PROJECT_API_CACHE_TIMEOUT", 3600)
+
+    @property
+    def enabled(self):
+        return self.timeout != 0
+
+    def _digest(self, params, request):
+        # Payloads embed absolute media URLs, so the host is part of the key.
+        host = request.build_absolute_uri("/") if request is not None else ""
+        raw = json.dumps({"host": host, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def make_key(self, kind, params, request=None):
+        return f"{self.prefix}:{get_content_version()}:{kind}:{self._digest(params, request)}"
+
+    def get(self, key):
+        data = get_cache().get(key)
+        _incr(STATS_KEYS["misses" if data is None else "hits"])
+        return data
+
+    def set(self, key, data):
+        get_cache().set(key, data, timeout=self.timeout)
+
+    # Async counterparts for the ASGI views.
+
+    async def amake_key(self, kind, params, request=None):
+        version = await aget_content_version()
+        return f"{self.prefix}:{version}:{kind}:{self._digest(params, request)}"
+
+    async def aget(self, key):
+        data = await get_cache().aget(key)
+        await _aincr(STATS_KEYS["misses" if data is None else "hits"])
+        return data
+
+    async def aset(self, key, data):
+        await get_cache().aset(key, data, timeout=self.timeout)
+
+
+response_cache = ProjectResponseCache()
@@ -0,0 +1,111 @@
+"""ETag / Last-Modified validators for the Project API.
+
+Validators are computed with a single aggregate query so conditional
+requests can be answered before any prefetching or serialization runs.
+"""
+
+import hashlib
+import json
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .cache import (
+    aget_technology_version,
+    get_content_version,
+    get_technology_version,
+)
+from .models import Project
+
+
+def make_etag(*parts):
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return '"%s"' % hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def not_modified(request, etag, last_modified):
+    """The 304/412 response for ``request``'s conditional headers, or ``None``."""
+    if etag is None:
+        return None
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def add_validators(response, etag, last_modified):
+    if etag is not None and response.status_code in (200, 304):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        # Clients must revalidate rather than reuse a heuristically fresh copy.
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value is not None else None
+
+
+def _list_stats(queryset):
+    return queryset.order_by(), {"last_modified": Max("updated_at"), "count": Count("pk")}
+
+
+def _list_etag(params, stats, technology_version):
+    etag = make_etag(
+        "list", params, stats["last_modified"], stats["count"], technology_version
+    )
+    return etag, _timestamp(stats["last_modified"])
+
+
+def list_validators(queryset, params):
+    """Validators for a filtered list: newest ``updated_at``, row count, technology version."""
+    queryset, aggregates = _list_stats(queryset)
+    return _list_etag(params, queryset.aggregate(**aggregates), get_technology_version())
+
+
+async def alist_validators(queryset, params):
+    queryset, aggregates = _list_stats(queryset)
+    stats = await queryset.aaggregate(**aggregates)
+    return _list_etag(params, stats, await aget_technology_version())
+
+
+def version_validators(params):
+    """Query-free validators from the content version; no ``Last-Modified``."""
+    return make_etag("list", params, get_content_version()), None
+
+
+def _detail_row(slug):
+    return (
+        Project.objects.filter(slug=slug)
+        .order_by()
+        .values("pk", "updated_at")
+        .annotate(image_count=Count("images"), last_image=Max("images__id"))
+    )
+
+
+def _detail_etag(row, technology_version, params):
+    if row is None:
+        return None, None
+    parts = [
+        row["pk"],
+        row["updated_at"],
+        row["image_count"],
+        row["last_image"],
+        technology_version,
+    ]
+    if params:
+        # A sparse representation (fieldsets.py) is a different entity.
+        parts.append(params)
+    return make_etag("detail", *parts), _timestamp(row["updated_at"])
+
+
+def detail_validators(slug, params=None):
+    """Validators for one project, or ``(None, None)`` when the slug does not exist.
+
+    ``params`` identifies a non-default representation, e.g. ``?fields=``.
+    """
+    return _detail_etag(_detail_row(slug).first(), get_technology_version(), params)
+
+
+async def adetail_validators(slug, params=None):
+    row = await _detail_row(slug).afirst()
+    return _detail_etag(row, await aget_technology_version(), params)
@@ -14,6 +14,16 @@ class ProjectStatus:
     VALUES = {c[0] for c in CHOICES}
 
 
+class TechnologyMatch:
+    """How a multi-technology filter combines slugs."""
+
+    ANY = "any"
+    ALL = "all"
+
+    DEFAULT = ANY
+    VALUES = {ANY, ALL}
+
+
 class TechnologyCategory:
     FRONTEND = "frontend"
     BACKEND = "backend"
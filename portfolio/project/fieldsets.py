@@ -0,0 +1,151 @@
+"""Sparse fieldsets (``?fields=``) and embed control (``?expand=``) for the Project API.
+
+``?fields=slug,title,thumbnail`` returns only those keys, in the usual key
+order. The SELECT list is trimmed to match, so a card that needs no JSON
+columns never reads them. Relations not requested are not prefetched.
+
+``?expand=`` names the relations rendered as full objects. The others are
+collapsed to identifiers: technologies to their slugs, images to their
+URLs. Without ``expand`` every relation is expanded, and without either
+parameter responses are unchanged. Unknown names are a 400.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
+
+from .models import Project, ProjectImage, Technology
+from .serializers import ProjectDetailSerializer, ProjectListSerializer
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+# Columns each list field reads; ``card__`` columns come from ProjectCard.
+LIST_COLUMNS = {
+    "short_description": ["card__short_description"],
+    "technologies": ["card__technologies"],
+    "thumbnail": ["card__thumbnail", "card__thumbnail_derivatives"],
+    "thumbnail_srcset": ["card__thumbnail_derivatives"],
+}
+LIST_EXPANDABLE = ("technologies",)
+DETAIL_EXPANDABLE = ("technologies", "images")
+# Detail fields that are relations, not columns.
+DETAIL_RELATIONS = DETAIL_EXPANDABLE
+
+
+def _split(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class FieldSelection:
+    """The fields and expanded relations one request asked for."""
+
+    def __init__(self, available, expandable, fields=None, expand=None):
+        self.available = list(available)
+        self.expandable = list(expandable)
+        if fields is None:
+            self.fields = list(self.available)
+        else:
+            self.fields = [name for name in self.available if name in set(fields)]
+        self.expand = set(self.expandable if expand is None else expand)
+
+    @classmethod
+    def from_query_params(cls, query_params, available, expandable):
+        fields = expand = None
+        errors = {}
+        if FIELDS_PARAM in query_params:
+            fields = _split(query_params.get(FIELDS_PARAM))
+            unknown = sorted(set(fields) - set(available))
+            if unknown or not fields:
+                problem = f"Unknown field(s): {', '.join(unknown)}." if unknown else "No fields given."
+                errors[FIELDS_PARAM] = [f"{problem} Choose from: {', '.join(available)}."]
+        if EXPAND_PARAM in query_params:
+            expand = _split(query_params.get(EXPAND_PARAM))
+            unknown = sorted(set(expand) - set(expandable))
+            if unknown:
+                errors[EXPAND_PARAM] = [
+                    f"Unknown relation(s): {', '.join(unknown)}. "
+                    f"Choose from: {', '.join(expandable)}."
+                ]
+        if errors:
+            raise ValidationError(errors)
+        return cls(available, expandable, fields, expand)
+
+    def includes(self, name):
+        return name in self.fields
+
+    def expanded(self, name):
+        return name in self.expand
+
+    def as_params(self):
+        """Canonical form for cache keys and ETags; empty for the default representation."""
+        expand = sorted(name for name in self.expand if name in self.fields)
+        collapsed = [name for name in self.expandable if name in self.fields and name not in expand]
+        if self.fields == self.available and not collapsed:
+            return {}
+        return {FIELDS_PARAM: self.fields, EXPAND_PARAM: expand}
+
+
+def list_selection(query_params):
+    return FieldSelection.from_query_params(
+        query_params, ProjectListSerializer.Meta.fields, LIST_EXPANDABLE
+    )
+
+
+def detail_selection(query_params):
+    return FieldSelection.from_query_params(
+        query_params, ProjectDetailSerializer.Meta.fields, DETAIL_EXPANDABLE
+    )
+
+
+def list_columns(selection):
+    """Project and ``card__`` columns the selected list fields read."""
+    columns = []
+    for name in selection.fields:
+        for column in LIST_COLUMNS.get(name, [name]):
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def ordering_columns(queryset):
+    """Model columns in ``queryset``'s ordering, which keyset cursors read."""
+    columns = []
+    for field in queryset.query.order_by:
+        name = str(field).lstrip("-")
+        try:
+            Project._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue  # pk alias or an annotation such as search_rank
+        columns.append(name)
+    return columns
+
+
+def trim_list_queryset(queryset, selection):
+    """``queryset`` loading only the columns the selected list fields need."""
+    columns = list_columns(selection)
+    if not any(column.startswith("card__") for column in columns):
+        queryset = queryset.select_related(None)
+    return queryset.only(*columns, *ordering_columns(queryset))
+
+
+def detail_columns(selection):
+    return [name for name in selection.fields if name not in DETAIL_RELATIONS]
+
+
+def trim_detail_queryset(queryset, selection):
+    """``queryset`` with only the selected detail columns and the relations they render."""
+    lookups = []
+    if selection.includes("technologies"):
+        lookups.append(
+            "technologies"
+            if selection.expanded("technologies")
+            else Prefetch("technologies", queryset=Technology.objects.only("id", "slug"))
+        )
+    if selection.includes("images"):
+        lookups.append(
+            "images"
+            if selection.expanded("images")
+            else Prefetch("images", queryset=ProjectImage.objects.only("id", "project", "image"))
+        )
+    return queryset.only(*detail_columns(selection)).prefetch_related(*lookups)
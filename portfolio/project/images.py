@@ -0,0 +1,176 @@
+"""Responsive derivatives (resized WebP/JPEG copies) of ``ProjectImage`` uploads.
+
+Derivatives are stored next to the original with content-hashed names, for
+example ``projects/2026/02/home.card.3f9a1c2b7d4e.webp``, and recorded on
+``ProjectImage.derivatives``::
+
+    {
+        "source": "projects/2026/02/home.png",
+        "sizes": {
+            "card": {"width": 768, "height": 432,
+                     "webp": "projects/2026/02/home.card.<hash>.webp",
+                     "jpeg": "projects/2026/02/home.card.<hash>.jpg"},
+            ...
+        },
+    }
+
+``render_derivatives`` is a pure bytes-in/bytes-out function so it can run
+in a worker process; storage access stays in the caller.
+"""
+
+import hashlib
+import io
+import posixpath
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Name -> maximum width in pixels. Images are never upscaled.
+DERIVATIVE_SIZES = {"thumbnail": 320, "card": 768, "full": 1600}
+# Format key -> (Pillow format, file extension, save options).
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+HASH_LENGTH = 12
+
+
+def render_derivatives(data):
+    """Resize and encode ``data``; returns ``{size: {"width", "height", "files": {fmt: bytes}}}``.
+
+    Raises ``ValueError`` when ``data`` is not a readable image.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as original:
+            original = ImageOps.exif_transpose(original)
+            original.load()
+    except (UnidentifiedImageError, OSError) as exc:
+        raise ValueError(f"Unreadable image: {exc}") from exc
+
+    has_alpha = original.mode in ("RGBA", "LA") or "transparency" in original.info
+    rendered = {}
+    for size, max_width in DERIVATIVE_SIZES.items():
+        image = original.copy()
+        if image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+        files = {}
+        for fmt, (pil_format, _ext, options) in DERIVATIVE_FORMATS.items():
+            if pil_format == "JPEG" or not has_alpha:
+                frame = _flatten(image) if has_alpha else image.convert("RGB")
+            else:
+                frame = image.convert("RGBA")
+            buffer = io.BytesIO()
+            frame.save(buffer, pil_format, **options)
+            files[fmt] = buffer.getvalue()
+        rendered[size] = {"width": image.width, "height": image.height, "files": files}
+    return rendered
+
+
+def _flatten(image):
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    rgba = image.convert("RGBA")
+    background.paste(rgba, mask=rgba.getchannel("A"))
+    return background
+
+
+def store_derivatives(source_name, rendered, storage=default_storage):
+    """Save rendered files next to ``source_name``; returns the ``derivatives`` value."""
+    directory, filename = posixpath.split(source_name)
+    stem = posixpath.splitext(filename)[0]
+    sizes = {}
+    for size, result in rendered.items():
+        entry = {"width": result["width"], "height": result["height"]}
+        for fmt, content in result["files"].items():
+            ext = DERIVATIVE_FORMATS[fmt][1]
+            digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+            name = posixpath.join(directory, f"{stem}.{size}.{digest}.{ext}")
+            if not storage.exists(name):
+                name = storage.save(name, ContentFile(content))
+            entry[fmt] = name
+        sizes[size] = entry
+    return {"source": source_name, "sizes": sizes}
+
+
+def derivative_names(derivatives):
+    return {
+        name
+        for entry in (derivatives or {}).get("sizes", {}).values()
+        for fmt, name in entry.items()
+        if fmt in DERIVATIVE_FORMATS
+    }
+
+
+def delete_derivatives(derivatives, keep=(), storage=default_storage):
+    """Delete derivative files once the current transaction commits."""
+    names = derivative_names(derivatives) - set(keep)
+    if names:
+        transaction.on_commit(lambda: [storage.delete(name) for name in names])
+
+
+def needs_derivatives(image):
+    return bool(image.image) and (image.derivatives or {}).get("source") != image.image.name
+
+
+def build_derivatives(source_name, storage=default_storage):
+    """Render and store derivatives for a stored original; ``{"source": ...}`` if unreadable."""
+    try:
+        with storage.open(source_name, "rb") as fh:
+            data = fh.read()
+        rendered = render_derivatives(data)
+    except (OSError, ValueError):
+        # Recorded with no sizes so the same broken upload is not retried on every save.
+        return {"source": source_name, "sizes": {}}
+    return store_derivatives(source_name, rendered, storage)
+
+
+def apply_derivatives(image, derivatives, storage=default_storage):
+    """Record ``derivatives`` on ``image`` and delete files it no longer uses.
+
+    Uses ``update()`` so no save signals are sent; callers refresh the
+    project's ``updated_at``, card and cache version.
+    """
+    from .models import ProjectImage
+
+    previous = image.derivatives
+    ProjectImage.objects.filter(pk=image.pk).update(derivatives=derivatives)
+    image.derivatives = derivatives
+    delete_derivatives(previous, keep=derivative_names(derivatives), storage=storage)
+
+
+def generate_derivatives(image, force=False, storage=default_storage):
+    """Build and record derivatives for ``image``; returns True when they changed."""
+    if not force and not needs_derivatives(image):
+        return False
+    apply_derivatives(image, build_derivatives(image.image.name, storage), storage)
+    return True
+
+
+def variants(derivatives, build_url, sizes=None):
+    """``{size: {"width", "height", fmt: url}}`` for the stored sizes, narrowest first."""
+    stored = (derivatives or {}).get("sizes") or {}
+    entries = sorted(
+        ((size, entry) for size, entry in stored.items() if sizes is None or size in sizes),
+        key=lambda item: item[1]["width"],
+    )
+    return {
+        size: {
+            "width": entry["width"],
+            "height": entry["height"],
+            **{fmt: build_url(entry[fmt]) for fmt in DERIVATIVE_FORMATS if fmt in entry},
+        }
+        for size, entry in entries
+    }
+
+
+def srcset(derivatives, build_url, sizes=None):
+    """``{fmt: "url 320w, url 768w, ..."}`` ready for ``<source srcset>``; ``None`` if not built."""
+    by_size = variants(derivatives, build_url, sizes)
+    if not by_size:
+        return None
+    return {
+        fmt: ", ".join(f"{entry[fmt]} {entry['width']}w" for entry in by_size.values() if fmt in entry)
+        for fmt in DERIVATIVE_FORMATS
+    }
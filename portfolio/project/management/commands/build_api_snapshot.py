@@ -0,0 +1,44 @@
+"""Write the public Project API as static, precompressed JSON files."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from project import snapshots
+
+
+class Command(BaseCommand):
+    help = (
+        "Write list pages, project details and the technology catalog as content-hashed, "
+        "precompressed JSON files with a manifest. Only documents whose source rows changed "
+        "since the last manifest are rewritten."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", "-o", help="Snapshot directory (default: settings.API_SNAPSHOT_ROOT)."
+        )
+        parser.add_argument(
+            "--full", action="store_true", help="Render every document, ignoring the previous manifest."
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete files that only the previous manifest referenced.",
+        )
+        parser.add_argument("--no-brotli", action="store_true", help="Write gzip copies only.")
+
+    def handle(self, *args, output=None, full=False, prune=False, no_brotli=False, **options):
+        if not no_brotli and snapshots.brotli is None:
+            self.stderr.write("brotli is not installed; writing gzip copies only.")
+        builder = snapshots.build_snapshot(
+            output or settings.API_SNAPSHOT_ROOT,
+            compress_brotli=not no_brotli,
+            full=full,
+            prune=prune,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Snapshot in {builder.root}: {builder.written} document(s) written, "
+                f"{builder.reused} unchanged, {len(builder.removed)} stale file(s) removed."
+            )
+        )
@@ -0,0 +1,28 @@
+"""Export projects and technologies as NDJSON."""
+
+import json
+import sys
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from project.bulk import export_records
+
+
+class Command(BaseCommand):
+    help = "Stream every technology and project as NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", "-o", help="File to write (default: stdout).")
+
+    def handle(self, *args, output=None, **options):
+        fh = open(output, "w", encoding="utf-8") if output else sys.stdout
+        count = 0
+        try:
+            for record in export_records():
+                fh.write(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n")
+                count += 1
+        finally:
+            if output:
+                fh.close()
+        self.stderr.write(f"Exported {count} record(s).")
@@ -0,0 +1,48 @@
+"""Import projects and technologies from NDJSON."""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from project.bulk import ProjectImporter
+
+
+class Command(BaseCommand):
+    help = "Import technologies and projects from an NDJSON file (or - for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON file to read, or - for stdin.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Validate and write, then roll back."
+        )
+        parser.add_argument(
+            "--fail-on-error",
+            action="store_true",
+            help="Exit non-zero when any record is rejected.",
+        )
+
+    def handle(self, *args, path, batch_size=500, dry_run=False, fail_on_error=False, **options):
+        importer = ProjectImporter(batch_size=batch_size, dry_run=dry_run)
+        if path == "-":
+            report = importer.run(sys.stdin)
+        else:
+            with open(path, encoding="utf-8") as fh:
+                report = importer.run(fh)
+
+        for error in report.errors:
+            for message in error["errors"]:
+                self.stderr.write(f"line {error['line']}: {message}")
+        self.stdout.write(
+            f"{report.records} record(s) in {report.elapsed:.2f}s "
+            f"({report.throughput:.0f} records/s): "
+            f"technologies {report.created['technology']} created, "
+            f"{report.updated['technology']} updated; "
+            f"projects {report.created['project']} created, "
+            f"{report.updated['project']} updated; "
+            f"{len(report.errors)} rejected."
+        )
+        if dry_run:
+            self.stdout.write("Dry run: all changes rolled back.")
+        if fail_on_error and report.errors:
+            raise CommandError(f"{len(report.errors)} record(s) rejected.")
@@ -0,0 +1,37 @@
+"""Backfill or verify the denormalized ProjectCard projection."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from project.cache import bump_content_version
+from project.projections import rebuild_cards, verify_cards
+
+
+class Command(BaseCommand):
+    help = "Rebuild ProjectCard rows from projects, or verify they are up to date."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report missing or stale cards; exit non-zero if any are found.",
+        )
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Limit the rebuild to this project id (repeatable).",
+        )
+
+    def handle(self, *args, verify=False, project_ids=None, **options):
+        if verify:
+            problems = verify_cards()
+            for project_id, reason in sorted(problems.items()):
+                self.stdout.write(f"project {project_id}: {reason}")
+            if problems:
+                raise CommandError(f"{len(problems)} project card(s) need a rebuild.")
+            self.stdout.write(self.style.SUCCESS("All project cards are up to date."))
+            return
+        count = rebuild_cards(project_ids)
+        bump_content_version()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} project card(s)."))
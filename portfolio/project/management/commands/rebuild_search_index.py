@@ -0,0 +1,19 @@
+"""Rebuild the project full-text search index."""
+
+from django.core.management.base import BaseCommand
+
+from project.search import rebuild_index, uses_fts
+
+
+class Command(BaseCommand):
+    help = "Re-index every project in the FTS5 search table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, database="default", **options):
+        if not uses_fts(database):
+            self.stdout.write("No full-text index on this database; search uses icontains.")
+            return
+        count = rebuild_index(database)
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} project(s)."))
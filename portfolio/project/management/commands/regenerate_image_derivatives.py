@@ -0,0 +1,109 @@
+"""(Re)build responsive derivatives for ProjectImage uploads."""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from project.cache import bump_content_version
+from project.images import apply_derivatives, needs_derivatives, render_derivatives, store_derivatives
+from project.models import Project, ProjectImage
+from project.projections import rebuild_cards
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP/JPEG derivatives for project images across a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes used for resizing (default: CPU count; 1 runs inline).",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild derivatives even for images that are already up to date.",
+        )
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Limit to images of this project id (repeatable).",
+        )
+
+    def handle(self, *args, workers=1, force=False, project_ids=None, **options):
+        images = ProjectImage.objects.exclude(image="").order_by("pk")
+        if project_ids:
+            images = images.filter(project_id__in=project_ids)
+        pending = [image for image in images if force or needs_derivatives(image)]
+
+        built = failed = 0
+        for image, rendered in self.render(pending, max(1, workers)):
+            if rendered is None:
+                failed += 1
+                self.stderr.write(f"image {image.pk}: unreadable {image.image.name}")
+                derivatives = {"source": image.image.name, "sizes": {}}
+            else:
+                built += 1
+                derivatives = store_derivatives(image.image.name, rendered)
+            apply_derivatives(image, derivatives)
+
+        if pending:
+            project_ids = {image.project_id for image in pending}
+            Project.objects.filter(pk__in=project_ids).update(updated_at=timezone.now())
+            rebuild_cards(project_ids)
+            bump_content_version()
+        self.stdout.write(
+            self.style.SUCCESS(f"Built derivatives for {built} image(s); {failed} unreadable.")
+        )
+
+    def render(self, images, workers):
+        """Yield ``(image, rendered or None)``; originals are read here, resized in workers."""
+        if workers == 1:
+            for image in images:
+                yield image, self.render_one(image)
+            return
+        # Bound the number of originals held in memory at once.
+        limit = workers * 2
+        queue = iter(images)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while True:
+                for image in queue:
+                    data = self.read(image)
+                    if data is None:
+                        yield image, None
+                        continue
+                    running[pool.submit(render_derivatives, data)] = image
+                    if len(running) >= limit:
+                        break
+                if not running:
+                    return
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    image = running.pop(future)
+                    try:
+                        yield image, future.result()
+                    except ValueError:
+                        yield image, None
+
+    def read(self, image):
+        try:
+            with default_storage.open(image.image.name, "rb") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def render_one(self, image):
+        data = self.read(image)
+        if data is None:
+            return None
+        try:
+            return render_derivatives(data)
+        except ValueError:
+            return None
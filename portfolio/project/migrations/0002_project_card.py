@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-18 17:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0001_project_domain'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectCard',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='project.project')),
+                ('short_description', models.TextField(blank=True)),
+                ('thumbnail', models.CharField(blank=True, max_length=255)),
+                ('technologies', models.JSONField(blank=True, default=list)),
+                ('source_updated_at', models.DateTimeField()),
+            ],
+        ),
+    ]
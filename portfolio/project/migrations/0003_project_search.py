@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from project.search import FTS_TABLE, create_fts_table, index_projects
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite" or not create_fts_table(connection):
+        return
+    Project = apps.get_model("project", "Project")
+    index_projects(Project.objects.using(connection.alias).all(), connection.alias)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0002_project_card'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from project.postgres import create_indexes, drop_indexes
+
+
+def forwards(apps, schema_editor):
+    create_indexes(schema_editor)
+
+
+def backwards(apps, schema_editor):
+    drop_indexes(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -1,16 +1,12 @@
 """Project domain models."""
 
 from django.db import models
-from django.utils.text import slugify
 
 from .constants import ProjectStatus, TechnologyCategory
 from .querysets import ProjectManager
-from .validators import (
-    validate_optional_https_url,
-    validate_architecture_structure,
-    validate_string_list,
-    validate_challenges_solutions,
-)
+from .schema import PROJECT_JSON_SCHEMA
+from .slugs import save_with_unique_slug
+from .validators import validate_optional_https_url
 
 
 class Technology(models.Model):
@@ -31,9 +27,7 @@ class Technology(models.Model):
         return self.name
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+        save_with_unique_slug(self, self.name, lambda: super(Technology, self).save(*args, **kwargs))
 
 
 class Project(models.Model):
@@ -70,47 +64,38 @@ class Project(models.Model):
     def __str__(self):
         return self.title
 
-    def _normalize_technical_challenges_solutions(self):
-        if not self.technical_challenges_solutions or not isinstance(
-            self.technical_challenges_solutions, list
-        ):
-            return
-        normalized = []
-        for i, item in enumerate(self.technical_challenges_solutions):
-            if item is None:
-                continue
-            if isinstance(item, dict):
-                challenge = item.get("challenge") or item.get("Challenge")
-                solution = item.get("solution") or item.get("Solution")
-                if challenge is not None and solution is not None:
-                    normalized.append(
-                        {"challenge": str(challenge), "solution": str(solution)}
-                    )
-                continue
-            if isinstance(item, (list, tuple)) and len(item) == 2:
-                normalized.append(
-                    {"challenge": str(item[0]), "solution": str(item[1])}
-                )
-                continue
-        self.technical_challenges_solutions = normalized
+    @property
+    def first_image(self):
+        """First image by gallery order; reads the ``images`` prefetch cache when present."""
+        return next(iter(self.images.all()), None)
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base = slugify(self.title)
-            slug = base
-            n = 0
-            while Project.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                n += 1
-                slug = f"{base}-{n}"
-            self.slug = slug
-        self._normalize_technical_challenges_solutions()
-        validate_string_list(self.key_features, "key_features")
-        validate_string_list(self.future_enhancements, "future_enhancements")
-        validate_challenges_solutions(self.technical_challenges_solutions)
-        if self.architectural_overview:
-            validate_architecture_structure(self.architectural_overview)
-        self.full_clean()
-        super().save(*args, **kwargs)
+    def validate_json_fields(self):
+        """Normalize and validate the JSON fields in one pass; raises ValidationError keyed by field."""
+        cleaned = PROJECT_JSON_SCHEMA.validate(
+            {name: getattr(self, name) for name in PROJECT_JSON_SCHEMA.fields}
+        )
+        for name, value in cleaned.items():
+            setattr(self, name, value)
+
+    def clean(self):
+        super().clean()
+        self.validate_json_fields()
+
+    def save(self, *args, validated=False, **kwargs):
+        """Validate (``full_clean``, which includes the JSON fields) and save.
+
+        Pass ``validated=True`` when the instance has just been through
+        ``full_clean``, e.g. from a ModelForm, to skip doing it again.
+        """
+        # A generated slug is kept unique by save_with_unique_slug, not full_clean.
+        exclude = None if self.slug else ["slug"]
+
+        def save():
+            if not validated:
+                self.full_clean(exclude=exclude)
+            super(Project, self).save(*args, **kwargs)
+
+        save_with_unique_slug(self, self.title, save)
 
 
 class ProjectImage(models.Model):
@@ -118,9 +103,29 @@ class ProjectImage(models.Model):
     image = models.ImageField(upload_to="projects/%Y/%m/")
     caption = models.CharField(max_length=255, blank=True)
     order = models.PositiveIntegerField(default=0)
+    # Resized WebP/JPEG copies of ``image``; see ``images.py`` for the layout.
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     class Meta:
         ordering = ["order", "id"]
 
     def __str__(self):
         return self.caption or f"Image for {self.project.title}"
+
+
+class ProjectCard(models.Model):
+    """Denormalized list row for a project, maintained by ``projections.py``."""
+
+    project = models.OneToOneField(
+        Project, on_delete=models.CASCADE, primary_key=True, related_name="card"
+    )
+    short_description = models.TextField(blank=True)
+    thumbnail = models.CharField(max_length=255, blank=True)
+    # The first image's ``ProjectImage.derivatives``.
+    thumbnail_derivatives = models.JSONField(default=dict, blank=True)
+    # [[slug, name, category], ...] in Technology.Meta.ordering order.
+    technologies = models.JSONField(default=list, blank=True)
+    source_updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Card for {self.project_id}"
@@ -0,0 +1,131 @@
+"""Pagination classes for the Project API."""
+
+import base64
+import binascii
+import json
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class ProjectKeysetPagination(BasePagination):
+    """Opt-in keyset pagination (``?pagination=cursor``).
+
+    Pages are selected with a ``WHERE (ordering columns) > (last row)`` filter
+    over the queryset's own ``order_by``, so there is no ``COUNT(*)`` and no
+    OFFSET scan. The ordering must be total (end with the primary key), which
+    ``ProjectQuerySet``'s ``ordered_by_*`` methods guarantee.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    mode_query_param = "pagination"
+    mode_value = "cursor"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    @classmethod
+    def is_requested(cls, request):
+        params = request.query_params
+        return params.get(cls.mode_query_param) == cls.mode_value or cls.cursor_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.model = queryset.model
+        self.annotations = queryset.query.annotations
+        self.ordering = [str(f) for f in queryset.query.order_by]
+        if not self.ordering or self.ordering[-1].lstrip("-") not in ("id", "pk"):
+            raise ValueError("Keyset pagination requires an ordering ending with the primary key.")
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self.after(cursor))
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        page = rows[: self.page_size]
+        self.last = page[-1] if page else None
+        return page
+
+    def after(self, values):
+        """Q matching rows strictly after ``values`` in ``self.ordering``."""
+        condition = Q()
+        for i, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            clause = Q(**{f"{name}__{lookup}": values[i]})
+            for prev, value in zip(self.ordering[:i], values):
+                clause &= Q(**{prev.lstrip("-"): value})
+            condition |= clause
+        return condition
+
+    def _field(self, name):
+        """Model field for an ordering column, or ``None`` for an annotation."""
+        if name == "pk":
+            return self.model._meta.pk
+        try:
+            return self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+    def encode_cursor(self, obj):
+        if isinstance(obj, dict):
+            # A ``.values()`` row (see rows.py) carrying the ordering columns.
+            obj = SimpleNamespace(**obj)
+        values = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            model_field = self._field(name)
+            if model_field is None:
+                # Annotations (e.g. search_rank) are JSON-native scalars.
+                values.append(getattr(obj, name))
+            else:
+                values.append(model_field.value_to_string(obj))
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            decoded = []
+            for field, value in zip(self.ordering, values):
+                name = field.lstrip("-")
+                model_field = self._field(name)
+                if model_field is None:
+                    model_field = self.annotations[name].output_field
+                value = model_field.to_python(value)
+                if value is None:
+                    raise ValueError
+                decoded.append(value)
+            return decoded
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.mode_query_param, self.mode_value)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.last))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,76 @@
+"""PostgreSQL-only indexes and search expressions for ``Project``.
+
+The JSON columns get GIN indexes: ``jsonb_path_ops`` for the list fields,
+which are only ever probed with containment (``@>``), and the default
+``jsonb_ops`` for ``architectural_overview``, which also serves key
+existence (``?``). The full-text document is an expression index;
+``search.py`` and ``ProjectQuerySet.architecture_uses`` build their
+predicates from the same expressions so the planner can use them.
+Nothing here runs on other backends.
+"""
+
+SEARCH_CONFIG = "'english'::regconfig"
+
+
+def search_document(table=None):
+    """The weighted ``tsvector`` indexed by ``project_search_gin``.
+
+    Weights mirror ``search.FTS_WEIGHTS``: title > description >
+    problem/features > role/challenges. ``table`` qualifies the columns for
+    use in a joined query.
+    """
+    col = (lambda name: f'"{table}"."{name}"') if table else (lambda name: name)
+    return (
+        f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce({col('title')}, '')), 'A') || "
+        f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce({col('description')}, '')), 'B') || "
+        f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce({col('problem_statement')}, '')) || "
+        f"{_strings(col('key_features'), '[]')}, 'C') || "
+        f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce({col('my_role')}, '')) || "
+        f"{_strings(col('technical_challenges_solutions'), '[]')}, 'D')"
+    )
+
+
+def architecture_document(table=None):
+    """``tsvector`` over the string values of ``architectural_overview``."""
+    column = f'"{table}"."architectural_overview"' if table else "architectural_overview"
+    return _strings(column, "{}")
+
+
+def _strings(column, empty):
+    return f"jsonb_to_tsvector({SEARCH_CONFIG}, coalesce({column}, '{empty}'::jsonb), '[\"string\"]')"
+
+
+INDEXES = {
+    "project_key_features_gin": "USING gin (key_features jsonb_path_ops)",
+    "project_challenges_gin": "USING gin (technical_challenges_solutions jsonb_path_ops)",
+    "project_architecture_gin": "USING gin (architectural_overview)",
+    "project_enhancements_gin": "USING gin (future_enhancements jsonb_path_ops)",
+    "project_search_gin": f"USING gin (({search_document()}))",
+    "project_architecture_search_gin": f"USING gin (({architecture_document()}))",
+}
+TABLE = "project_project"
+
+
+def is_postgres(connection):
+    return connection.vendor == "postgresql"
+
+
+def create_indexes(schema_editor):
+    if not is_postgres(schema_editor.connection):
+        return
+    for name, definition in INDEXES.items():
+        schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {TABLE} {definition}")
+
+
+def drop_indexes(schema_editor):
+    if not is_postgres(schema_editor.connection):
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def build_tsquery(tokens):
+    """``to_tsquery`` input: every token required, the last one as a prefix."""
+    if not tokens:
+        return None
+    return " & ".join(tokens) + ":*"
@@ -0,0 +1,78 @@
+"""Denormalized ``ProjectCard`` rows backing the Project list API.
+
+A card holds everything ``ProjectListSerializer`` needs beyond the project
+row itself (short description, thumbnail path, technology triples), so a
+list page is a single ``Project``/``ProjectCard`` join instead of three
+queries plus per-row work.
+"""
+
+from .models import Project, ProjectCard
+
+SHORT_DESCRIPTION_LENGTH = 200
+CARD_FIELDS = [
+    "short_description",
+    "thumbnail",
+    "thumbnail_derivatives",
+    "technologies",
+    "source_updated_at",
+]
+
+
+def shorten_description(text, max_len=SHORT_DESCRIPTION_LENGTH):
+    if len(text) <= max_len:
+        return text
+    return text[: max_len - 3].rsplit(" ", 1)[0] + "..."
+
+
+def card_values(project):
+    """Card field values for ``project``; uses the technologies/images prefetch cache."""
+    first = project.first_image
+    return {
+        "short_description": shorten_description(project.description),
+        "thumbnail": first.image.name if first and first.image else "",
+        "thumbnail_derivatives": first.derivatives if first and first.image else {},
+        "technologies": [[t.slug, t.name, t.category] for t in project.technologies.all()],
+        "source_updated_at": project.updated_at,
+    }
+
+
+def _projects(project_ids=None):
+    qs = Project.objects.prefetch_related("technologies", "images").order_by("pk")
+    if project_ids is not None:
+        qs = qs.filter(pk__in=project_ids)
+    return qs
+
+
+def rebuild_cards(project_ids=None, batch_size=500):
+    """Upsert cards for ``project_ids`` (all projects when ``None``); returns the count."""
+    cards = [
+        ProjectCard(project_id=project.pk, **card_values(project))
+        for project in _projects(project_ids)
+    ]
+    ProjectCard.objects.bulk_create(
+        cards,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["project"],
+        update_fields=CARD_FIELDS,
+    )
+    return len(cards)
+
+
+def verify_cards():
+    """Return ``{project_id: reason}`` for cards that are missing or out of date."""
+    stored = {
+        card["project_id"]: card
+        for card in ProjectCard.objects.values("project_id", *CARD_FIELDS)
+    }
+    problems = {}
+    for project in _projects():
+        card = stored.get(project.pk)
+        if card is None:
+            problems[project.pk] = "missing"
+            continue
+        expected = card_values(project)
+        stale = sorted(f for f in CARD_FIELDS if card[f] != expected[f])
+        if stale:
+            problems[project.pk] = "stale: " + ", ".join(stale)
+    return problems
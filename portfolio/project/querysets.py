@@ -1,13 +1,21 @@
 """Custom QuerySets and managers for Project domain."""
 
-from django.db import models
+import re
 
-from .constants import ProjectStatus
+from django.db import NotSupportedError, connections, models
+from django.db.models import Count, Q
+from django.db.models.expressions import RawSQL
+
+from . import postgres
+from .constants import ProjectStatus, TechnologyMatch
+from .search import search_queryset, tokenize
+from .validators import ARCHITECTURE_ALLOWED_KEYS
 
 
 class ProjectQuerySet(models.QuerySet):
     def with_list_prefetch(self):
-        return self.prefetch_related("technologies", "images")
+        # List rows are rendered from the denormalized card (see projections.py).
+        return self.select_related("card")
 
     def with_detail_prefetch(self):
         return self.prefetch_related("technologies", "images")
@@ -20,16 +28,120 @@ class ProjectQuerySet(models.QuerySet):
             return self.none()
         return self.filter(status__in=allowed)
 
-    def by_technologies(self, slugs):
+    def by_technologies(self, slugs, mode=TechnologyMatch.ANY):
+        """Projects using any (or, with ``mode="all"``, every) technology in ``slugs``.
+
+        Filters with ``IN`` subqueries over the M2M through-table instead of joining
+        it, so rows are never duplicated and no DISTINCT is needed.
+        """
         if not slugs:
             return self
-        return self.filter(technologies__slug__in=slugs).distinct()
+        slugs = set(slugs)
+        links = self.model.technologies.through.objects.filter(technology__slug__in=slugs)
+        if mode == TechnologyMatch.ALL:
+            # (project, technology) is unique in the through-table, so a project
+            # matches every slug exactly when it has len(slugs) matching links.
+            matching = (
+                links.values("project_id")
+                .annotate(matched=Count("technology_id"))
+                .filter(matched=len(slugs))
+                .values("project_id")
+            )
+            return self.filter(pk__in=matching)
+        return self.filter(pk__in=links.values("project_id"))
+
+    # JSON queries. On PostgreSQL these use the GIN indexes from postgres.py;
+    # SQLite answers the same questions with JSON1 (unindexed, but equivalent).
+
+    def _is_postgres(self):
+        return postgres.is_postgres(connections[self.db])
+
+    def _json_array_contains(self, field, element):
+        """Rows whose JSON array ``field`` has ``element`` (a string, or a dict subset)."""
+        if self._is_postgres():
+            return self.filter(**{f"{field}__contains": [element]})
+        if connections[self.db].vendor != "sqlite":
+            raise NotSupportedError("JSON array queries need PostgreSQL or SQLite.")
+        if isinstance(element, dict):
+            if not all(re.fullmatch(r"\w+", key) for key in element):
+                raise ValueError("JSON keys must be identifiers.")
+            conditions = [f"json_extract(item.value, '$.{key}') = %s" for key in element]
+            params = list(element.values())
+        else:
+            conditions, params = ["item.type = 'text' AND item.value = %s"], [element]
+        table = self.model._meta.db_table
+        column = self.model._meta.get_field(field).column
+        return self.filter(
+            pk__in=RawSQL(
+                f"SELECT p.id FROM {table} p, json_each(p.{column}) item "
+                f"WHERE json_type(p.{column}) = 'array' AND " + " AND ".join(conditions),
+                params,
+            )
+        )
+
+    def with_feature(self, feature):
+        """Projects listing exactly ``feature`` in ``key_features``."""
+        return self._json_array_contains("key_features", feature)
+
+    def with_enhancement(self, enhancement):
+        """Projects listing exactly ``enhancement`` in ``future_enhancements``."""
+        return self._json_array_contains("future_enhancements", enhancement)
+
+    def with_challenge(self, challenge):
+        """Projects with a ``technical_challenges_solutions`` item for ``challenge``."""
+        return self._json_array_contains("technical_challenges_solutions", {"challenge": challenge})
 
+    def with_architecture_key(self, key):
+        """Projects whose ``architectural_overview`` documents ``key`` (e.g. ``"database"``)."""
+        return self.filter(architectural_overview__has_key=key)
+
+    def architecture_uses(self, term, key=None):
+        """Projects whose architecture mentions ``term``, optionally under ``key`` only.
+
+        ``architecture_uses("PostgreSQL", key="database")``. Matching is by
+        word: full-text on PostgreSQL, case-insensitive substring elsewhere.
+        """
+        if key is not None and key not in ARCHITECTURE_ALLOWED_KEYS:
+            return self.none()
+        keys = [key] if key else sorted(ARCHITECTURE_ALLOWED_KEYS)
+        substring = Q()
+        for name in keys:
+            substring |= Q(**{f"architectural_overview__{name}__icontains": term})
+        if not self._is_postgres():
+            return self.filter(substring) if tokenize(term) else self.none()
+        query = postgres.build_tsquery(tokenize(term))
+        if query is None:
+            return self.none()
+        table = self.model._meta.db_table
+        matches = self.filter(
+            pk__in=RawSQL(
+                f"SELECT id FROM {table} WHERE {postgres.architecture_document()} "
+                f"@@ to_tsquery({postgres.SEARCH_CONFIG}, %s)",
+                [query],
+            )
+        )
+        # The index narrows to projects mentioning the term anywhere; the key is
+        # then checked on those few rows.
+        return matches.filter(substring) if key else matches
+
+    def search(self, text, rank=True):
+        """Full-text filter; see ``search.py``. ``rank`` adds ``search_rank``."""
+        return search_queryset(self, text, rank=rank)
+
+    # Every ordering ends with the primary key so it is total, which keyset
+    # pagination relies on.
     def ordered_by_newest(self):
-        return self.order_by("-created_at")
+        return self.order_by("-created_at", "-id")
+
+    def ordered_by_oldest(self):
+        return self.order_by("created_at", "id")
+
+    def ordered_by_relevance(self):
+        """Requires the ``search_rank`` annotation from ``search()``."""
+        return self.order_by("search_rank", "-id")
 
     def ordered_by_display(self):
-        return self.order_by("display_order", "-created_at")
+        return self.order_by("display_order", "-created_at", "-id")
 
 
 class ProjectManager(models.Manager):
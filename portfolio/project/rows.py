@@ -0,0 +1,198 @@
+"""Plain-dict serialization of Project responses from ``.values()`` rows.
+
+Produces exactly what ``ProjectListSerializer``/``ProjectDetailSerializer``
+produce. It skips model instances, serializer fields and ``ReturnDict``
+wrappers, which make up most of a list response's render time. The views
+use it unless ``PROJECT_API_FAST_SERIALIZATION`` is off. Any field change
+must be made in both places; ``tests/test_rows.py`` compares the two.
+
+Every function takes an optional ``fieldsets.FieldSelection``, and reads
+and renders only the fields it selects.
+"""
+
+from collections import defaultdict
+
+from rest_framework import serializers
+
+from . import fieldsets
+from .images import srcset, variants
+from .models import Project, ProjectImage, Technology
+from .projections import card_values
+from .serializers import THUMBNAIL_SIZES, storage_url, thumbnail_url
+
+CARD_PREFIX = "card__"
+DATETIME_FIELDS = {"created_at", "updated_at"}
+# Char/URL fields: serializers render non-null values through ``str()``.
+TEXT_FIELDS = {
+    "slug",
+    "title",
+    "description",
+    "problem_statement",
+    "my_role",
+    "live_demo_url",
+    "source_code_url",
+}
+IMAGE_VALUE_FIELDS = ["id", "project_id", "image", "caption", "order", "derivatives"]
+
+# Formats datetimes exactly like the serializers' DateTimeFields.
+_datetime = serializers.DateTimeField()
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def _technology(triple):
+    slug, name, category = triple
+    return {"slug": slug, "name": name, "category": category}
+
+
+# List field -> value from (row, card, build_url).
+LIST_FIELDS = {
+    "id": lambda row, card, build_url: row["id"],
+    "slug": lambda row, card, build_url: row["slug"],
+    "title": lambda row, card, build_url: row["title"],
+    "short_description": lambda row, card, build_url: card["short_description"],
+    "status": lambda row, card, build_url: row["status"],
+    "technologies": lambda row, card, build_url: [_technology(t) for t in card["technologies"]],
+    "thumbnail": lambda row, card, build_url: thumbnail_url(
+        card["thumbnail"], card["thumbnail_derivatives"], build_url
+    ),
+    "thumbnail_srcset": lambda row, card, build_url: srcset(
+        card["thumbnail_derivatives"], build_url, THUMBNAIL_SIZES
+    ),
+    "live_demo_url": lambda row, card, build_url: _text(row["live_demo_url"]),
+    "source_code_url": lambda row, card, build_url: _text(row["source_code_url"]),
+    "created_at": lambda row, card, build_url: _datetime.to_representation(row["created_at"]),
+}
+COLLAPSED_LIST_FIELDS = {
+    "technologies": lambda row, card, build_url: [t[0] for t in card["technologies"]],
+}
+
+
+def list_values(queryset, selection=None):
+    """``queryset`` as list rows, keeping its ordering columns for keyset cursors."""
+    selection = selection or fieldsets.list_selection({})
+    # card__pk is None when the project has no card yet.
+    names = ["id", "card__pk"]
+    columns = fieldsets.list_columns(selection)
+    ordering = [str(field).lstrip("-") for field in queryset.query.order_by]
+    for name in [*columns, *ordering]:
+        if name != "pk" and name not in names:
+            names.append(name)
+    return queryset.values(*names)
+
+
+def list_data(rows, request=None, selection=None):
+    """``ProjectListSerializer(projects, many=True).data`` for rows from ``list_values``."""
+    selection = selection or fieldsets.list_selection({})
+    card_fields = [
+        column.removeprefix(CARD_PREFIX)
+        for column in fieldsets.list_columns(selection)
+        if column.startswith(CARD_PREFIX)
+    ]
+    fallback = {}
+    missing = [row["id"] for row in rows if row["card__pk"] is None] if card_fields else []
+    if missing:
+        for project in Project.objects.prefetch_related("technologies", "images").filter(
+            pk__in=missing
+        ):
+            fallback[project.pk] = card_values(project)
+
+    def build_url(name):
+        return storage_url(name, request)
+
+    getters = [
+        (
+            name,
+            COLLAPSED_LIST_FIELDS[name]
+            if name in COLLAPSED_LIST_FIELDS and not selection.expanded(name)
+            else LIST_FIELDS[name],
+        )
+        for name in selection.fields
+    ]
+    data = []
+    for row in rows:
+        if row["card__pk"] is None and card_fields:
+            card = fallback[row["id"]]
+        else:
+            card = {name: row[CARD_PREFIX + name] for name in card_fields}
+        data.append({name: getter(row, card, build_url) for name, getter in getters})
+    return data
+
+
+def _technologies(pks, selection):
+    """``{project_id: [technology, ...]}``, as slugs when technologies are collapsed."""
+    technologies = defaultdict(list)
+    links = Project.technologies.through.objects.filter(project_id__in=pks).order_by(
+        *(f"technology__{name}" for name in Technology._meta.ordering)
+    )
+    if not selection.expanded("technologies"):
+        for project_id, slug in links.values_list("project_id", "technology__slug"):
+            technologies[project_id].append(slug)
+        return technologies
+    triples = links.values_list(
+        "project_id", "technology__slug", "technology__name", "technology__category"
+    )
+    for project_id, *triple in triples:
+        technologies[project_id].append(_technology(triple))
+    return technologies
+
+
+def _images(pks, selection, build_url):
+    """``{project_id: [image, ...]}``, as URLs when images are collapsed."""
+    images = defaultdict(list)
+    queryset = ProjectImage.objects.filter(project_id__in=pks)
+    if not selection.expanded("images"):
+        for project_id, name in queryset.values_list("project_id", "image"):
+            images[project_id].append(build_url(name) if name else None)
+        return images
+    for image in queryset.values(*IMAGE_VALUE_FIELDS):
+        images[image["project_id"]].append({
+            "id": image["id"],
+            "url": build_url(image["image"]) if image["image"] else None,
+            "srcset": srcset(image["derivatives"], build_url),
+            "variants": variants(image["derivatives"], build_url) or None,
+            "caption": image["caption"],
+            "order": image["order"],
+        })
+    return images
+
+
+def detail_data(queryset, request=None, selection=None):
+    """``ProjectDetailSerializer(project).data`` for each project in ``queryset``.
+
+    At most three queries however many projects: the project rows, their
+    technologies and their images. Relations outside the selection are
+    not queried.
+    """
+    selection = selection or fieldsets.detail_selection({})
+    columns = [name for name in fieldsets.detail_columns(selection) if name != "id"]
+    projects = list(queryset.values("id", *columns))
+    if not projects:
+        return []
+    pks = [project["id"] for project in projects]
+
+    def build_url(name):
+        return storage_url(name, request)
+
+    relations = {}
+    if selection.includes("technologies"):
+        relations["technologies"] = _technologies(pks, selection)
+    if selection.includes("images"):
+        relations["images"] = _images(pks, selection, build_url)
+
+    data = []
+    for project in projects:
+        item = {}
+        for name in selection.fields:
+            if name in relations:
+                item[name] = relations[name][project["id"]]
+            elif name in DATETIME_FIELDS:
+                item[name] = _datetime.to_representation(project[name])
+            elif name in TEXT_FIELDS:
+                item[name] = _text(project[name])
+            else:
+                item[name] = project[name]
+        data.append(item)
+    return data
@@ -0,0 +1,136 @@
+"""Compiled validation for the Project JSON fields.
+
+Each rule is compiled once, per field, into a function that validates and
+normalizes a value in a single pass. ``PROJECT_JSON_SCHEMA`` accepts and
+rejects exactly what ``Project.save`` did when it normalized
+``technical_challenges_solutions`` and then ran the ``validators.py``
+functions, with the same messages, but reports them keyed by field (one
+per field) instead of stopping at the first field:
+
+    cleaned = PROJECT_JSON_SCHEMA.validate({"key_features": ["Search"]})
+    results = PROJECT_JSON_SCHEMA.validate_many(payloads)  # [(cleaned, errors), ...]
+"""
+
+from django.core.exceptions import ValidationError
+
+from .validators import ARCHITECTURE_ALLOWED_KEYS
+
+
+class StringList:
+    """A list of strings; empty values pass through."""
+
+    def compile(self, name):
+        not_list = f"{name} must be a list."
+
+        def check(value):
+            if not value:
+                return value
+            if not isinstance(value, list):
+                raise ValidationError(not_list)
+            for i, item in enumerate(value):
+                if not isinstance(item, str):
+                    raise ValidationError(f"{name}[{i}] must be a string.")
+            return value
+
+        return check
+
+
+class ChallengeList:
+    """``[{"challenge": str, "solution": str}, ...]``, normalized from looser input.
+
+    Objects may use capitalized keys, ``[challenge, solution]`` pairs are
+    accepted, values are converted to strings, and items that fit neither
+    shape are dropped rather than rejected. Only a non-list is an error.
+    """
+
+    def compile(self, name):
+        not_list = (
+            f"{name} must be a list. "
+            'Example: [{"challenge": "Describe the problem", "solution": "Describe the solution"}]'
+        )
+
+        def check(value):
+            if not value:
+                return value
+            if not isinstance(value, list):
+                raise ValidationError(not_list)
+            normalized = []
+            for item in value:
+                if isinstance(item, dict):
+                    challenge = item.get("challenge") or item.get("Challenge")
+                    solution = item.get("solution") or item.get("Solution")
+                    if challenge is not None and solution is not None:
+                        normalized.append({"challenge": str(challenge), "solution": str(solution)})
+                elif isinstance(item, (list, tuple)) and len(item) == 2:
+                    normalized.append({"challenge": str(item[0]), "solution": str(item[1])})
+            return normalized
+
+        return check
+
+
+class Architecture:
+    """An object of strings over ``allowed_keys``, except ``stages``: a list of {name, description}.
+
+    Values that are not objects are not checked.
+    """
+
+    def __init__(self, allowed_keys):
+        self.allowed_keys = frozenset(allowed_keys)
+
+    def compile(self, name):
+        allowed = self.allowed_keys
+        invalid_keys = "Invalid keys in {}: {}. Allowed: " + f"{sorted(allowed)}."
+        bad_stage = "Each stage must have 'name' and 'description'."
+        bad_value = f"{name} values must be strings, or 'stages' a list of {{name, description}}."
+
+        def check(value):
+            if not value or not isinstance(value, dict):
+                return value
+            if not allowed.issuperset(value):
+                raise ValidationError(invalid_keys.format(name, sorted(value.keys() - allowed)))
+            for key, item in value.items():
+                if isinstance(item, str):
+                    continue
+                if key != "stages" or not isinstance(item, list):
+                    raise ValidationError(bad_value)
+                for stage in item:
+                    if not isinstance(stage, dict) or "name" not in stage or "description" not in stage:
+                        raise ValidationError(bad_stage)
+            return value
+
+        return check
+
+
+class Schema:
+    def __init__(self, rules):
+        self.fields = tuple(rules)
+        self._checks = [(name, rule.compile(name)) for name, rule in rules.items()]
+
+    def _run(self, data):
+        cleaned, errors = {}, {}
+        for name, check in self._checks:
+            if name in data:
+                try:
+                    cleaned[name] = check(data[name])
+                except ValidationError as exc:
+                    errors[name] = exc.messages
+        return cleaned, errors or None
+
+    def validate(self, data):
+        """Normalized values for the schema's fields in ``data``; raises ValidationError keyed by field."""
+        cleaned, errors = self._run(data)
+        if errors:
+            raise ValidationError(errors)
+        return cleaned
+
+    def validate_many(self, payloads):
+        """``(cleaned, errors)`` for each of ``payloads``; ``errors`` is ``None`` when valid."""
+        return [self._run(data) for data in payloads]
+
+
+PROJECT_JSON_SCHEMA = Schema({
+    "technical_challenges_solutions": ChallengeList(),
+    "key_features": StringList(),
+    "future_enhancements": StringList(),
+    "architectural_overview": Architecture(ARCHITECTURE_ALLOWED_KEYS),
+})
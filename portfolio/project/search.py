@@ -0,0 +1,201 @@
+"""Full-text search over projects.
+
+On SQLite builds with FTS5 the searchable text lives in the ``FTS_TABLE``
+virtual table (rowid = project id), kept in sync by ``signals.py`` and ranked
+with bm25. Matching and ranking are subqueries of the project query, so
+counts, facets and pagination see every match. On PostgreSQL the
+GIN-indexed ``tsvector`` expression from ``postgres.py`` is queried
+directly and ranked with ``ts_rank``. Other backends, or SQLite without
+FTS5, fall back to ``icontains`` over the same fields.
+"""
+
+import re
+
+from django.db import OperationalError, connections
+from django.db.models import FloatField, IntegerField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from . import postgres
+
+FTS_TABLE = "project_project_fts"
+FTS_COLUMNS = ["title", "description", "problem_statement", "key_features", "my_role", "challenges"]
+# bm25 column weights, in FTS_COLUMNS order: title matches rank highest.
+FTS_WEIGHTS = [10.0, 4.0, 2.0, 2.0, 1.0, 1.0]
+FALLBACK_FIELDS = [
+    "title",
+    "description",
+    "problem_statement",
+    "my_role",
+    "key_features",
+    "technical_challenges_solutions",
+]
+
+_fts_aliases = set()
+
+
+def document_values(project):
+    """Indexed text for ``project`` in ``FTS_COLUMNS`` order; works on historical models too."""
+    challenges = []
+    for item in project.technical_challenges_solutions or []:
+        if isinstance(item, dict):
+            challenges.extend(str(v) for v in item.values())
+    features = project.key_features if isinstance(project.key_features, list) else []
+    return [
+        project.title,
+        project.description,
+        project.problem_statement,
+        "\n".join(str(f) for f in features),
+        project.my_role,
+        "\n".join(challenges),
+    ]
+
+
+def create_fts_table(connection):
+    """Create the FTS5 table; returns False when this SQLite lacks FTS5."""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({', '.join(FTS_COLUMNS)})"
+            )
+    except OperationalError:
+        return False
+    return True
+
+
+def uses_fts(using="default"):
+    if using in _fts_aliases:
+        return True
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    if FTS_TABLE in connection.introspection.table_names():
+        _fts_aliases.add(using)
+        return True
+    return False
+
+
+def index_projects(projects, using="default"):
+    """(Re)index ``projects`` in the FTS table; no-op without FTS."""
+    projects = list(projects)
+    if not projects or not uses_fts(using):
+        return
+    placeholders = ", ".join(["%s"] * (len(FTS_COLUMNS) + 1))
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [[p.pk] for p in projects]
+        )
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_COLUMNS)}) VALUES ({placeholders})",
+            [[p.pk, *document_values(p)] for p in projects],
+        )
+
+
+def remove_projects(project_ids, using="default"):
+    project_ids = list(project_ids)
+    if not project_ids or not uses_fts(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [[pk] for pk in project_ids])
+
+
+def rebuild_index(using="default"):
+    from .models import Project
+
+    if not uses_fts(using):
+        return 0
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    projects = list(Project.objects.using(using).all())
+    index_projects(projects, using)
+    return len(projects)
+
+
+def tokenize(text):
+    return re.findall(r"\w+", text or "")
+
+
+def build_match_query(text):
+    """FTS5 MATCH expression: every term must match, the last one as a prefix."""
+    tokens = tokenize(text)
+    if not tokens:
+        return None
+    # Quoting each token neutralizes FTS5 operators (AND, NEAR, column filters, ...).
+    terms = ['"%s"' % token.replace('"', '""') for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def bm25():
+    return f"bm25({FTS_TABLE}, {', '.join(str(w) for w in FTS_WEIGHTS)})"
+
+
+def fallback_condition(text):
+    condition = Q()
+    for token in tokenize(text):
+        any_field = Q()
+        for field in FALLBACK_FIELDS:
+            any_field |= Q(**{f"{field}__icontains": token})
+        condition &= any_field
+    return condition
+
+
+def search_queryset(queryset, text, rank=True):
+    """Filter ``queryset`` to projects matching ``text``.
+
+    With ``rank`` the rows get a ``search_rank`` annotation; lower is a better match.
+    """
+    if not tokenize(text):
+        # Nothing to match; still annotated so relevance ordering works.
+        queryset = queryset.none()
+        if rank:
+            queryset = queryset.annotate(search_rank=Value(0, output_field=IntegerField()))
+        return queryset
+    if postgres.is_postgres(connections[queryset.db]):
+        return _postgres_search(queryset, text, rank)
+    if uses_fts(queryset.db):
+        return _fts_search(queryset, text, rank)
+    queryset = queryset.filter(fallback_condition(text))
+    if rank:
+        queryset = queryset.annotate(search_rank=Value(0, output_field=IntegerField()))
+    return queryset
+
+
+def _fts_search(queryset, text, rank):
+    table = queryset.model._meta.db_table
+    match = build_match_query(text)
+    queryset = queryset.filter(
+        pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+    )
+    if rank:
+        # bm25 is negative and lower for better matches.
+        queryset = queryset.annotate(
+            search_rank=RawSQL(
+                f"SELECT {bm25()} FROM {FTS_TABLE} "
+                f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{table}"."id"',
+                [match],
+                output_field=FloatField(),
+            )
+        )
+    return queryset
+
+
+def _postgres_search(queryset, text, rank):
+    table = queryset.model._meta.db_table
+    tsquery = f"to_tsquery({postgres.SEARCH_CONFIG}, %s)"
+    query = postgres.build_tsquery(tokenize(text))
+    # Same expression as the project_search_gin index, so the filter is an index scan.
+    queryset = queryset.filter(
+        pk__in=RawSQL(
+            f"SELECT id FROM {table} WHERE {postgres.search_document()} @@ {tsquery}", [query]
+        )
+    )
+    if rank:
+        # Negated so that, as with FTS5, a lower search_rank is a better match.
+        queryset = queryset.annotate(
+            search_rank=RawSQL(
+                f"-ts_rank({postgres.search_document(table)}, {tsquery})",
+                [query],
+                output_field=FloatField(),
+            )
+        )
+    return queryset
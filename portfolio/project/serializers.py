@@ -1,9 +1,53 @@
 """Serializers for Project API."""
 
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 
-from .models import Project, ProjectImage, Technology
+from .models import Project, ProjectCard, ProjectImage, Technology
 from .constants import ProjectStatus
+from .images import srcset, variants
+from .projections import card_values
+
+# Derivative sizes offered to list cards; "full" is only used by the gallery.
+THUMBNAIL_SIZES = ("thumbnail", "card")
+THUMBNAIL_FALLBACK = ("card", "jpeg")
+
+
+def storage_url(name, request=None):
+    url = default_storage.url(name)
+    return request.build_absolute_uri(url) if request else url
+
+
+def thumbnail_url(thumbnail, derivatives, build_url):
+    """URL of the card-sized JPEG for a list row, or of the original image."""
+    if not thumbnail:
+        return None
+    size, fmt = THUMBNAIL_FALLBACK
+    sized = (derivatives or {}).get("sizes", {}).get(size, {})
+    return build_url(sized.get(fmt) or thumbnail)
+
+
+class FieldSelectionMixin:
+    """Renders only the fields in ``context["selection"]`` (see ``fieldsets.py``).
+
+    Relations the selection does not expand are swapped for the field that
+    ``collapsed_field()`` returns: by default, their primary keys.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.context.get("selection")
+        if selection is None:
+            return fields
+        for name in list(fields):
+            if not selection.includes(name):
+                del fields[name]
+            elif name in selection.expandable and not selection.expanded(name):
+                fields[name] = self.collapsed_field(name)
+        return fields
+
+    def collapsed_field(self, name):
+        return serializers.PrimaryKeyRelatedField(many=True, read_only=True)
 
 
 class TechnologySerializer(serializers.ModelSerializer):
@@ -14,10 +58,12 @@ class TechnologySerializer(serializers.ModelSerializer):
 
 class ProjectImageSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
+    variants = serializers.SerializerMethodField()
 
     class Meta:
         model = ProjectImage
-        fields = ["id", "url", "caption", "order"]
+        fields = ["id", "url", "srcset", "variants", "caption", "order"]
 
     def get_url(self, obj):
         request = self.context.get("request")
@@ -25,10 +71,26 @@ class ProjectImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return obj.image.url if obj.image else None
 
+    def build_url(self, name):
+        return storage_url(name, self.context.get("request"))
 
-class ProjectListSerializer(serializers.ModelSerializer):
-    technologies = TechnologySerializer(many=True, read_only=True)
+    def get_srcset(self, obj):
+        return srcset(obj.derivatives, self.build_url)
+
+    def get_variants(self, obj):
+        return variants(obj.derivatives, self.build_url) or None
+
+
+class ProjectListSerializer(FieldSelectionMixin, serializers.ModelSerializer):
+    """List row rendered from the project's ``ProjectCard``.
+
+    Falls back to computing the card values when the projection has not been
+    built yet (see ``manage.py rebuild_project_cards``).
+    """
+
+    technologies = serializers.SerializerMethodField()
     thumbnail = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
     short_description = serializers.SerializerMethodField()
 
     class Meta:
@@ -41,28 +103,47 @@ class ProjectListSerializer(serializers.ModelSerializer):
             "status",
             "technologies",
             "thumbnail",
+            "thumbnail_srcset",
             "live_demo_url",
             "source_code_url",
             "created_at",
         ]
 
+    def get_card(self, obj):
+        try:
+            return obj.card
+        except ProjectCard.DoesNotExist:
+            obj.card = ProjectCard(**card_values(obj))
+            return obj.card
+
+    def get_technologies(self, obj):
+        return [
+            {"slug": slug, "name": name, "category": category}
+            for slug, name, category in self.get_card(obj).technologies
+        ]
+
+    def get_technology_slugs(self, obj):
+        return [slug for slug, _, _ in self.get_card(obj).technologies]
+
+    def collapsed_field(self, name):
+        return serializers.SerializerMethodField(method_name="get_technology_slugs")
+
+    def build_url(self, name):
+        return storage_url(name, self.context.get("request"))
+
     def get_thumbnail(self, obj):
-        first = obj.images.first()
-        if not first or not first.image:
-            return None
-        request = self.context.get("request")
-        if request:
-            return request.build_absolute_uri(first.image.url)
-        return first.image.url
+        card = self.get_card(obj)
+        return thumbnail_url(card.thumbnail, card.thumbnail_derivatives, self.build_url)
+
+    def get_thumbnail_srcset(self, obj):
+        card = self.get_card(obj)
+        return srcset(card.thumbnail_derivatives, self.build_url, THUMBNAIL_SIZES)
 
     def get_short_description(self, obj):
-        max_len = 200
-        if len(obj.description) <= max_len:
-            return obj.description
-        return obj.description[: max_len - 3].rsplit(" ", 1)[0] + "..."
+        return self.get_card(obj).short_description
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     technologies = TechnologySerializer(many=True, read_only=True)
     images = ProjectImageSerializer(many=True, read_only=True)
 
@@ -88,3 +169,15 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = fields
+
+    def get_image_urls(self, obj):
+        request = self.context.get("request")
+        return [
+            storage_url(image.image.name, request) if image.image else None
+            for image in obj.images.all()
+        ]
+
+    def collapsed_field(self, name):
+        if name == "technologies":
+            return serializers.SlugRelatedField(many=True, read_only=True, slug_field="slug")
+        return serializers.SerializerMethodField(method_name="get_image_urls")
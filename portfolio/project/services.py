@@ -1,29 +1,118 @@
 """Project domain service layer."""
 
-from .models import Project
-from .constants import ProjectStatus
+from django.db.models import Count, Q
+
+from .models import Project, Technology
+from .constants import ProjectStatus, TechnologyMatch
 
 
 class ProjectFilterService:
     """Builds filtered, ordered Project queryset from API parameters."""
 
     DEFAULT_ORDERING = "display"
-    ORDERING_CHOICES = {"display", "newest", "oldest"}
+    SEARCH_ORDERING = "relevance"
+    ORDERING_CHOICES = {"display", "newest", "oldest", SEARCH_ORDERING}
+
+    @classmethod
+    def normalize_ordering(cls, ordering, q=None):
+        """Searches default to relevance; ``relevance`` without a search means display."""
+        default = cls.SEARCH_ORDERING if q else cls.DEFAULT_ORDERING
+        order = (ordering or default).strip().lower()
+        if order not in cls.ORDERING_CHOICES or (order == cls.SEARCH_ORDERING and not q):
+            return default
+        return order
+
+    @staticmethod
+    def normalize_search(q):
+        return " ".join((q or "").split())
+
+    @staticmethod
+    def normalize_technologies_mode(mode):
+        mode = (mode or TechnologyMatch.DEFAULT).strip().lower()
+        return mode if mode in TechnologyMatch.VALUES else TechnologyMatch.DEFAULT
+
+    @classmethod
+    def normalize_params(cls, query_params):
+        """Canonical filter arguments for ``get_queryset`` from request query params.
+
+        Equivalent requests (repeated or reordered values) normalize to the same
+        dict, so the result can also be used as a cache key.
+        """
+        tech_param = query_params.get("technologies", "")
+        q = cls.normalize_search(query_params.get("q"))
+        technology_slugs = sorted({s.strip() for s in tech_param.split(",") if s.strip()})
+        return {
+            "status": sorted(set(query_params.getlist("status"))),
+            "technology_slugs": technology_slugs,
+            "technologies_mode": cls.normalize_technologies_mode(
+                query_params.get("technologies_mode")
+            ),
+            "q": q,
+            "ordering": cls.normalize_ordering(query_params.get("ordering"), q),
+        }
 
     @classmethod
-    def get_queryset(cls, status=None, technology_slugs=None, ordering=None):
+    def get_queryset(
+        cls, status=None, technology_slugs=None, ordering=None, technologies_mode=None, q=None
+    ):
         qs = Project.objects.for_list()
+        q = cls.normalize_search(q)
+        if q:
+            qs = qs.search(q)
         if status:
             qs = qs.by_status(status)
         if technology_slugs:
-            qs = qs.by_technologies(technology_slugs)
-        order = (ordering or cls.DEFAULT_ORDERING).strip().lower()
-        if order not in cls.ORDERING_CHOICES:
-            order = cls.DEFAULT_ORDERING
-        if order == "newest":
+            qs = qs.by_technologies(
+                technology_slugs, mode=cls.normalize_technologies_mode(technologies_mode)
+            )
+        order = cls.normalize_ordering(ordering, q)
+        if order == cls.SEARCH_ORDERING:
+            qs = qs.ordered_by_relevance()
+        elif order == "newest":
             qs = qs.ordered_by_newest()
         elif order == "oldest":
-            qs = qs.order_by("created_at")
+            qs = qs.ordered_by_oldest()
         else:
             qs = qs.ordered_by_display()
         return qs
+
+
+class ProjectFacetService:
+    """Project counts per status and per technology under the current filters.
+
+    Each facet ignores its own dimension so it shows the alternatives a user can
+    switch to: status counts apply only the technology filter; technology
+    counts apply the status filter, plus the selected technologies when they
+    are combined with ``all`` (each count is then the result of also adding
+    that technology).
+    """
+
+    @classmethod
+    def get_counts(
+        cls, status=None, technology_slugs=None, technologies_mode=None, q=None, **_
+    ):
+        mode = ProjectFilterService.normalize_technologies_mode(technologies_mode)
+        base = Project.objects.order_by()
+        q = ProjectFilterService.normalize_search(q)
+        if q:
+            base = base.search(q, rank=False)
+
+        by_tech = base.by_technologies(technology_slugs, mode=mode) if technology_slugs else base
+        status_counts = dict(
+            by_tech.values("status").annotate(count=Count("pk")).values_list("status", "count")
+        )
+
+        tech_scope = base.by_status(status) if status else base
+        if technology_slugs and mode == TechnologyMatch.ALL:
+            tech_scope = tech_scope.by_technologies(technology_slugs, mode=mode)
+        technologies = Technology.objects.annotate(
+            count=Count("projects", filter=Q(projects__in=tech_scope.values("pk")))
+        ).values("slug", "name", "category", "count")
+
+        return {
+            "status": [
+                {"value": value, "label": label, "count": status_counts.get(value, 0)}
+                for value, label in ProjectStatus.CHOICES
+            ],
+            "technologies": list(technologies),
+        }
@@ -0,0 +1,108 @@
+"""Signal handlers keeping derived Project data in sync with writes.
+
+Cards, the search index and the cache versions are refreshed from
+``transaction.on_commit``: bumped inside the transaction, a concurrent
+request could cache the old rows under the new version, and a rollback
+would still invalidate everything.
+"""
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.jobs import enqueue
+
+from .cache import bump_content_version, bump_technology_version
+from .images import delete_derivatives, needs_derivatives
+from .models import Project, ProjectImage, Technology
+from .projections import rebuild_cards
+from .search import index_projects, remove_projects
+
+
+def refresh_on_commit(project_ids=(), technologies=False):
+    """Rebuild ``project_ids``' cards and bump the cache versions once the transaction commits."""
+
+    def refresh():
+        if project_ids:
+            rebuild_cards(project_ids)
+        if technologies:
+            bump_technology_version()
+        bump_content_version()
+
+    transaction.on_commit(refresh)
+
+
+@receiver(post_save, sender=Project)
+def on_project_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: index_projects([instance]))
+    refresh_on_commit([instance.pk])
+
+
+@receiver(post_delete, sender=Project)
+def on_project_deleted(sender, instance, **kwargs):
+    pk = instance.pk
+    transaction.on_commit(lambda: remove_projects([pk]))
+    refresh_on_commit()
+
+
+@receiver(post_save, sender=ProjectImage)
+def queue_image_derivatives(sender, instance, raw=False, **kwargs):
+    if not raw and needs_derivatives(instance):
+        enqueue(
+            "project.build_image_derivatives",
+            {"image_id": instance.pk},
+            idempotency_key=f"image-derivatives:{instance.pk}:{instance.image.name}",
+        )
+
+
+@receiver(post_delete, sender=ProjectImage)
+def delete_image_derivatives(sender, instance, **kwargs):
+    delete_derivatives(instance.derivatives)
+
+
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+def on_image_changed(sender, instance, origin=None, **kwargs):
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is Project:
+        # Cascade from deleting the project itself; its card goes with it.
+        return
+    # Images are part of the project's representation: move its updated_at so
+    # Last-Modified/ETag validators see the change. update() skips save signals.
+    Project.objects.filter(pk=instance.project_id).update(updated_at=timezone.now())
+    refresh_on_commit([instance.project_id])
+
+
+@receiver(post_save, sender=Technology)
+def on_technology_saved(sender, instance, created, **kwargs):
+    project_ids = () if created else list(instance.projects.values_list("pk", flat=True))
+    refresh_on_commit(project_ids, technologies=True)
+
+
+@receiver(pre_delete, sender=Technology)
+def remember_technology_projects(sender, instance, **kwargs):
+    # The through rows are gone by post_delete and no m2m_changed is sent.
+    instance._affected_project_ids = list(instance.projects.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Technology)
+def on_technology_deleted(sender, instance, **kwargs):
+    refresh_on_commit(getattr(instance, "_affected_project_ids", []), technologies=True)
+
+
+@receiver(m2m_changed, sender=Project.technologies.through)
+def on_technologies_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        instance._affected_project_ids = list(instance.projects.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        project_ids = [instance.pk]
+    elif action == "post_clear":
+        project_ids = getattr(instance, "_affected_project_ids", [])
+    else:
+        project_ids = list(pk_set or [])
+    refresh_on_commit(project_ids, technologies=True)
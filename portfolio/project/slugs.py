@@ -0,0 +1,91 @@
+"""Unique slug allocation shared by model saves and bulk importers.
+
+A base's free slug is found with one prefix query: ``base`` if unused,
+otherwise ``base-<n+1>`` where ``n`` is the highest numeric suffix in use.
+Concurrent writers can still pick the same slug, so ``save_with_unique_slug``
+retries on the resulting IntegrityError.
+"""
+
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, router, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+SAVE_ATTEMPTS = 5
+
+
+def _fit(base, suffix, max_length):
+    """Trim ``base`` so ``base + suffix`` fits in ``max_length``."""
+    if max_length and len(base) + len(suffix) > max_length:
+        base = base[: max_length - len(suffix)].rstrip("-")
+    return base + suffix
+
+
+def allocate_slugs(model, bases, field="slug", reserved=(), exclude_pk=None, using=None):
+    """Return a unique slug for each of ``bases`` (in order) with a single query.
+
+    ``reserved`` slugs count as taken; slugs allocated earlier in the same call
+    are never handed out twice.
+    """
+    if not bases:
+        return []
+    max_length = model._meta.get_field(field).max_length
+    bases = [_fit(slugify(b) or model._meta.model_name, "", max_length) for b in bases]
+    distinct = set(bases)
+    qs = model._default_manager.using(using).filter(
+        reduce(or_, (Q(**{field: b}) | Q(**{f"{field}__startswith": f"{b}-"}) for b in distinct))
+    )
+    if exclude_pk is not None:
+        qs = qs.exclude(pk=exclude_pk)
+    taken = set(qs.values_list(field, flat=True)) | set(reserved)
+
+    highest = {}
+    for base in distinct:
+        pattern = re.compile(rf"^{re.escape(base)}-(\d+)$")
+        suffixes = [int(m.group(1)) for m in map(pattern.match, taken) if m]
+        highest[base] = max(suffixes, default=0)
+
+    slugs = []
+    for base in bases:
+        slug = base
+        while slug in taken:
+            highest[base] += 1
+            slug = _fit(base, f"-{highest[base]}", max_length)
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def unique_slug(model, base, field="slug", exclude_pk=None, using=None):
+    return allocate_slugs(model, [base], field=field, exclude_pk=exclude_pk, using=using)[0]
+
+
+def save_with_unique_slug(instance, source, save, field="slug", using=None):
+    """Run ``save()``, allocating ``instance.<field>`` from ``source`` when it is empty.
+
+    If the allocated slug was taken concurrently, allocate again and retry.
+    Explicitly set slugs are never changed.
+    """
+    model = type(instance)
+    using = using or router.db_for_write(model, instance=instance)
+    generated = not getattr(instance, field)
+    if generated:
+        setattr(instance, field, unique_slug(model, source, field, instance.pk, using))
+    for attempt in range(SAVE_ATTEMPTS):
+        try:
+            with transaction.atomic(using=using):
+                return save()
+        except IntegrityError:
+            slug = getattr(instance, field)
+            clash = (
+                model._default_manager.using(using)
+                .filter(**{field: slug})
+                .exclude(pk=instance.pk)
+                .exists()
+            )
+            if not generated or not clash or attempt == SAVE_ATTEMPTS - 1:
+                raise
+            setattr(instance, field, unique_slug(model, source, field, instance.pk, using))
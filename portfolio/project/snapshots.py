@@ -0,0 +1,239 @@
+"""Static, precompressed JSON snapshot of the public Project API.
+
+``build_snapshot(root)`` writes, under ``root``:
+
+* ``technologies.<hash>.json``: the technology catalog;
+* ``projects/<slug>.<hash>.json``: each project detail, as the API renders it;
+* ``projects/list/<ordering>/<status or "all">/<page>.<hash>.json``: list
+  pages (``{"count", "page", "pages", "results"}``) for every ordering
+  except relevance and every status filter;
+* a gzip (and, with the optional ``brotli`` package, brotli) copy of each;
+* ``manifest.json``, mapping each document key (the path without hash and
+  extension) to its files, content hash and source signature.
+
+File names change with their content, so everything except the manifest
+can be cached forever. Media URLs are whatever the storage returns, as for
+a request-less serializer.
+
+Rebuilds are incremental: each document's source signature is a digest of
+the rows it is rendered from (projects, their images and technologies,
+list membership and order). Documents whose signature matches the previous
+manifest are neither rendered nor written. The manifest is replaced last,
+atomically, so readers never see a half-built snapshot.
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
+from . import rows
+from .constants import ProjectStatus
+from .models import Project, ProjectImage, Technology
+from .renderers import dumps
+from .services import ProjectFilterService
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+# Bump when the layout or payloads change, to rebuild every document.
+FORMAT = 1
+MANIFEST = "manifest.json"
+LIST_ORDERINGS = ("display", "newest", "oldest")
+
+
+def _digest(*parts):
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()[:16]
+
+
+def project_signatures():
+    """``{pk: (slug, signature)}`` over each project's row, images and technologies."""
+    images = defaultdict(list)
+    for image in ProjectImage.objects.order_by("pk").values_list(
+        "project_id", "image", "caption", "order", "derivatives"
+    ):
+        images[image[0]].append(image[1:])
+    technologies = defaultdict(list)
+    for link in Project.technologies.through.objects.order_by("technology_id").values_list(
+        "project_id", "technology__slug", "technology__name", "technology__category"
+    ):
+        technologies[link[0]].append(link[1:])
+    return {
+        pk: (slug, _digest(updated_at, images[pk], technologies[pk]))
+        for pk, slug, updated_at in Project.objects.values_list("pk", "slug", "updated_at")
+    }
+
+
+def _list_key(ordering, status, page):
+    return f"projects/list/{ordering}/{status or 'all'}/{page}"
+
+
+class SnapshotBuilder:
+    def __init__(self, root, compress_brotli=True, full=False):
+        self.root = Path(root)
+        self.encodings = ["gzip"] + (["br"] if compress_brotli and brotli is not None else [])
+        self.full = full
+        self.previous = self._load_manifest()
+        self.files = {}
+        self.written = self.reused = 0
+        self.removed = []
+        # Rendering inputs shared by every document, e.g. the media URL prefix.
+        self.salt = (FORMAT, settings.MEDIA_URL, api_settings.PAGE_SIZE)
+
+    def _load_manifest(self):
+        try:
+            with open(self.root / MANIFEST, encoding="utf-8") as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        return manifest.get("files", {}) if manifest.get("format") == FORMAT else {}
+
+    def _current(self, key, signature):
+        """The previous manifest entry for ``key`` if it can be kept as is."""
+        if self.full:
+            return None
+        entry = self.previous.get(key)
+        if (
+            entry is None
+            or entry["source"] != signature
+            or sorted(entry["encodings"]) != sorted(self.encodings)
+        ):
+            return None
+        paths = [entry["path"], *entry["encodings"].values()]
+        return entry if all((self.root / path).exists() for path in paths) else None
+
+    def _write(self, path, content):
+        target = self.root / path
+        if target.exists():
+            return  # names are content hashes
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(target.name + ".tmp")
+        temporary.write_bytes(content)
+        os.replace(temporary, target)
+
+    def add(self, key, signature, render):
+        """Record ``key``, calling ``render()`` for its payload only if its sources changed."""
+        signature = _digest(self.salt, signature)
+        entry = self._current(key, signature)
+        if entry is not None:
+            self.files[key] = entry
+            self.reused += 1
+            return
+        content = dumps(render())
+        sha256 = hashlib.sha256(content).hexdigest()
+        path = f"{key}.{sha256[:12]}.json"
+        encodings = {"gzip": f"{path}.gz"}
+        self._write(path, content)
+        self._write(encodings["gzip"], gzip.compress(content, compresslevel=9, mtime=0))
+        if "br" in self.encodings:
+            encodings["br"] = f"{path}.br"
+            self._write(encodings["br"], brotli.compress(content))
+        self.files[key] = {
+            "path": path,
+            "sha256": sha256,
+            "bytes": len(content),
+            "encodings": encodings,
+            "source": signature,
+        }
+        self.written += 1
+
+    def add_technologies(self):
+        catalog = list(Technology.objects.values("slug", "name", "category"))
+        self.add("technologies", catalog, lambda: catalog)
+
+    def add_details(self, signatures):
+        stale = [
+            pk for pk, (slug, signature) in signatures.items()
+            if self._current(f"projects/{slug}", _digest(self.salt, signature)) is None
+        ]
+        rendered = {}
+        for start in range(0, len(stale), 500):
+            for item in rows.detail_data(Project.objects.filter(pk__in=stale[start:start + 500])):
+                rendered[item["slug"]] = item
+        for slug, signature in signatures.values():
+            self.add(f"projects/{slug}", signature, lambda slug=slug: rendered[slug])
+
+    def add_lists(self, signatures):
+        page_size = api_settings.PAGE_SIZE
+        for ordering in LIST_ORDERINGS:
+            for status in [None, *sorted(ProjectStatus.VALUES)]:
+                queryset = ProjectFilterService.get_queryset(
+                    status=[status] if status else None, ordering=ordering
+                )
+                pks = list(queryset.values_list("pk", flat=True))
+                count, pages = len(pks), max(1, math.ceil(len(pks) / page_size))
+                for page in range(1, pages + 1):
+                    offset = (page - 1) * page_size
+                    members = [signatures[pk] for pk in pks[offset:offset + page_size]]
+
+                    def render(queryset=queryset, offset=offset, page=page, count=count, pages=pages):
+                        values = list(rows.list_values(queryset)[offset:offset + page_size])
+                        return {
+                            "count": count,
+                            "page": page,
+                            "pages": pages,
+                            "results": rows.list_data(values),
+                        }
+
+                    self.add(_list_key(ordering, status, page), [count, pages, members], render)
+
+    def build(self):
+        signatures = project_signatures()
+        self.add_technologies()
+        self.add_details(signatures)
+        self.add_lists(signatures)
+        manifest = {
+            "format": FORMAT,
+            "generated_at": timezone.now().isoformat(),
+            "page_size": api_settings.PAGE_SIZE,
+            "orderings": list(LIST_ORDERINGS),
+            "statuses": sorted(ProjectStatus.VALUES),
+            "files": dict(sorted(self.files.items())),
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        temporary = self.root / (MANIFEST + ".tmp")
+        temporary.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(temporary, self.root / MANIFEST)
+        return manifest
+
+    def unreferenced(self):
+        """Files from the previous manifest that the new one no longer uses."""
+        used = {
+            path for entry in self.files.values() for path in [entry["path"], *entry["encodings"].values()]
+        }
+        return sorted(
+            path
+            for entry in self.previous.values()
+            for path in [entry["path"], *entry["encodings"].values()]
+            if path not in used
+        )
+
+    def prune(self):
+        for path in self.unreferenced():
+            try:
+                (self.root / path).unlink()
+            except FileNotFoundError:
+                continue
+            self.removed.append(path)
+
+
+def build_snapshot(root, compress_brotli=True, full=False, prune=False):
+    """Build or update the snapshot in ``root``; returns the ``SnapshotBuilder``.
+
+    With ``prune``, files only the previous manifest referenced are deleted.
+    Keeping them (the default) lets clients holding the old manifest finish.
+    """
+    builder = SnapshotBuilder(root, compress_brotli=compress_brotli, full=full)
+    builder.build()
+    if prune:
+        builder.prune()
+    return builder
@@ -0,0 +1,22 @@
+"""Background tasks for the project app (run by ``manage.py run_worker``)."""
+
+from django.utils import timezone
+
+from core.jobs import task
+
+from .cache import bump_content_version
+from .images import generate_derivatives
+from .models import Project, ProjectImage
+from .projections import rebuild_cards
+
+
+@task("project.build_image_derivatives")
+def build_image_derivatives(image_id):
+    image = ProjectImage.objects.filter(pk=image_id).first()
+    if image is None or not generate_derivatives(image):
+        return
+    # As in signals.on_image_changed: update() sends no signals, and the
+    # ETag/Last-Modified validators follow the project's updated_at.
+    Project.objects.filter(pk=image.project_id).update(updated_at=timezone.now())
+    rebuild_cards([image.project_id])
+    bump_content_version()
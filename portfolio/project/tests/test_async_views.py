@@ -0,0 +1,71 @@
+"""Tests for the async (ASGI) Project endpoints."""
+
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from project.constants import ProjectStatus
+from project.models import Project, ProjectCard, Technology
+
+
+class AsyncProjectAPITests(TestCase):
+    def setUp(self):
+        cache.clear()
+        react = Technology.objects.create(name="React", slug="react", category="frontend")
+        for i in range(15):
+            project = Project.objects.create(
+                title=f"Project {i}",
+                description="Realtime dashboard" if i % 2 else "Static site",
+                status=ProjectStatus.COMPLETED if i % 3 else ProjectStatus.IN_PROGRESS,
+                display_order=i,
+            )
+            if i % 2:
+                project.technologies.add(react)
+
+    def assertSamePayload(self, sync_response, async_response):
+        sync_data, async_data = sync_response.json(), async_response.json()
+        for data in (sync_data, async_data):
+            for link in ("next", "previous"):
+                if data.get(link):
+                    data[link] = data[link].replace("/api/async/", "/api/")
+        self.assertEqual(async_data, sync_data)
+
+    async def test_list_matches_sync_viewset(self):
+        for query in ("", "?page=2", "?status=completed&technologies=react", "?q=realtime"):
+            sync_response = await self.async_client.get(f"/api/projects/{query}")
+            async_response = await self.async_client.get(f"/api/async/projects/{query}")
+            self.assertEqual(async_response.status_code, 200, query)
+            self.assertSamePayload(sync_response, async_response)
+            self.assertEqual(async_response["ETag"], sync_response["ETag"])
+
+    async def test_list_cache_and_conditional_get(self):
+        first = await self.async_client.get("/api/async/projects/")
+        self.assertEqual(first["X-Cache"], "MISS")
+        second = await self.async_client.get("/api/async/projects/")
+        self.assertEqual(second["X-Cache"], "HIT")
+        not_modified = await self.async_client.get(
+            "/api/async/projects/", headers={"if-none-match": first["ETag"]}
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    async def test_invalid_page(self):
+        response = await self.async_client.get("/api/async/projects/?page=9")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Invalid page."})
+
+    async def test_list_without_cards_falls_back(self):
+        await ProjectCard.objects.all().adelete()
+        sync_response = await self.async_client.get("/api/projects/?page=2")
+        cache.clear()
+        async_response = await self.async_client.get("/api/async/projects/?page=2")
+        self.assertSamePayload(sync_response, async_response)
+
+    async def test_detail_matches_sync_viewset(self):
+        project = await Project.objects.aget(title="Project 3")
+        sync_response = await self.async_client.get(f"/api/projects/{project.slug}/")
+        async_response = await self.async_client.get(f"/api/async/projects/{project.slug}/")
+        self.assertEqual(json.loads(async_response.content), sync_response.json())
+        self.assertEqual(async_response["ETag"], sync_response["ETag"])
+        missing = await self.async_client.get("/api/async/projects/nope/")
+        self.assertEqual(missing.status_code, 404)
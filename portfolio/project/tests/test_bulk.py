@@ -0,0 +1,176 @@
+"""Tests for NDJSON project import/export."""
+
+import json
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from project.bulk import ProjectImporter
+from project.constants import ProjectStatus
+from project.models import Technology, Project, ProjectCard
+
+
+def ndjson(*records):
+    return [json.dumps(r) + "\n" for r in records]
+
+
+class ProjectImporterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_imports_technologies_and_projects(self):
+        report = ProjectImporter().run(ndjson(
+            {"type": "technology", "slug": "react", "name": "React", "category": "frontend"},
+            {
+                "type": "project",
+                "title": "Shop",
+                "description": "Online shop",
+                "status": ProjectStatus.COMPLETED,
+                "key_features": ["Cart"],
+                "technologies": ["react"],
+            },
+        ))
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.created, {"technology": 1, "project": 1})
+        project = Project.objects.get()
+        self.assertEqual(project.slug, "shop")
+        self.assertEqual([t.slug for t in project.technologies.all()], ["react"])
+        # Derived data is refreshed even though save() never ran.
+        self.assertEqual(ProjectCard.objects.get().technologies, [["react", "React", "frontend"]])
+        self.assertEqual(list(Project.objects.all().search("shop")), [project])
+
+    def test_assigns_unique_slugs_in_memory(self):
+        Project.objects.create(title="Site", description="D", status=ProjectStatus.PLANNED)
+        record = {"type": "project", "title": "Site", "description": "D", "status": "planned"}
+        counts = []
+        for size in (2, 5):
+            with CaptureQueriesContext(connection) as ctx:
+                ProjectImporter().run(ndjson(*[record] * size))
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(
+            sorted(Project.objects.values_list("slug", flat=True)),
+            ["site"] + [f"site-{n}" for n in range(1, 8)],
+        )
+
+    def test_updates_existing_project_by_slug_and_replaces_links(self):
+        react = Technology.objects.create(name="React", slug="react")
+        Technology.objects.create(name="Vue", slug="vue")
+        project = Project.objects.create(title="Old", description="D", status=ProjectStatus.PLANNED)
+        project.technologies.add(react)
+        report = ProjectImporter().run(ndjson({
+            "type": "project",
+            "slug": project.slug,
+            "title": "New",
+            "description": "D",
+            "status": ProjectStatus.COMPLETED,
+            "technologies": ["vue"],
+        }))
+        self.assertEqual(report.updated["project"], 1)
+        project.refresh_from_db()
+        self.assertEqual(project.title, "New")
+        self.assertEqual([t.slug for t in project.technologies.all()], ["vue"])
+
+    def test_updates_only_write_the_fields_a_record_carries(self):
+        react = Technology.objects.create(name="React", slug="react", category="frontend")
+        project = Project.objects.create(
+            title="Old",
+            description="D",
+            status=ProjectStatus.PLANNED,
+            key_features=["Search"],
+            display_order=7,
+        )
+        project.technologies.add(react)
+        report = ProjectImporter().run(ndjson(
+            {"type": "technology", "slug": "react", "name": "React"},
+            {"type": "project", "slug": project.slug, "title": "New"},
+            {"type": "project", "slug": project.slug, "status": "nope"},
+            {"type": "project", "slug": project.slug, "title": "Newer"},
+        ))
+        self.assertEqual([e["line"] for e in report.errors], [3, 4])
+        self.assertEqual(report.updated, {"technology": 1, "project": 1})
+        project.refresh_from_db()
+        self.assertEqual(
+            (project.title, project.description, project.key_features, project.display_order),
+            ("New", "D", ["Search"], 7),
+        )
+        self.assertEqual([t.slug for t in project.technologies.all()], ["react"])
+        self.assertEqual(Technology.objects.get().category, "frontend")
+
+    def test_reports_per_record_errors_and_keeps_valid_rows(self):
+        report = ProjectImporter().run(ndjson(
+            {"type": "project", "title": "Ok", "description": "D", "status": "planned"},
+            {"type": "project", "title": "Bad", "description": "D", "status": "nope"},
+            {"type": "project", "title": "Arch", "description": "D", "status": "planned",
+             "architectural_overview": {"api_design": "REST"}},
+            {"type": "project", "title": "Tech", "description": "D", "status": "planned",
+             "technologies": ["missing"]},
+            {"type": "widget"},
+        ) + ["{not json\n"])
+        self.assertEqual(Project.objects.get().title, "Ok")
+        self.assertEqual([e["line"] for e in report.errors], [2, 3, 4, 5, 6])
+
+    def test_reports_technology_collisions_within_a_batch(self):
+        Technology.objects.create(name="Vue", slug="vue")
+        report = ProjectImporter().run(ndjson(
+            {"type": "technology", "slug": "react", "name": "React"},
+            {"type": "technology", "slug": "reactjs", "name": "React"},
+            {"type": "technology", "slug": "react", "name": "React Native"},
+            {"type": "technology", "name": "Vue", "category": "frontend"},
+            {"type": "technology", "slug": "vue", "name": "Vue.js"},
+            {"type": "technology", "slug": "go", "name": "Go"},
+        ))
+        self.assertEqual([e["line"] for e in report.errors], [2, 3, 5])
+        self.assertEqual(report.errors[0]["errors"], ["name: 'React' appears twice in this batch."])
+        self.assertEqual(report.errors[1]["errors"], ["slug: 'react' appears twice in this batch."])
+        self.assertEqual(report.created["technology"], 2)
+        self.assertEqual(
+            sorted(Technology.objects.values_list("slug", "name", "category")),
+            [("go", "Go", "other"), ("react", "React", "other"), ("vue", "Vue", "frontend")],
+        )
+
+    def test_dry_run_rolls_back(self):
+        ProjectImporter(dry_run=True).run(ndjson(
+            {"type": "project", "title": "Ok", "description": "D", "status": "planned"},
+        ))
+        self.assertFalse(Project.objects.exists())
+
+
+class ImportExportCommandTests(TestCase):
+    def test_round_trip(self):
+        react = Technology.objects.create(name="React", slug="react", category="frontend")
+        project = Project.objects.create(
+            title="Round trip",
+            description="D",
+            status=ProjectStatus.COMPLETED,
+            technical_challenges_solutions=[{"challenge": "C", "solution": "S"}],
+        )
+        project.technologies.add(react)
+        with tempfile.NamedTemporaryFile("w+", suffix=".ndjson") as fh:
+            call_command("export_projects", output=fh.name, stderr=StringIO())
+            exported = [json.loads(line) for line in open(fh.name)]
+            Project.objects.all().delete()
+            Technology.objects.all().delete()
+            out = StringIO()
+            call_command("import_projects", fh.name, stdout=out, stderr=StringIO())
+        self.assertEqual([r["type"] for r in exported], ["technology", "project"])
+        self.assertIn("0 rejected", out.getvalue())
+        imported = Project.objects.get()
+        self.assertEqual(imported.slug, project.slug)
+        self.assertEqual(imported.technical_challenges_solutions, [{"challenge": "C", "solution": "S"}])
+        self.assertEqual([t.slug for t in imported.technologies.all()], ["react"])
+
+    def test_fail_on_error(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".ndjson") as fh:
+            fh.write('{"type": "project"}\n')
+            fh.flush()
+            with self.assertRaises(CommandError):
+                call_command(
+                    "import_projects", fh.name, fail_on_error=True, stdout=StringIO(), stderr=StringIO()
+                )
@@ -0,0 +1,130 @@
+"""Tests for the versioned Project API response cache."""
+
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.cache import get_cache_stats, get_content_version, reset_cache_stats
+from project.constants import ProjectStatus
+from project.models import Technology, Project, ProjectImage
+
+
+class ProjectResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.list_url = reverse("project-list")
+        self.project = Project.objects.create(
+            title="Cached", description="D", status=ProjectStatus.COMPLETED
+        )
+        self.detail_url = reverse("project-detail", kwargs={"slug": self.project.slug})
+        reset_cache_stats()
+
+    def test_second_list_request_is_a_hit(self):
+        first = self.client.get(self.list_url)
+        # Only the ETag aggregate runs on a hit.
+        with self.assertNumQueries(1):
+            second = self.client.get(self.list_url)
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(get_cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_equivalent_queries_share_an_entry(self):
+        self.client.get(
+            self.list_url,
+            {"status": [ProjectStatus.PLANNED, ProjectStatus.COMPLETED], "technologies": "b,a"},
+        )
+        response = self.client.get(
+            self.list_url,
+            {"status": [ProjectStatus.COMPLETED, ProjectStatus.PLANNED], "technologies": "a, b,a"},
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_page_is_part_of_the_key(self):
+        self.client.get(self.list_url)
+        response = self.client.get(self.list_url, {"page": 2})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(get_cache_stats()["hits"], 0)
+
+    def test_detail_is_cached_by_slug(self):
+        self.client.get(self.detail_url)
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data["title"], "Cached")
+
+    def test_project_save_invalidates(self):
+        self.client.get(self.detail_url)
+        self.project.title = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.save()
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["title"], "Renamed")
+
+    def test_project_delete_invalidates(self):
+        self.client.get(self.list_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.delete()
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data["results"], [])
+
+    def test_technology_and_m2m_changes_bump_version(self):
+        version = get_content_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            tech = Technology.objects.create(name="React", slug="react")
+        self.assertGreater(get_content_version(), version)
+        version = get_content_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.technologies.add(tech)
+        self.assertGreater(get_content_version(), version)
+        version = get_content_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.technologies.clear()
+        self.assertGreater(get_content_version(), version)
+
+    def test_image_changes_bump_version(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        version = get_content_version()
+        with override_settings(MEDIA_ROOT=media_root), self.captureOnCommitCallbacks(execute=True):
+            image = ProjectImage.objects.create(project=self.project, image="projects/a.png")
+        self.assertGreater(get_content_version(), version)
+        version = get_content_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            image.delete()
+        self.assertGreater(get_content_version(), version)
+
+    @override_settings(PROJECT_API_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_cache(self):
+        self.client.get(self.list_url)
+        response = self.client.get(self.list_url)
+        self.assertNotIn("X-Cache", response)
+
+
+class FileBasedResponseCacheTests(TestCase):
+    def setUp(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        settings_override = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": location,
+                }
+            }
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        Project.objects.create(title="File", description="D", status=ProjectStatus.COMPLETED)
+
+    def test_round_trip_through_file_cache(self):
+        client = APIClient()
+        first = client.get(reverse("project-list"))
+        second = client.get(reverse("project-list"))
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
@@ -0,0 +1,89 @@
+"""Tests for ETag / Last-Modified handling on the Project API."""
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from project.constants import ProjectStatus
+from project.models import Technology, Project, ProjectImage
+
+
+class ProjectConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.list_url = reverse("project-list")
+        self.project = Project.objects.create(
+            title="Cond", description="D", status=ProjectStatus.COMPLETED
+        )
+        self.detail_url = reverse("project-detail", kwargs={"slug": self.project.slug})
+
+    def test_list_sends_validators(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_list_if_none_match_returns_304_with_one_query(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_list_etag_depends_on_filters(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        response = self.client.get(
+            self.list_url, {"status": ProjectStatus.PLANNED}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_etag_changes_on_update_and_delete(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        Project.objects.create(title="New", description="D", status=ProjectStatus.PLANNED)
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.project.delete()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_etag_changes_on_technology_rename(self):
+        tech = Technology.objects.create(name="React", slug="react")
+        self.project.technologies.add(tech)
+        etag = self.client.get(self.list_url)["ETag"]
+        tech.name = "React.js"
+        with self.captureOnCommitCallbacks(execute=True):
+            tech.save()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_if_modified_since(self):
+        last_modified = self.client.get(self.list_url)["Last-Modified"]
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        past = http_date(self.project.updated_at.timestamp() - 60)
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=past)
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_if_none_match_returns_304_with_one_query(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_etag_changes_when_images_change(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        ProjectImage.objects.create(project=self.project, image="projects/a.png")
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_missing_slug_is_404_without_validators(self):
+        response = self.client.get(
+            reverse("project-detail", kwargs={"slug": "missing"}), HTTP_IF_NONE_MATCH='"x"'
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response)
@@ -0,0 +1,72 @@
+"""Tests for the Project facets endpoint."""
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.constants import ProjectStatus
+from project.models import Technology, Project
+
+
+class ProjectFacetsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("project-facets")
+        self.react = Technology.objects.create(name="React", slug="react")
+        self.django = Technology.objects.create(name="Django", slug="django")
+        self.vue = Technology.objects.create(name="Vue", slug="vue")
+        done = Project.objects.create(title="Done", description="D", status=ProjectStatus.COMPLETED)
+        done.technologies.add(self.react)
+        wip = Project.objects.create(title="WIP", description="D", status=ProjectStatus.IN_PROGRESS)
+        wip.technologies.add(self.react, self.django)
+        planned = Project.objects.create(title="Plan", description="D", status=ProjectStatus.PLANNED)
+        planned.technologies.add(self.django)
+
+    def counts(self, data):
+        return (
+            {s["value"]: s["count"] for s in data["status"]},
+            {t["slug"]: t["count"] for t in data["technologies"]},
+        )
+
+    def test_unfiltered_counts(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        status_counts, tech_counts = self.counts(response.data)
+        self.assertEqual(
+            status_counts,
+            {ProjectStatus.COMPLETED: 1, ProjectStatus.IN_PROGRESS: 1, ProjectStatus.PLANNED: 1},
+        )
+        self.assertEqual(tech_counts, {"react": 2, "django": 2, "vue": 0})
+
+    def test_counts_apply_the_other_dimension(self):
+        response = self.client.get(
+            self.url, {"status": ProjectStatus.COMPLETED, "technologies": "django"}
+        )
+        status_counts, tech_counts = self.counts(response.data)
+        # Status counts ignore the status filter but apply the technology filter.
+        self.assertEqual(status_counts[ProjectStatus.COMPLETED], 0)
+        self.assertEqual(status_counts[ProjectStatus.PLANNED], 1)
+        # Technology counts apply the status filter only (any mode).
+        self.assertEqual(tech_counts, {"react": 1, "django": 0, "vue": 0})
+
+    def test_all_mode_technology_counts_drill_down(self):
+        response = self.client.get(self.url, {"technologies": "react", "technologies_mode": "all"})
+        _, tech_counts = self.counts(response.data)
+        self.assertEqual(tech_counts, {"react": 2, "django": 1, "vue": 0})
+
+    def test_runs_two_queries_and_is_cached(self):
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_write_invalidates(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(title="New", description="D", status=ProjectStatus.PLANNED)
+        response = self.client.get(self.url)
+        status_counts, _ = self.counts(response.data)
+        self.assertEqual(status_counts[ProjectStatus.PLANNED], 2)
@@ -0,0 +1,154 @@
+"""Tests for ``?fields=`` / ``?expand=`` on the Project API."""
+
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from project.constants import ProjectStatus
+from project.models import Project, ProjectImage, Technology
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class FieldSelectionAPITests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        react = Technology.objects.create(name="React", slug="react", category="frontend")
+        django = Technology.objects.create(name="Django", slug="django", category="backend")
+        for i in range(3):
+            project = Project.objects.create(
+                title=f"Project {i}",
+                description="Description",
+                key_features=["Search"],
+                architectural_overview={"backend": "Django"},
+                status=ProjectStatus.COMPLETED,
+                display_order=i,
+            )
+            project.technologies.add(react, django)
+            ProjectImage.objects.create(
+                project=project,
+                image=SimpleUploadedFile("shot.png", b"x", content_type="image/png"),
+            )
+        self.project = Project.objects.get(display_order=0)
+        self.detail_url = f"/api/projects/{self.project.slug}/"
+
+    def get_both(self, url):
+        """Responses from the .values() path and from the serializers."""
+        cache.clear()
+        fast = self.client.get(url)
+        cache.clear()
+        with self.settings(PROJECT_API_FAST_SERIALIZATION=False):
+            slow = self.client.get(url)
+        self.assertEqual(fast.content, slow.content, url)
+        return fast
+
+    def selected_sql(self, url, **settings):
+        cache.clear()
+        with self.settings(**settings), CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [query["sql"] for query in ctx.captured_queries]
+
+    def test_list_fields_and_key_order(self):
+        response = self.get_both("/api/projects/?fields=title,slug,thumbnail")
+        item = response.json()["results"][0]
+        self.assertEqual(list(item), ["slug", "title", "thumbnail"])
+        self.assertTrue(item["thumbnail"].startswith("http://testserver/media/"))
+
+    def test_list_expand_collapses_technologies(self):
+        item = self.get_both("/api/projects/?expand=")
+        self.assertEqual(item.json()["results"][0]["technologies"], ["django", "react"])
+        item = self.get_both("/api/projects/?fields=slug,technologies&expand=technologies")
+        self.assertEqual(item.json()["results"][0]["technologies"][0]["slug"], "django")
+
+    def test_list_selects_only_needed_columns(self):
+        url = "/api/projects/?fields=slug,title"
+        for fast in (True, False):
+            statements = self.selected_sql(url, PROJECT_API_FAST_SERIALIZATION=fast)
+            page = statements[-1]
+            self.assertIn('"slug"', page)
+            for column in ("key_features", "description", "architectural_overview", "thumbnail"):
+                self.assertNotIn(f'"{column}"', page, (fast, column))
+
+    def test_detail_fields_skip_relations(self):
+        response = self.get_both(f"{self.detail_url}?fields=title,key_features")
+        self.assertEqual(response.json(), {"title": "Project 0", "key_features": ["Search"]})
+        for fast in (True, False):
+            statements = self.selected_sql(
+                f"{self.detail_url}?fields=title", PROJECT_API_FAST_SERIALIZATION=fast
+            )
+            # Validators, then the project row; no technology or image queries.
+            self.assertEqual(len(statements), 2, statements)
+            self.assertNotIn('"architectural_overview"', statements[-1])
+
+    def test_detail_collapsed_relations(self):
+        response = self.get_both(f"{self.detail_url}?fields=slug,technologies,images&expand=")
+        data = response.json()
+        self.assertEqual(data["technologies"], ["django", "react"])
+        self.assertEqual(len(data["images"]), 1)
+        self.assertTrue(data["images"][0].startswith("http://testserver/media/projects/"))
+        data = self.get_both(f"{self.detail_url}?expand=images").json()
+        self.assertEqual(data["technologies"], ["django", "react"])
+        self.assertIn("srcset", data["images"][0])
+
+    def test_default_selection_is_unchanged(self):
+        full = self.client.get(self.detail_url)
+        explicit = self.client.get(f"{self.detail_url}?expand=technologies,images")
+        self.assertEqual(full.content, explicit.content)
+        self.assertEqual(full["ETag"], explicit["ETag"])
+
+    def test_unknown_names_are_rejected(self):
+        response = self.client.get("/api/projects/?fields=slug,bogus")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Unknown field(s): bogus.", response.json()["fields"][0])
+        response = self.client.get(f"{self.detail_url}?expand=owner")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("expand", response.json())
+        self.assertEqual(self.client.get("/api/projects/?fields=").status_code, 400)
+
+    def test_validators_and_cache_are_per_representation(self):
+        full = self.client.get(self.detail_url)
+        sparse = self.client.get(f"{self.detail_url}?fields=title")
+        self.assertNotEqual(full["ETag"], sparse["ETag"])
+        self.assertEqual(sparse["X-Cache"], "MISS")
+        again = self.client.get(f"{self.detail_url}?fields=title")
+        self.assertEqual(again["X-Cache"], "HIT")
+        self.assertEqual(again.json(), {"title": "Project 0"})
+        not_modified = self.client.get(
+            f"{self.detail_url}?fields=title", headers={"if-none-match": sparse["ETag"]}
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        stale = self.client.get(self.detail_url, headers={"if-none-match": sparse["ETag"]})
+        self.assertEqual(stale.status_code, 200)
+
+        listing = self.client.get("/api/projects/")
+        sparse_list = self.client.get("/api/projects/?fields=slug")
+        self.assertNotEqual(listing["ETag"], sparse_list["ETag"])
+        self.assertEqual(list(sparse_list.json()["results"][0]), ["slug"])
+
+    async def test_async_endpoints_match(self):
+        for query in ("?fields=slug,technologies&expand=", "?fields=title,thumbnail"):
+            sync_response = await self.async_client.get(f"/api/projects/{query}")
+            async_response = await self.async_client.get(f"/api/async/projects/{query}")
+            self.assertEqual(async_response.json()["results"], sync_response.json()["results"])
+            self.assertEqual(async_response["ETag"], sync_response["ETag"])
+        url = f"{self.detail_url}?fields=slug,images&expand="
+        sync_response = await self.async_client.get(url)
+        async_response = await self.async_client.get(url.replace("/api/", "/api/async/"))
+        self.assertEqual(async_response.json(), sync_response.json())
+        self.assertEqual(async_response["ETag"], sync_response["ETag"])
+        bad = await self.async_client.get("/api/async/projects/?fields=bogus")
+        self.assertEqual(bad.status_code, 400)
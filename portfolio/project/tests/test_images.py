@@ -0,0 +1,128 @@
+"""Tests for responsive image derivatives."""
+
+import io
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from core.jobs import Worker
+from project.images import DERIVATIVE_SIZES, render_derivatives
+from project.models import Project, ProjectCard, ProjectImage
+from project.serializers import ProjectImageSerializer, ProjectListSerializer
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def png(width=2000, height=1000, mode="RGB", color="red"):
+    buffer = io.BytesIO()
+    Image.new(mode, (width, height), color).save(buffer, "PNG")
+    return SimpleUploadedFile("shot.png", buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ImageDerivativeTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.project = Project.objects.create(title="Gallery", description="d", status="completed")
+
+    def create_image(self, upload):
+        """Save an image and run the derivative job it queues, as the worker would."""
+        with self.captureOnCommitCallbacks(execute=True):
+            image = ProjectImage.objects.create(project=self.project, image=upload)
+        Worker().run(burst=True)
+        image.refresh_from_db()
+        return image
+
+    def test_render_scales_down_and_never_up(self):
+        rendered = render_derivatives(png(1000, 500).read())
+        self.assertEqual(set(rendered), set(DERIVATIVE_SIZES))
+        self.assertEqual((rendered["thumbnail"]["width"], rendered["thumbnail"]["height"]), (320, 160))
+        self.assertEqual(rendered["full"]["width"], 1000)
+        self.assertEqual(set(rendered["card"]["files"]), {"webp", "jpeg"})
+
+    def test_render_flattens_alpha_for_jpeg(self):
+        rendered = render_derivatives(png(400, 400, mode="RGBA", color=(255, 0, 0, 128)).read())
+        with Image.open(io.BytesIO(rendered["card"]["files"]["jpeg"])) as jpeg:
+            self.assertEqual(jpeg.mode, "RGB")
+        with Image.open(io.BytesIO(rendered["card"]["files"]["webp"])) as webp:
+            self.assertEqual(webp.mode, "RGBA")
+
+    def test_render_rejects_non_images(self):
+        with self.assertRaises(ValueError):
+            render_derivatives(b"not an image")
+
+    def test_generated_on_save_next_to_original(self):
+        image = self.create_image(png())
+        sizes = image.derivatives["sizes"]
+        self.assertEqual(image.derivatives["source"], image.image.name)
+        self.assertEqual(sizes["card"]["width"], 768)
+        directory = os.path.dirname(image.image.name)
+        for entry in sizes.values():
+            for fmt in ("webp", "jpeg"):
+                self.assertEqual(os.path.dirname(entry[fmt]), directory)
+                self.assertTrue(os.path.exists(os.path.join(MEDIA_ROOT, entry[fmt])))
+        self.assertRegex(sizes["card"]["webp"], r"shot[^/]*\.card\.[0-9a-f]{12}\.webp$")
+
+    def test_unreadable_upload_is_recorded_without_sizes(self):
+        image = self.create_image(SimpleUploadedFile("bad.png", b"x"))
+        self.assertEqual(image.derivatives, {"source": image.image.name, "sizes": {}})
+        self.assertIsNone(ProjectImageSerializer(image).data["srcset"])
+
+    def test_serializers_expose_srcset(self):
+        image = self.create_image(png())
+        data = ProjectImageSerializer(image).data
+        self.assertEqual(list(data["variants"]), ["thumbnail", "card", "full"])
+        self.assertIn(" 320w, ", data["srcset"]["webp"])
+        self.assertTrue(data["srcset"]["jpeg"].endswith(" 1600w"))
+
+        project = Project.objects.for_list().get(pk=self.project.pk)
+        row = ProjectListSerializer(project).data
+        card = image.derivatives["sizes"]["card"]
+        self.assertTrue(row["thumbnail"].endswith(card["jpeg"]))
+        self.assertNotIn("1600w", row["thumbnail_srcset"]["webp"])
+        self.assertIn("768w", row["thumbnail_srcset"]["webp"])
+
+    def test_generation_is_deferred_to_the_worker(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = ProjectImage.objects.create(project=self.project, image=png())
+        image.refresh_from_db()
+        self.assertEqual(image.derivatives, {})
+        Worker().run(burst=True)
+        card = ProjectCard.objects.get(project=self.project)
+        self.assertEqual(card.thumbnail_derivatives["sizes"]["card"]["width"], 768)
+
+    def test_worker_run_invalidates_conditional_gets(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectImage.objects.create(project=self.project, image=png())
+        detail_url = f"/api/projects/{self.project.slug}/"
+        etags = {url: self.client.get(url)["ETag"] for url in (detail_url, "/api/projects/")}
+        Worker().run(burst=True)
+        for url, etag in etags.items():
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, url)
+        self.assertIsNotNone(response.json()["results"][0]["thumbnail_srcset"])
+
+    def test_command_regenerates_in_process_pool(self):
+        image = ProjectImage.objects.create(project=self.project, image=png())
+        ProjectImage.objects.filter(pk=image.pk).update(derivatives={})
+        ProjectCard.objects.filter(project=self.project).update(thumbnail_derivatives={})
+        out = StringIO()
+        call_command("regenerate_image_derivatives", workers=2, stdout=out)
+        self.assertIn("Built derivatives for 1 image(s)", out.getvalue())
+        image.refresh_from_db()
+        self.assertEqual(image.derivatives["sizes"]["thumbnail"]["width"], 320)
+        card = ProjectCard.objects.get(project=self.project)
+        self.assertEqual(card.thumbnail_derivatives, image.derivatives)
+
+        call_command("regenerate_image_derivatives", workers=1, stdout=out)
+        self.assertIn("Built derivatives for 0 image(s)", out.getvalue())
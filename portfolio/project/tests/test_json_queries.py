@@ -0,0 +1,88 @@
+"""Tests for ProjectQuerySet JSON queries and the PostgreSQL indexes behind them.
+
+They run on every backend. The index checks only run against PostgreSQL,
+e.g. ``DB_ENGINE=postgres DB_HOST=localhost python manage.py test project``.
+"""
+
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from project import postgres
+from project.constants import ProjectStatus
+from project.models import Project
+
+
+def make(title, **fields):
+    return Project.objects.create(
+        title=title, description="d", status=ProjectStatus.COMPLETED, **fields
+    )
+
+
+class ProjectJSONQueryTests(TestCase):
+    def setUp(self):
+        self.shop = make(
+            "Shop",
+            key_features=["Checkout", "Search"],
+            future_enhancements=["Mobile app"],
+            technical_challenges_solutions=[{"challenge": "Caching", "solution": "Redis"}],
+            architectural_overview={"backend": "Django REST", "database": "PostgreSQL with JSONB"},
+        )
+        self.blog = make(
+            "Blog",
+            key_features=["Search engine"],
+            architectural_overview={"frontend": "Next.js", "overview": "Static site on Postgres"},
+        )
+        self.empty = make("Empty")
+
+    def titles(self, qs):
+        return sorted(qs.values_list("title", flat=True))
+
+    def test_with_feature_matches_whole_items(self):
+        self.assertEqual(self.titles(Project.objects.all().with_feature("Search")), ["Shop"])
+        self.assertEqual(self.titles(Project.objects.all().with_feature("Sear")), [])
+
+    def test_with_enhancement_and_challenge(self):
+        projects = Project.objects.all()
+        self.assertEqual(self.titles(projects.with_enhancement("Mobile app")), ["Shop"])
+        self.assertEqual(self.titles(projects.with_challenge("Caching")), ["Shop"])
+        self.assertEqual(self.titles(projects.with_challenge("Redis")), [])
+
+    def test_with_architecture_key(self):
+        projects = Project.objects.all()
+        self.assertEqual(self.titles(projects.with_architecture_key("database")), ["Shop"])
+        self.assertEqual(self.titles(projects.with_architecture_key("frontend")), ["Blog"])
+
+    def test_architecture_uses(self):
+        projects = Project.objects.all()
+        self.assertEqual(self.titles(projects.architecture_uses("postgres")), ["Blog", "Shop"])
+        self.assertEqual(
+            self.titles(projects.architecture_uses("postgres", key="database")), ["Shop"]
+        )
+        self.assertEqual(self.titles(projects.architecture_uses("Django", key="frontend")), [])
+        self.assertEqual(self.titles(projects.architecture_uses("Django", key="bogus")), [])
+        self.assertEqual(self.titles(projects.architecture_uses("!!")), [])
+
+    def test_composes_with_other_filters(self):
+        qs = Project.objects.for_list().with_feature("Checkout").by_status([ProjectStatus.COMPLETED])
+        self.assertEqual([p.title for p in qs], ["Shop"])
+
+
+@skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+class PostgresIndexTests(TestCase):
+    def test_gin_indexes_exist(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s", [postgres.TABLE]
+            )
+            indexes = dict(cursor.fetchall())
+        for name in postgres.INDEXES:
+            self.assertIn(name, indexes)
+            self.assertIn("USING gin", indexes[name])
+
+    def test_search_ranks_title_matches_first(self):
+        make("Realtime chat")
+        make("Other", problem_statement="realtime updates")
+        qs = Project.objects.all().search("realtime").ordered_by_relevance()
+        self.assertEqual([p.title for p in qs], ["Realtime chat", "Other"])
@@ -1,9 +1,12 @@
 """Tests for Project domain models and validation."""
 
+from unittest import mock
+
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 
+from project import slugs
 from project.constants import ProjectStatus, TechnologyCategory
 from project.models import Technology, Project, ProjectImage
 
@@ -140,3 +143,59 @@ class ProjectImageModelTests(TestCase):
         ProjectImage.objects.create(project=self.project, image=img1, order=1)
         orders = list(ProjectImage.objects.values_list("order", flat=True))
         self.assertEqual(orders, [1, 2])
+
+
+class SlugAllocationTests(TestCase):
+    def create(self, title, **kwargs):
+        return Project.objects.create(
+            title=title, description="D", status=ProjectStatus.COMPLETED, **kwargs
+        )
+
+    def test_next_suffix_after_highest(self):
+        self.create("Portfolio site")
+        self.create("Other", slug="portfolio-site-7")
+        self.create("Other 2", slug="portfolio-site-extra")
+        self.assertEqual(self.create("Portfolio site").slug, "portfolio-site-8")
+
+    def test_single_lookup_regardless_of_collisions(self):
+        for _ in range(5):
+            self.create("Same")
+        with self.assertNumQueries(1):
+            slug = slugs.unique_slug(Project, "Same")
+        self.assertEqual(slug, "same-5")
+
+    def test_batch_allocation_is_unique(self):
+        self.create("Dup")
+        allocated = slugs.allocate_slugs(Project, ["Dup", "Dup", "New"], reserved={"dup-1"})
+        self.assertEqual(allocated, ["dup-2", "dup-3", "new"])
+
+    def test_long_titles_fit_max_length(self):
+        title = "x" * 255
+        Project.objects.create(title=title, description="D", status="completed", slug="x" * 280)
+        slug = slugs.unique_slug(Project, "x" * 300)
+        self.assertLessEqual(len(slug), 280)
+
+    def test_retries_when_slug_taken_concurrently(self):
+        self.create("Race")
+        # Simulate a concurrent writer: the first allocation returns a slug that
+        # is already committed, as if it was taken after the lookup.
+        real = slugs.unique_slug
+        calls = []
+
+        def stale_then_real(*args, **kwargs):
+            calls.append(args)
+            return "race" if len(calls) == 1 else real(*args, **kwargs)
+
+        with mock.patch("project.slugs.unique_slug", side_effect=stale_then_real):
+            project = self.create("Race")
+        self.assertEqual(project.slug, "race-1")
+        self.assertEqual(len(calls), 2)
+
+    def test_explicit_duplicate_slug_is_not_rewritten(self):
+        self.create("A", slug="taken")
+        with self.assertRaises(ValidationError):
+            self.create("B", slug="taken")
+
+    def test_technology_slug_collision(self):
+        Technology.objects.create(name="C")
+        self.assertEqual(Technology.objects.create(name="C#").slug, "c-1")
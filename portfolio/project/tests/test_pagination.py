@@ -0,0 +1,88 @@
+"""Tests for keyset (cursor) pagination of the Project list."""
+
+import base64
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.constants import ProjectStatus
+from project.models import Technology, Project
+from project.services import ProjectFilterService
+
+
+class ProjectKeysetPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.list_url = reverse("project-list")
+        tech = Technology.objects.create(name="React", slug="react")
+        for i in range(30):
+            p = Project.objects.create(
+                title=f"P{i}",
+                description="D",
+                status=ProjectStatus.COMPLETED,
+                # Many ties on display_order to exercise the tiebreakers.
+                display_order=i % 3,
+            )
+            if i % 2:
+                p.technologies.add(tech)
+
+    def walk(self, params):
+        ids = []
+        response = self.client.get(self.list_url, {**params, "pagination": "cursor"})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item["id"] for item in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_walks_every_ordering_without_gaps_or_duplicates(self):
+        for ordering in sorted(ProjectFilterService.ORDERING_CHOICES):
+            with self.subTest(ordering=ordering):
+                expected = list(
+                    ProjectFilterService.get_queryset(ordering=ordering).values_list("id", flat=True)
+                )
+                self.assertEqual(self.walk({"ordering": ordering}), expected)
+
+    def test_walks_filtered_set(self):
+        expected = list(
+            ProjectFilterService.get_queryset(technology_slugs=["react"]).values_list("id", flat=True)
+        )
+        self.assertEqual(len(expected), 15)
+        self.assertEqual(self.walk({"technologies": "react"}), expected)
+
+    def test_no_count_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.list_url, {"pagination": "cursor"})
+        self.assertEqual(len(response.data["results"]), 12)
+        self.assertNotIn("count", response.data)
+        self.assertFalse(any("COUNT(" in q["sql"] for q in ctx.captured_queries))
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get(self.list_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_malformed_cursor_values_are_404(self):
+        def cursor(values):
+            return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+        cases = [
+            {"cursor": cursor([{"a": 1}, "2026-01-01T00:00:00Z", 1])},
+            {"cursor": cursor([1, "yesterday", 1])},
+            {"cursor": cursor([1, None, 1])},
+            {"cursor": cursor([{"a": 1}, 1]), "q": "project"},
+            {"cursor": cursor(["best", 1]), "q": "project"},
+        ]
+        for params in cases:
+            response = self.client.get(self.list_url, params)
+            self.assertEqual(response.status_code, 404, params)
+
+    def test_page_number_pagination_is_still_default(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data["count"], 30)
@@ -0,0 +1,122 @@
+"""Tests for the denormalized ProjectCard projection."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from project.cache import get_content_version
+from project.constants import ProjectStatus
+from project.models import Technology, Project, ProjectCard, ProjectImage
+from project.projections import rebuild_cards, verify_cards
+from project.serializers import ProjectListSerializer
+
+
+class ProjectCardProjectionTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.react = Technology.objects.create(name="React", slug="react", category="frontend")
+            self.project = Project.objects.create(
+                title="Card", description="word " * 60, status=ProjectStatus.COMPLETED
+            )
+
+    def card(self):
+        return ProjectCard.objects.get(project=self.project)
+
+    def test_card_built_on_save(self):
+        card = self.card()
+        self.assertTrue(card.short_description.endswith("..."))
+        self.assertLessEqual(len(card.short_description), 200)
+        self.assertEqual(card.thumbnail, "")
+
+    def test_technology_links_and_rename(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.technologies.add(self.react)
+        self.assertEqual(self.card().technologies, [["react", "React", "frontend"]])
+        self.react.name = "React.js"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.react.save()
+        self.assertEqual(self.card().technologies, [["react", "React.js", "frontend"]])
+
+    def test_reverse_m2m_and_technology_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.react.projects.add(self.project)
+        self.assertEqual(len(self.card().technologies), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.react.projects.clear()
+        self.assertEqual(self.card().technologies, [])
+        self.react.projects.add(self.project)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.react.delete()
+        self.assertEqual(self.card().technologies, [])
+
+    def test_thumbnail_follows_image_order(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectImage.objects.create(project=self.project, image="projects/b.png", order=2)
+            first = ProjectImage.objects.create(project=self.project, image="projects/a.png", order=1)
+        self.assertEqual(self.card().thumbnail, "projects/a.png")
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(self.card().thumbnail, "projects/b.png")
+
+    def test_project_delete_cascades(self):
+        ProjectImage.objects.create(project=self.project, image="projects/a.png")
+        Project.objects.filter(pk=self.project.pk).delete()
+        self.assertFalse(ProjectCard.objects.exists())
+
+    def test_refreshed_on_commit_only(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.project.description = "Short"
+            self.project.save()
+        # Nothing derived changes until the transaction commits.
+        self.assertTrue(self.card().short_description.endswith("..."))
+        version = get_content_version()
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.card().short_description, "Short")
+        self.assertGreater(get_content_version(), version)
+
+    def test_rolled_back_write_changes_nothing(self):
+        version = get_content_version()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.react.projects.add(self.project)
+            Technology.objects.create(name="React", slug="react-2")
+        self.assertEqual(self.card().technologies, [])
+        self.assertEqual(get_content_version(), version)
+
+    def test_verify_reports_missing_and_stale(self):
+        ProjectCard.objects.filter(project=self.project).update(short_description="Old")
+        with self.captureOnCommitCallbacks(execute=True):
+            other = Project.objects.create(title="Other", description="D", status=ProjectStatus.PLANNED)
+        ProjectCard.objects.filter(project=other).delete()
+        problems = verify_cards()
+        self.assertEqual(problems[self.project.pk], "stale: short_description")
+        self.assertEqual(problems[other.pk], "missing")
+        rebuild_cards()
+        self.assertEqual(verify_cards(), {})
+
+    def test_serializer_falls_back_without_card(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.technologies.add(self.react)
+        expected = ProjectListSerializer(Project.objects.get(pk=self.project.pk)).data
+        ProjectCard.objects.all().delete()
+        data = ProjectListSerializer(Project.objects.get(pk=self.project.pk)).data
+        self.assertEqual(data, expected)
+
+
+class RebuildProjectCardsCommandTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            title="Cmd", description="D", status=ProjectStatus.COMPLETED
+        )
+        ProjectCard.objects.all().delete()
+
+    def test_verify_fails_then_rebuild_fixes(self):
+        with self.assertRaises(CommandError):
+            call_command("rebuild_project_cards", "--verify", stdout=StringIO())
+        out = StringIO()
+        call_command("rebuild_project_cards", stdout=out)
+        self.assertIn("Rebuilt 1 project card(s).", out.getvalue())
+        call_command("rebuild_project_cards", "--verify", stdout=StringIO())
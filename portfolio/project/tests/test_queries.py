@@ -0,0 +1,89 @@
+"""Query-count regression tests for Project list endpoints."""
+
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project.constants import ProjectStatus
+from project.models import Technology, Project, ProjectImage
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class QueryCountTestCase(TestCase):
+    """Creates projects with technologies and images and counts the queries a URL runs."""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.techs = [
+            Technology.objects.create(name="React", slug="react"),
+            Technology.objects.create(name="Django", slug="django"),
+        ]
+
+    def create_projects(self, count):
+        for i in range(count):
+            with self.captureOnCommitCallbacks(execute=True):
+                p = Project.objects.create(
+                    title=f"Project {Project.objects.count()}",
+                    description="Desc",
+                    status=ProjectStatus.COMPLETED,
+                )
+                p.technologies.add(*self.techs)
+                for order in (2, 1):
+                    ProjectImage.objects.create(
+                        project=p,
+                        image=SimpleUploadedFile(f"{order}.png", b"x", content_type="image/png"),
+                        order=order,
+                    )
+
+    def count_queries(self, client, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def assertConstantQueries(self, client, url, sizes=(2, 8)):
+        counts = []
+        created = 0
+        for size in sizes:
+            self.create_projects(size - created)
+            created = size
+            counts.append(self.count_queries(client, url))
+        self.assertEqual(len(set(counts)), 1, f"query count grows with rows: {counts}")
+        return counts[0]
+
+
+class ProjectListQueryCountTests(QueryCountTestCase):
+    def test_list_query_count_is_constant(self):
+        client = APIClient()
+        count = self.assertConstantQueries(client, reverse("project-list"))
+        # ETag aggregate, COUNT(*), projects joined with their cards.
+        self.assertEqual(count, 3)
+
+    def test_thumbnail_is_first_image_by_order(self):
+        self.create_projects(1)
+        response = APIClient().get(reverse("project-list"))
+        project = Project.objects.get()
+        expected = project.images.order_by("order", "id").first().image.url
+        self.assertTrue(response.data["results"][0]["thumbnail"].endswith(expected))
+
+
+class ProjectAdminQueryCountTests(QueryCountTestCase):
+    def test_changelist_query_count_is_constant(self):
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(user)
+        self.assertConstantQueries(self.client, reverse("admin:project_project_changelist"))
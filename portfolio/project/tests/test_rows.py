@@ -0,0 +1,161 @@
+"""Tests for the ``.values()`` serialization path and the JSON renderer."""
+
+import json
+from datetime import datetime, timezone
+import shutil
+import tempfile
+from unittest import mock, skipIf
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+
+from project import renderers, rows
+from project.constants import ProjectStatus
+from project.pagination import ProjectKeysetPagination
+from project.models import Project, ProjectCard, ProjectImage, Technology
+from project.projections import rebuild_cards
+from project.serializers import ProjectDetailSerializer, ProjectListSerializer
+from project.services import ProjectFilterService
+
+MEDIA_ROOT = tempfile.mkdtemp()
+DERIVATIVES = {
+    "source": "projects/shot.png",
+    "sizes": {
+        size: {
+            "width": width,
+            "height": width // 2,
+            "webp": f"projects/shot.{size}.abc.webp",
+            "jpeg": f"projects/shot.{size}.abc.jpg",
+        }
+        for size, width in (("thumbnail", 320), ("card", 768), ("full", 1600))
+    },
+}
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class RowSerializationTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.request = APIRequestFactory().get("/api/projects/")
+        react = Technology.objects.create(name="React", slug="react", category="frontend")
+        django = Technology.objects.create(name="Django", slug="django", category="backend")
+        for i in range(4):
+            project = Project.objects.create(
+                title=f"Project {i} – ünïcode",
+                description="Long description " * (i * 10 + 1),
+                key_features=["Search"],
+                technical_challenges_solutions=[{"challenge": "C", "solution": "S"}],
+                architectural_overview={"backend": "Django"},
+                live_demo_url="https://example.com/demo" if i % 2 else "",
+                status=ProjectStatus.COMPLETED,
+                display_order=i,
+            )
+            project.technologies.add(react, django)
+            if i < 2:
+                image = ProjectImage.objects.create(
+                    project=project,
+                    image=SimpleUploadedFile("shot.png", b"x", content_type="image/png"),
+                    caption="Shot",
+                )
+                if i == 0:
+                    ProjectImage.objects.filter(pk=image.pk).update(derivatives=DERIVATIVES)
+        rebuild_cards()
+
+    def test_list_matches_serializer(self):
+        queryset = ProjectFilterService.get_queryset()
+        expected = ProjectListSerializer(queryset, many=True, context={"request": self.request}).data
+        data = rows.list_data(list(rows.list_values(queryset)), self.request)
+        self.assertEqual(render(data), render(expected))
+        self.assertIsNotNone(data[0]["thumbnail_srcset"])
+
+    def test_list_without_cards_matches_serializer(self):
+        ProjectCard.objects.filter(project__display_order__in=[0, 3]).delete()
+        queryset = ProjectFilterService.get_queryset()
+        expected = ProjectListSerializer(queryset, many=True, context={"request": self.request}).data
+        data = rows.list_data(list(rows.list_values(queryset)), self.request)
+        self.assertEqual(render(data), render(expected))
+
+    def test_detail_matches_serializer(self):
+        queryset = Project.objects.for_detail().order_by("pk")
+        expected = [
+            ProjectDetailSerializer(project, context={"request": self.request}).data
+            for project in queryset
+        ]
+        data = rows.detail_data(Project.objects.order_by("pk"), self.request)
+        self.assertEqual(render(data), render(expected))
+        self.assertEqual(rows.detail_data(Project.objects.none()), [])
+
+    def test_views_match_serializer_path(self):
+        client = APIClient()
+        project = Project.objects.get(display_order=0)
+        urls = [
+            "/api/projects/",
+            "/api/projects/?pagination=cursor",
+            "/api/projects/?q=description",
+            f"/api/projects/{project.slug}/",
+        ]
+        for url in urls:
+            cache.clear()
+            fast = client.get(url)
+            cache.clear()
+            with self.settings(PROJECT_API_FAST_SERIALIZATION=False):
+                slow = client.get(url)
+            self.assertEqual(fast.status_code, 200, url)
+            self.assertEqual(fast.content, slow.content, url)
+        self.assertEqual(client.get("/api/projects/missing/").json(), {
+            "detail": "No Project matches the given query."
+        })
+
+    def test_keyset_cursor_from_rows(self):
+        client = APIClient()
+        with mock.patch.object(ProjectKeysetPagination, "page_size", 3):
+            first = client.get("/api/projects/?pagination=cursor").json()
+            second = client.get(first["next"]).json()
+            with self.settings(PROJECT_API_FAST_SERIALIZATION=False):
+                cache.clear()
+                expected = client.get("/api/projects/?pagination=cursor").json()
+        self.assertEqual(first["next"], expected["next"])
+        self.assertEqual(len(first["results"]) + len(second["results"]), 4)
+        self.assertIsNone(second["next"])
+
+
+class RendererTests(TestCase):
+    payload = {"title": "Caf\u00e9 \u2028 line", "n": 1.5, "items": [None, True], "when": None}
+
+    def test_json_backend_is_drf_renderer(self):
+        with self.settings(PROJECT_API_JSON_BACKEND="json"):
+            self.assertEqual(renderers.dumps(self.payload), render(self.payload))
+
+    @skipIf(renderers.orjson is None, "orjson is not installed")
+    def test_orjson_backend_matches_stdlib(self):
+        payload = {**self.payload, "when": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+        with self.settings(PROJECT_API_JSON_BACKEND="orjson"):
+            self.assertEqual(renderers.dumps(payload), render(payload))
+
+    def test_backend_validation(self):
+        with self.settings(PROJECT_API_JSON_BACKEND="simd"):
+            with self.assertRaises(ImproperlyConfigured):
+                renderers.get_backend()
+        if renderers.orjson is None:
+            with self.settings(PROJECT_API_JSON_BACKEND="orjson"):
+                with self.assertRaises(ImproperlyConfigured):
+                    renderers.get_backend()
+
+    def test_indented_output_uses_stdlib(self):
+        content = renderers.ProjectJSONRenderer().render(
+            self.payload, "application/json; indent=2", {}
+        )
+        self.assertEqual(json.loads(content), self.payload)
+        self.assertIn(b"\n  ", content)
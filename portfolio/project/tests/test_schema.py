@@ -0,0 +1,184 @@
+"""Tests for the compiled Project JSON schema."""
+
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from project.constants import ProjectStatus
+from project.models import Project
+from project.schema import PROJECT_JSON_SCHEMA
+from project.validators import (
+    validate_architecture_structure,
+    validate_challenges_solutions,
+    validate_string_list,
+)
+
+
+def legacy_normalize(value):
+    """The normalization ``Project.save`` applied before the schema existed."""
+    if not value or not isinstance(value, list):
+        return value
+    normalized = []
+    for item in value:
+        if item is None:
+            continue
+        if isinstance(item, dict):
+            challenge = item.get("challenge") or item.get("Challenge")
+            solution = item.get("solution") or item.get("Solution")
+            if challenge is not None and solution is not None:
+                normalized.append({"challenge": str(challenge), "solution": str(solution)})
+            continue
+        if isinstance(item, (list, tuple)) and len(item) == 2:
+            normalized.append({"challenge": str(item[0]), "solution": str(item[1])})
+    return normalized
+
+
+def legacy_validate(field, value):
+    """``(normalized, message)`` from the ``validators.py`` functions."""
+    try:
+        if field == "technical_challenges_solutions":
+            value = legacy_normalize(value)
+            validate_challenges_solutions(value)
+        elif field == "architectural_overview":
+            if value:
+                validate_architecture_structure(value)
+        else:
+            validate_string_list(value, field)
+    except ValidationError as exc:
+        return None, exc.messages
+    return value, None
+
+
+CASES = {
+    "key_features": [
+        None, [], "", {}, ["a", "b"], "text", {"a": 1}, ["a", 1], [None], 0, 5, ("a",),
+    ],
+    "future_enhancements": [[], ["x"], {"not": "a list"}, [["nested"]]],
+    "technical_challenges_solutions": [
+        None,
+        [],
+        {},
+        [{"challenge": "Perf", "solution": "Caching"}],
+        [{"Challenge": "Perf", "Solution": 3}],
+        [{"challenge": "", "Challenge": "Fallback", "solution": "s"}],
+        [{"challenge": "", "solution": "s"}],
+        [{"wrong": "keys"}],
+        [None, ["a", "b"], ("c", "d"), ["too", "many", "items"], 7, "text"],
+        {"challenge": "c", "solution": "s"},
+        "text",
+        ("a", "b"),
+    ],
+    "architectural_overview": [
+        None,
+        {},
+        [],
+        ["not", "a", "dict"],
+        "text",
+        {"frontend": "React", "backend": "Django"},
+        {"invalid_key": "value", "other": 1},
+        {"frontend": 1},
+        {"stages": [{"name": "n", "description": "d"}]},
+        {"stages": [{"name": "n"}]},
+        {"stages": ["stage"]},
+        {"stages": "Plan, build"},
+        {"stages": {"name": "n", "description": "d"}},
+        {"overview": "x", "stages": [], "database": None},
+    ],
+}
+
+
+class ProjectJSONSchemaTests(SimpleTestCase):
+    def test_matches_legacy_validators(self):
+        for field, values in CASES.items():
+            for value in values:
+                with self.subTest(field=field, value=value):
+                    expected, message = legacy_validate(field, value)
+                    cleaned, errors = PROJECT_JSON_SCHEMA.validate_many([{field: value}])[0]
+                    if message:
+                        self.assertEqual(errors, {field: message})
+                    else:
+                        self.assertIsNone(errors)
+                        self.assertEqual(cleaned[field], expected)
+
+    def test_validate_reports_every_invalid_field(self):
+        with self.assertRaises(ValidationError) as ctx:
+            PROJECT_JSON_SCHEMA.validate({
+                "key_features": [1],
+                "future_enhancements": ["ok"],
+                "architectural_overview": {"bogus": "x"},
+            })
+        self.assertEqual(set(ctx.exception.message_dict), {"key_features", "architectural_overview"})
+        self.assertEqual(ctx.exception.message_dict["key_features"], ["key_features[0] must be a string."])
+
+    def test_validate_many(self):
+        results = PROJECT_JSON_SCHEMA.validate_many([
+            {"technical_challenges_solutions": [["a", "b"]]},
+            {"key_features": "text"},
+            {},
+        ])
+        self.assertEqual(
+            results[0], ({"technical_challenges_solutions": [{"challenge": "a", "solution": "b"}]}, None)
+        )
+        self.assertEqual(results[1], ({}, {"key_features": ["key_features must be a list."]}))
+        self.assertEqual(results[2], ({}, None))
+
+
+class ProjectValidationTests(TestCase):
+    def project(self, **fields):
+        return Project(title="X", description="Y", status=ProjectStatus.COMPLETED, **fields)
+
+    def test_save_normalizes_and_validates(self):
+        project = self.project(technical_challenges_solutions=[{"Challenge": "c", "Solution": "s"}])
+        project.save()
+        project.refresh_from_db()
+        self.assertEqual(project.technical_challenges_solutions, [{"challenge": "c", "solution": "s"}])
+
+        project.key_features = ["ok", 2]
+        with self.assertRaises(ValidationError) as ctx:
+            project.save()
+        self.assertEqual(ctx.exception.message_dict["key_features"], ["key_features[1] must be a string."])
+
+    def test_validated_save_skips_full_clean(self):
+        project = self.project()
+        with mock.patch.object(Project, "full_clean") as full_clean:
+            project.save(validated=True)
+        full_clean.assert_not_called()
+        self.assertTrue(project.slug)
+        project.title = "Y"
+        with mock.patch.object(Project, "full_clean") as full_clean:
+            project.save()
+        full_clean.assert_called_once()
+
+    def test_admin_shows_json_errors_on_the_form(self):
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(user)
+        data = {
+            "title": "Admin project",
+            "slug": "",
+            "description": "Desc",
+            "status": ProjectStatus.COMPLETED,
+            "display_order": 0,
+            "key_features": json.dumps(["Search"]),
+            "technical_challenges_solutions": json.dumps([{"Challenge": "c", "Solution": "s"}]),
+            "architectural_overview": json.dumps({"api_design": "REST"}),
+            "future_enhancements": "[]",
+            "images-TOTAL_FORMS": 0,
+            "images-INITIAL_FORMS": 0,
+        }
+        response = self.client.post("/admin/project/project/add/", data)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            "Invalid keys in architectural_overview: [&#x27;api_design&#x27;]",
+            response.content.decode(),
+        )
+        self.assertFalse(Project.objects.exists())
+
+        data["architectural_overview"] = json.dumps({"backend": "Django"})
+        response = self.client.post("/admin/project/project/add/", data)
+        self.assertEqual(response.status_code, 302)
+        project = Project.objects.get()
+        self.assertEqual(project.slug, "admin-project")
+        self.assertEqual(project.technical_challenges_solutions, [{"challenge": "c", "solution": "s"}])
@@ -0,0 +1,113 @@
+"""Tests for project full-text search."""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from project import search
+from project.constants import ProjectStatus
+from project.models import Project
+
+
+class ProjectSearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.list_url = reverse("project-list")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.title_hit = Project.objects.create(
+                title="Realtime chat", description="Messaging app", status=ProjectStatus.COMPLETED
+            )
+            self.body_hit = Project.objects.create(
+                title="Dashboard",
+                description="Analytics",
+                status=ProjectStatus.PLANNED,
+                key_features=["Realtime charts"],
+                technical_challenges_solutions=[
+                    {"challenge": "Websocket fan-out", "solution": "Redis pub/sub"}
+                ],
+            )
+            Project.objects.create(title="Blog", description="Static site", status=ProjectStatus.COMPLETED)
+
+    def titles(self, response):
+        return [p["title"] for p in response.data["results"]]
+
+    def test_fts_table_is_available(self):
+        self.assertTrue(search.uses_fts())
+
+    def test_q_ranks_title_matches_first(self):
+        response = self.client.get(self.list_url, {"q": "realtime"})
+        self.assertEqual(self.titles(response), ["Realtime chat", "Dashboard"])
+
+    def test_q_indexes_json_fields_and_prefix_matches(self):
+        response = self.client.get(self.list_url, {"q": "redis pub"})
+        self.assertEqual(self.titles(response), ["Dashboard"])
+
+    def test_all_terms_must_match(self):
+        response = self.client.get(self.list_url, {"q": "realtime static"})
+        self.assertEqual(self.titles(response), [])
+
+    def test_operators_are_treated_as_text(self):
+        response = self.client.get(self.list_url, {"q": 'title: "NEAR( OR *'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_punctuation_only_query_matches_nothing(self):
+        for params in ({"q": "!!!"}, {"q": "!!!", "pagination": "cursor"}):
+            response = self.client.get(self.list_url, params)
+            self.assertEqual(response.status_code, 200, params)
+            self.assertEqual(self.titles(response), [])
+        response = self.client.get("/api/async/projects/", {"q": "!!!"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"], [])
+
+    def test_search_is_a_lazy_subquery(self):
+        with self.assertNumQueries(0):
+            queryset = Project.objects.all().search("realtime").ordered_by_relevance()
+        with self.assertNumQueries(1):
+            self.assertEqual([p.title for p in queryset], ["Realtime chat", "Dashboard"])
+
+    def test_explicit_ordering_overrides_relevance(self):
+        response = self.client.get(self.list_url, {"q": "realtime", "ordering": "newest"})
+        self.assertEqual(self.titles(response), ["Dashboard", "Realtime chat"])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.title_hit.title = "Video calls"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.title_hit.save()
+        response = self.client.get(self.list_url, {"q": "video"})
+        self.assertEqual(self.titles(response), ["Video calls"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.title_hit.delete()
+        response = self.client.get(self.list_url, {"q": "video"})
+        self.assertEqual(self.titles(response), [])
+
+    def test_cursor_pagination_over_relevance(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(13):
+                Project.objects.create(title=f"Realtime {i}", description="D", status=ProjectStatus.PLANNED)
+        response = self.client.get(self.list_url, {"q": "realtime", "pagination": "cursor"})
+        seen = self.titles(response)
+        response = self.client.get(response.data["next"])
+        seen += self.titles(response)
+        self.assertEqual(len(seen), 15)
+        self.assertEqual(len(set(seen)), 15)
+
+    def test_icontains_fallback_without_fts(self):
+        with mock.patch("project.search.uses_fts", return_value=False):
+            qs = Project.objects.all().search("REALTIME")
+            self.assertEqual({p.title for p in qs}, {"Realtime chat", "Dashboard"})
+
+    def test_admin_search_uses_index(self):
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("admin:project_project_changelist"), {"q": "redis"})
+        self.assertTrue(any(f"{search.FTS_TABLE} MATCH" in q["sql"] for q in ctx.captured_queries))
+        self.assertContains(response, "Dashboard")
+        self.assertNotContains(response, "Realtime chat")
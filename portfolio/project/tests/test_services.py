@@ -2,7 +2,7 @@
 
 from django.test import TestCase
 
-from project.constants import ProjectStatus
+from project.constants import ProjectStatus, TechnologyMatch
 from project.models import Technology, Project
 from project.services import ProjectFilterService
 
@@ -62,6 +62,31 @@ class ProjectFilterServiceTests(TestCase):
         qs = ProjectFilterService.get_queryset(technology_slugs=["react", "django"])
         self.assertEqual(qs.count(), 3)
 
+    def test_filter_by_all_technologies(self):
+        qs = ProjectFilterService.get_queryset(
+            technology_slugs=["react", "django"], technologies_mode=TechnologyMatch.ALL
+        )
+        self.assertEqual(list(qs.values_list("title", flat=True)), ["WIP"])
+
+    def test_filter_all_with_unknown_slug_matches_nothing(self):
+        qs = ProjectFilterService.get_queryset(
+            technology_slugs=["react", "vue"], technologies_mode=TechnologyMatch.ALL
+        )
+        self.assertEqual(qs.count(), 0)
+
+    def test_filter_any_returns_each_project_once_without_distinct(self):
+        qs = ProjectFilterService.get_queryset(
+            technology_slugs=["react", "django"], technologies_mode=TechnologyMatch.ANY
+        )
+        self.assertEqual(len(list(qs)), 3)
+        self.assertFalse(qs.query.distinct)
+
+    def test_invalid_technologies_mode_falls_back_to_any(self):
+        qs = ProjectFilterService.get_queryset(
+            technology_slugs=["react", "django"], technologies_mode="bogus"
+        )
+        self.assertEqual(qs.count(), 3)
+
     def test_ordering_newest_first(self):
         qs = ProjectFilterService.get_queryset(ordering="newest")
         self.assertEqual(qs.first().title, "WIP")
@@ -0,0 +1,126 @@
+"""Tests for the static API snapshot (``build_api_snapshot``)."""
+
+import gzip
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from project import snapshots
+from project.constants import ProjectStatus
+from project.models import Project, Technology
+
+
+class APISnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.react = Technology.objects.create(name="React", slug="react", category="frontend")
+        for i in range(14):
+            project = Project.objects.create(
+                title=f"Project {i}",
+                description="Description",
+                key_features=["Search"],
+                status=ProjectStatus.COMPLETED if i % 2 else ProjectStatus.IN_PROGRESS,
+                display_order=i,
+            )
+            project.technologies.add(self.react)
+
+    def build(self, **options):
+        call_command(
+            "build_api_snapshot", output=str(self.root), stdout=io.StringIO(), stderr=io.StringIO(), **options
+        )
+        return json.loads((self.root / "manifest.json").read_text())
+
+    def read(self, manifest, key):
+        entry = manifest["files"][key]
+        content = (self.root / entry["path"]).read_bytes()
+        self.assertEqual(gzip.decompress((self.root / entry["encodings"]["gzip"]).read_bytes()), content)
+        return content
+
+    def test_documents_match_the_api(self):
+        manifest = self.build()
+        files = manifest["files"]
+        self.assertIn("technologies", files)
+        self.assertEqual(json.loads(self.read(manifest, "technologies")),
+                         [{"slug": "react", "name": "React", "category": "frontend"}])
+
+        detail = self.client.get("/api/projects/project-0/")
+        self.assertEqual(self.read(manifest, "projects/project-0"), detail.content)
+
+        page = json.loads(self.read(manifest, "projects/list/display/all/2"))
+        api = self.client.get("/api/projects/?page=2").json()
+        self.assertEqual((page["count"], page["page"], page["pages"]), (14, 2, 2))
+        self.assertEqual(page["results"], api["results"])
+        completed = json.loads(self.read(manifest, "projects/list/newest/completed/1"))
+        self.assertEqual(completed["results"],
+                         self.client.get("/api/projects/?status=completed&ordering=newest").json()["results"])
+        self.assertEqual(json.loads(self.read(manifest, "projects/list/oldest/planned/1"))["count"], 0)
+        # Content-hashed names.
+        entry = files["projects/project-0"]
+        self.assertEqual(entry["path"], f"projects/project-0.{entry['sha256'][:12]}.json")
+
+    def test_rebuild_only_rewrites_changed_documents(self):
+        first = self.build()
+        builder = snapshots.build_snapshot(self.root)
+        self.assertEqual(builder.written, 0)
+        self.assertEqual(builder.reused, len(first["files"]))
+
+        project = Project.objects.get(slug="project-13")
+        project.title = "Renamed"
+        project.save()
+        builder = snapshots.build_snapshot(self.root, prune=True)
+        changed = {
+            key for key, entry in builder.files.items()
+            if entry["path"] != first["files"][key]["path"]
+        }
+        # Its detail, and the list pages it appears on; display and oldest
+        # put it on page 2 of all projects, newest on page 1.
+        self.assertEqual(changed, {
+            "projects/project-13",
+            "projects/list/display/all/2",
+            "projects/list/display/completed/1",
+            "projects/list/newest/all/1",
+            "projects/list/newest/completed/1",
+            "projects/list/oldest/all/2",
+            "projects/list/oldest/completed/1",
+        })
+        self.assertEqual(builder.written, len(changed))
+        old = first["files"]["projects/project-13"]
+        self.assertFalse((self.root / old["path"]).exists())
+        self.assertFalse((self.root / old["encodings"]["gzip"]).exists())
+        manifest = json.loads((self.root / "manifest.json").read_text())
+        self.assertIn(b'"Renamed"', self.read(manifest, "projects/project-13"))
+
+    def test_technology_rename_and_deletion(self):
+        first = self.build()
+        self.react.name = "React.js"
+        self.react.save()
+        Project.objects.get(slug="project-0").delete()
+        manifest = self.build()
+        self.assertNotIn("projects/project-0", manifest["files"])
+        for key in ("technologies", "projects/project-5", "projects/list/display/all/1"):
+            self.assertNotEqual(manifest["files"][key]["path"], first["files"][key]["path"], key)
+        # Old files are kept without --prune.
+        self.assertTrue((self.root / first["files"]["projects/project-0"]["path"]).exists())
+
+    def test_full_rebuild_ignores_signatures(self):
+        self.build()
+        builder = snapshots.build_snapshot(self.root, full=True)
+        self.assertEqual(builder.reused, 0)
+        self.assertGreater(builder.written, 0)
+
+    @unittest.skipIf(snapshots.brotli is None, "brotli is not installed")
+    def test_brotli_copies(self):
+        manifest = self.build()
+        entry = manifest["files"]["technologies"]
+        content = (self.root / entry["path"]).read_bytes()
+        self.assertEqual(snapshots.brotli.decompress((self.root / entry["encodings"]["br"]).read_bytes()), content)
+        self.assertNotIn("br", self.build(no_brotli=True)["files"]["technologies"]["encodings"])
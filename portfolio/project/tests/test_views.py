@@ -1,5 +1,6 @@
 """Tests for Project API views."""
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
@@ -11,6 +12,7 @@ from project.models import Technology, Project
 
 class ProjectAPIListTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.list_url = reverse("project-list")
 
@@ -64,6 +66,23 @@ class ProjectAPIListTests(TestCase):
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["title"], "R")
 
+    def test_list_filter_by_all_technologies(self):
+        react = Technology.objects.create(name="React", slug="react")
+        django = Technology.objects.create(name="Django", slug="django")
+        both = Project.objects.create(
+            title="Both", description="D", status=ProjectStatus.COMPLETED
+        )
+        both.technologies.add(react, django)
+        only_react = Project.objects.create(
+            title="React only", description="D", status=ProjectStatus.COMPLETED
+        )
+        only_react.technologies.add(react)
+        response = self.client.get(
+            self.list_url, {"technologies": "react,django", "technologies_mode": "all"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p["title"] for p in response.data["results"]], ["Both"])
+
     def test_list_pagination(self):
         for i in range(15):
             Project.objects.create(
@@ -79,6 +98,7 @@ class ProjectAPIListTests(TestCase):
 
 class ProjectAPIDetailTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
 
     def test_detail_returns_full_project(self):
@@ -3,11 +3,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
+from .async_views import project_detail, project_list
 from .views import ProjectViewSet
 
 router = DefaultRouter()
 router.register(r"projects", ProjectViewSet, basename="project")
 
 urlpatterns = [
+    path("api/async/projects/", project_list, name="project-async-list"),
+    path("api/async/projects/<slug:slug>/", project_detail, name="project-async-detail"),
     path("api/", include(router.urls)),
 ]
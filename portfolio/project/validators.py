@@ -16,6 +16,9 @@ ARCHITECTURE_ALLOWED_KEYS = {
     "media_handling",  # File uploads, CDN, blob storage, image optimization, etc.
 }
 
+_DOMAIN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9.-]*\.[a-zA-Z]{2,}$")
+_HOST = re.compile(r"^[\w.-]+$")
+
 
 def validate_optional_https_url(value):
     if not value:
@@ -23,11 +26,8 @@ def validate_optional_https_url(value):
     parsed = urlparse(value)
     if parsed.scheme and parsed.scheme not in ("http", "https"):
         raise ValidationError("URL must use HTTP or HTTPS.")
-    if parsed.netloc and not re.match(
-        r"^[a-zA-Z0-9][a-zA-Z0-9.-]*\.[a-zA-Z]{2,}$",
-        parsed.netloc.replace("www.", ""),
-    ):
-        if parsed.netloc != "localhost" and not re.match(r"^[\w.-]+$", parsed.netloc):
+    if parsed.netloc and not _DOMAIN.match(parsed.netloc.replace("www.", "")):
+        if parsed.netloc != "localhost" and not _HOST.match(parsed.netloc):
             raise ValidationError("URL has an invalid host.")
 
 
@@ -1,34 +1,152 @@
 """Read-only API views for Project domain."""
 
+from django.conf import settings
+from django.http import Http404
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
 
+from core.instrumentation import phase
+
+from . import fieldsets, rows
+from .cache import response_cache
+from .conditional import (
+    add_validators,
+    detail_validators,
+    list_validators,
+    not_modified,
+    version_validators,
+)
 from .models import Project
+from .pagination import ProjectKeysetPagination
+from .renderers import ProjectJSONRenderer
 from .serializers import ProjectListSerializer, ProjectDetailSerializer
-from .services import ProjectFilterService
+from .services import ProjectFacetService, ProjectFilterService
 
 
 class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
     lookup_field = "slug"
     lookup_url_kwarg = "slug"
+    page_params = ("page", "pagination", "cursor")
+    renderer_classes = [ProjectJSONRenderer, BrowsableAPIRenderer]
+    not_found_message = "No Project matches the given query."
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and ProjectKeysetPagination.is_requested(self.request):
+            self._paginator = ProjectKeysetPagination()
+        return super().paginator
+
+    def get_filter_params(self):
+        if not hasattr(self, "_filter_params"):
+            self._filter_params = ProjectFilterService.normalize_params(
+                self.request.query_params
+            )
+        return self._filter_params
+
+    def get_selection(self):
+        """Fields and expanded relations from ``?fields=``/``?expand=`` (see fieldsets.py)."""
+        if not hasattr(self, "_selection"):
+            if self.action == "retrieve":
+                self._selection = fieldsets.detail_selection(self.request.query_params)
+            else:
+                self._selection = fieldsets.list_selection(self.request.query_params)
+        return self._selection
 
     def get_queryset(self):
-        status_param = self.request.query_params.getlist("status")
-        tech_param = self.request.query_params.get("technologies", "")
-        technology_slugs = (
-            [s.strip() for s in tech_param.split(",") if s.strip()]
-            if tech_param
-            else None
-        )
-        ordering = self.request.query_params.get(
-            "ordering", ProjectFilterService.DEFAULT_ORDERING
-        )
-        return ProjectFilterService.get_queryset(
-            status=status_param,
-            technology_slugs=technology_slugs,
-            ordering=ordering,
+        if self.action == "retrieve":
+            return fieldsets.trim_detail_queryset(Project.objects.all(), self.get_selection())
+        return fieldsets.trim_list_queryset(
+            ProjectFilterService.get_queryset(**self.get_filter_params()), self.get_selection()
         )
 
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "selection": self.get_selection()}
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return ProjectDetailSerializer
         return ProjectListSerializer
+
+    def list(self, request, *args, **kwargs):
+        params = {
+            **self.get_filter_params(),
+            **self.get_selection().as_params(),
+            "page": {p: request.query_params.get(p) for p in self.page_params},
+        }
+        if isinstance(self.paginator, ProjectKeysetPagination):
+            # Keyset pages never scan the whole filtered set; neither should their validators.
+            etag, last_modified = version_validators(params)
+        else:
+            etag, last_modified = list_validators(self.get_queryset(), params)
+        view = self.render_list if self.fast_serialization else super().list
+        return self.conditional_response(
+            etag, last_modified, lambda: self.cached_response("list", params, view, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        selection = self.get_selection().as_params()
+        params = {"slug": kwargs[self.lookup_url_kwarg], **selection}
+        etag, last_modified = detail_validators(params["slug"], selection)
+        view = self.render_detail if self.fast_serialization else super().retrieve
+        return self.conditional_response(
+            etag, last_modified, lambda: self.cached_response("detail", params, view, *args, **kwargs)
+        )
+
+    @property
+    def fast_serialization(self):
+        return getattr(settings, "PROJECT_API_FAST_SERIALIZATION", True)
+
+    def render_list(self, request, *args, **kwargs):
+        """``list()`` serialized from ``.values()`` rows (see ``rows.py``)."""
+        selection = self.get_selection()
+        queryset = rows.list_values(self.filter_queryset(self.get_queryset()), selection)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(rows.list_data(list(queryset), request, selection))
+        return self.get_paginated_response(rows.list_data(page, request, selection))
+
+    def render_detail(self, request, *args, **kwargs):
+        """``retrieve()`` serialized from ``.values()`` rows (see ``rows.py``)."""
+        slug = kwargs[self.lookup_url_kwarg]
+        data = rows.detail_data(Project.objects.filter(slug=slug), request, self.get_selection())
+        if not data:
+            raise Http404(self.not_found_message)
+        return Response(data[0])
+
+    @action(detail=False)
+    def facets(self, request):
+        """Project counts per status and technology for the current filters."""
+        params = self.get_filter_params()
+        etag, _ = version_validators({"facets": params})
+        return self.conditional_response(
+            etag, None, lambda: self.cached_response("facets", params, self.render_facets)
+        )
+
+    def render_facets(self, request):
+        return Response(ProjectFacetService.get_counts(**self.get_filter_params()))
+
+    def conditional_response(self, etag, last_modified, render):
+        """Answer ``If-None-Match``/``If-Modified-Since`` with 304 before calling ``render``."""
+        response = not_modified(self.request, etag, last_modified)
+        if response is None:
+            response = render()
+        return add_validators(response, etag, last_modified)
+
+    def cached_response(self, kind, params, view, *args, **kwargs):
+        if not response_cache.enabled:
+            with phase("serialize"):
+                return view(self.request, *args, **kwargs)
+        with phase("cache"):
+            key = response_cache.make_key(kind, params, self.request)
+            data = response_cache.get(key)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+        with phase("serialize"):
+            response = view(self.request, *args, **kwargs)
+        if response.status_code == 200:
+            with phase("cache"):
+                response_cache.set(key, response.data)
+        response["X-Cache"] = "MISS"
+        return response